@@ -0,0 +1,322 @@
+#!/usr/bin/env python
+import os
+import re
+import sys
+import time
+import array
+import warnings
+import threading
+import subprocess
+try:
+    with warnings.catch_warnings():
+        warnings.simplefilter('ignore', DeprecationWarning)
+        import audioop
+except ImportError:
+    audioop = None
+
+RATE = 44100
+CHANNELS = 2
+SAMPLEWIDTH = 2
+FRAMESIZE = CHANNELS * SAMPLEWIDTH
+BYTERATE = RATE * FRAMESIZE
+FORMAT = 's16le' if sys.byteorder == 'little' else 's16be'
+CHUNK = 0.01
+LEAD = 0.04
+SPOOLSIZE = 65536
+# Decoded audio kept per track: up to AHEAD seconds past the playback cursor, the rest of WINDOW behind it for seeking back.
+WINDOW = 30
+AHEAD = 10
+RINGSIZE = WINDOW * BYTERATE
+AHEADSIZE = AHEAD * BYTERATE
+# Seeking further ahead than this past the decoded audio restarts the decoder at the target instead of waiting.
+SEEKAHEAD = 30
+# Newer ffplay spells the channel layout option differently from older ffplay/avplay.
+CHANNELOPTIONS = (['-ch_layout', 'stereo'], ['-channels', str(CHANNELS)])
+DURATIONLINE = re.compile(r'Duration: (\d+):(\d+):(\d+(?:\.\d+)?)')
+
+
+class SinkNotFound(Exception):
+    pass
+
+
+def linear(decibels):
+    return 10 ** (decibels / 20)
+
+
+def scale(data, gain):
+    if gain == 1.0:
+        return data
+    if gain <= 0:
+        return bytes(len(data))
+    if audioop:
+        return audioop.mul(data, SAMPLEWIDTH, gain)
+    samples = array.array('h', data)
+    if gain < 1.0:
+        return array.array('h', [int(sample * gain) for sample in samples]).tobytes()
+    return array.array('h', [max(-32768, min(32767, int(sample * gain))) for sample in samples]).tobytes()
+
+
+class Sink:
+    def __init__(self, player):
+        self.player = player
+        self.process = None
+        self.closed = False
+        self.open()
+
+
+    def open(self):
+        for channels in CHANNELOPTIONS:
+            command = [self.player, '-nodisp', '-hide_banner', '-loglevel', 'quiet', '-fflags', 'nobuffer', '-probesize', '32', '-analyzeduration', '0',
+                       '-f', FORMAT, '-sample_rate', str(RATE)] + channels + ['-i', 'pipe:0']
+            process = subprocess.Popen(command, stdin=subprocess.PIPE, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+            try:
+                process.wait(timeout=0.1)
+            except subprocess.TimeoutExpired:
+                self.process = process
+                return
+        raise SinkNotFound
+
+
+    def write(self, data):
+        process = self.process
+        if self.closed or not process:
+            return
+        try:
+            process.stdin.write(data)
+            process.stdin.flush()
+        except (BrokenPipeError, ValueError):
+            if not self.closed:
+                self.__terminate()
+                self.open()
+
+
+    def close(self):
+        self.closed = True
+        self.__terminate()
+
+
+    def __terminate(self):
+        process = self.process
+        self.process = None
+        if process:
+            try:
+                process.stdin.close()
+            except (BrokenPipeError, ValueError):
+                pass
+            if process.poll() is None:
+                process.terminate()
+            process.wait()
+
+
+class FileSink:
+    # Takes the place of Sink without a sound card; audio is still paced in real time by Output.
+    def __init__(self, filename=os.devnull):
+        self.file = open(filename, 'wb')
+
+
+    def write(self, data):
+        try:
+            self.file.write(data)
+        except ValueError:
+            pass
+
+
+    def close(self):
+        self.file.close()
+
+
+class Track:
+    def __init__(self, decoder, filename, offset=0):
+        self.filename = filename
+        self.offset = offset
+        self.decoded = 0
+        self.gain = 1.0
+        self.duration = None
+        self.probed = threading.Event()
+        self.complete = False
+        self.closed = False
+        self.condition = threading.Condition()
+        self.reading = 0
+        self.ring = bytearray(RINGSIZE)
+        command = [decoder, '-v', 'info', '-nostats', '-nostdin', '-ss', str(offset), '-i', filename, '-f', FORMAT, '-ar', str(RATE), '-ac', str(CHANNELS), 'pipe:1']
+        self.process = subprocess.Popen(command, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
+        self.thread = threading.Thread(target=self.__fill)
+        self.thread.daemon = True
+        self.thread.start()
+        self.probethread = threading.Thread(target=self.__probe)
+        self.probethread.daemon = True
+        self.probethread.start()
+
+
+    def __fill(self):
+        for data in iter(lambda: self.process.stdout.read1(SPOOLSIZE), b''):
+            with self.condition:
+                # The decoder stalls on its pipe while it is AHEAD seconds past the reader, which also paces it.
+                while not self.closed and self.decoded - self.reading > AHEADSIZE:
+                    self.condition.wait()
+                if self.closed:
+                    break
+                start = self.decoded % RINGSIZE
+                first = min(len(data), RINGSIZE - start)
+                ring = memoryview(self.ring)
+                ring[start:start + first] = data[:first]
+                ring[:len(data) - first] = data[first:]
+                self.decoded += len(data)
+                self.condition.notify_all()
+        with self.condition:
+            self.complete = True
+            self.condition.notify_all()
+
+
+    def __probe(self):
+        # The decoder reports the input duration before any audio, so no separate prober is needed.
+        for line in self.process.stderr:
+            duration = DURATIONLINE.search(line.decode('utf-8', 'replace'))
+            if duration:
+                hours, minutes, seconds = duration.groups()
+                self.duration = int(hours) * 3600 + int(minutes) * 60 + float(seconds)
+                break
+        self.probed.set()
+        # The rest is only drained, in chunks, so the decoder never blocks on a full pipe.
+        for data in iter(lambda: self.process.stderr.read1(SPOOLSIZE), b''):
+            pass
+
+
+    def probedDuration(self, timeout=None):
+        self.probed.wait(timeout)
+        return self.duration
+
+
+    def covers(self, seconds):
+        if seconds < self.offset or self.cursorAt(seconds) < self.decoded - RINGSIZE:
+            return False
+        if self.complete:
+            return seconds <= self.offset + self.decoded / BYTERATE
+        return seconds <= self.offset + self.decoded / BYTERATE + SEEKAHEAD
+
+
+    def cursorAt(self, seconds):
+        return int((seconds - self.offset) * RATE) * FRAMESIZE
+
+
+    def read(self, cursor, size, interrupted):
+        with self.condition:
+            if cursor != self.reading:
+                self.reading = cursor
+                self.condition.notify_all()
+            while self.decoded < cursor + size and not self.complete and not interrupted.is_set():
+                self.condition.wait(0.05)
+            if self.closed or cursor >= self.decoded or cursor < self.decoded - RINGSIZE:
+                return b''
+            size = min(size, self.decoded - cursor)
+            start = cursor % RINGSIZE
+            first = min(size, RINGSIZE - start)
+            return bytes(self.ring[start:start + first]) + bytes(self.ring[:size - first])
+
+
+    def close(self):
+        with self.condition:
+            self.closed = True
+            self.condition.notify_all()
+        if self.process.poll() is None:
+            self.process.terminate()
+        self.process.wait()
+        self.thread.join()
+        self.probethread.join()
+        self.process.stdout.close()
+        self.process.stderr.close()
+        with self.condition:
+            self.ring = bytearray()
+
+
+class Output:
+    def __init__(self, sink, chunk=CHUNK, lead=LEAD, gapless=False):
+        self.sink = sink
+        self.gapless = gapless
+        self.tail = None
+        self.chunksize = int(RATE * chunk) * FRAMESIZE
+        self.lead = lead
+        self.gain = 1.0
+        self.track = None
+        self.cursor = 0
+        self.seekto = None
+        self.seeklock = threading.Lock()
+        self.started = None
+        self.written = 0
+        self.interrupted = threading.Event()
+        # Called once per song when its decoder has finished, i.e. within AHEAD seconds of its end.
+        self.nearend = None
+        self.neared = False
+
+
+    def setVolume(self, level):
+        self.gain = level / 100
+
+
+    def reset(self, track, seconds):
+        if self.tail and time.monotonic() - self.tail[0] > self.lead:
+            self.tail = None
+        self.track = track
+        self.cursor = track.cursorAt(seconds)
+        self.started = None
+        self.written = 0
+        self.seekto = None
+        self.neared = False
+        self.interrupted.clear()
+
+
+    def interrupt(self):
+        self.interrupted.set()
+
+
+    def seek(self, seconds):
+        if self.track:
+            with self.seeklock:
+                self.seekto = self.track.cursorAt(seconds)
+
+
+    def position(self):
+        track = self.track
+        if not track:
+            return 0.0
+        cursor = self.cursor if self.seekto is None else self.seekto
+        inflight = 0.0
+        if self.started is not None:
+            inflight = min(max(self.written / BYTERATE - (time.monotonic() - self.started), 0.0), self.lead)
+        return max(track.offset, track.offset + cursor / BYTERATE - inflight)
+
+
+    def play(self):
+        track = self.track
+        self.started = time.monotonic()
+        if self.tail:
+            # Pace behind the previous song's audio that is still queued in the sink.
+            ended, remaining = self.tail
+            self.started += max(remaining - (self.started - ended), 0.0)
+            self.tail = None
+        while True:
+            with self.seeklock:
+                if self.seekto is not None:
+                    self.cursor, self.seekto = self.seekto, None
+            data = track.read(self.cursor, self.chunksize, self.interrupted)
+            if self.interrupted.is_set():
+                return False
+            if track.complete and self.nearend and not self.neared:
+                self.neared = True
+                self.nearend()
+            if len(data) < FRAMESIZE:
+                break
+            data = data[:len(data) - len(data) % FRAMESIZE]
+            ahead = self.written / BYTERATE - (time.monotonic() - self.started)
+            if ahead < 0:
+                self.started = time.monotonic() - self.written / BYTERATE
+            elif ahead > self.lead and self.interrupted.wait(ahead - self.lead):
+                return False
+            self.sink.write(scale(data, self.gain * track.gain))
+            self.written += len(data)
+            self.cursor += len(data)
+        remaining = self.written / BYTERATE - (time.monotonic() - self.started)
+        if self.gapless:
+            self.tail = (time.monotonic(), remaining)
+            return True
+        return not (remaining > 0 and self.interrupted.wait(remaining))
@@ -0,0 +1,202 @@
+#!/usr/bin/env python
+import abc
+import time
+import subprocess
+import threading
+import audio
+from instrumentation import METRICS
+
+SUBPROCESS = 'subprocess'
+PCM = 'pcm'
+# Seconds to wait for the decoder to report a duration before the prober is asked instead.
+PROBEWAIT = 1.0
+# A song that stops more than this many seconds (or a tenth of its length) short of its duration failed to play.
+EARLYSLACK = 2.0
+
+
+class Backend(abc.ABC):
+    # Player calls every method but play() with its lock held; play() blocks until the song ends or interrupt() is called,
+    # and returns False if the song failed to play through.
+    live = False
+    loudness = None
+
+    def gain(self, filename):
+        if self.loudness:
+            return self.loudness.gain(filename)
+        return None
+
+
+    def early(self, played, remaining):
+        if remaining is None:
+            return False
+        return played + max(EARLYSLACK, remaining / 10) < remaining
+
+
+    @abc.abstractmethod
+    def start(self, filename, offset, volume, nextfilename=None):
+        pass
+
+
+    @abc.abstractmethod
+    def play(self, remaining):
+        pass
+
+
+    def interrupt(self):
+        pass
+
+
+    def finish(self):
+        pass
+
+
+    def setVolume(self, level):
+        return False
+
+
+    def seek(self, filename, seconds):
+        return False
+
+
+    def position(self):
+        return None
+
+
+    def duration(self, filename):
+        return None
+
+
+    def close(self):
+        self.interrupt()
+
+
+class SubprocessBackend(Backend):
+    # One ffplay/avplay per song; seeking and volume changes restart it.
+    def __init__(self, player):
+        self.player = player
+        self.process = None
+        self.started = None
+
+
+    def start(self, filename, offset, volume, nextfilename=None):
+        command = [self.player, '-nodisp', '-autoexit', '-hide_banner', '-ss', str(offset), '-volume', str(volume)]
+        gain = self.gain(filename)
+        if gain:
+            command += ['-af', f'volume={gain:.2f}dB']
+        command.append(filename)
+        with METRICS.timer('play.spawn'):
+            self.process = subprocess.Popen(command, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+        self.started = time.monotonic()
+
+
+    def play(self, remaining):
+        process = self.process
+        try:
+            process.wait(timeout=None if remaining is None else remaining + 1)
+        except subprocess.TimeoutExpired:
+            process.terminate()
+            process.wait()
+            return True
+        return process.returncode == 0 and not self.early(time.monotonic() - self.started, remaining)
+
+
+    def interrupt(self):
+        process = self.process
+        if process and process.poll() is None:
+            process.terminate()
+
+
+class PCMBackend(Backend):
+    # Decoded PCM goes to one persistent sink. The next song starts decoding near the end of the current one,
+    # so playback moving on to it starts no process at the transition.
+    live = True
+
+    def __init__(self, decoder, sink, gapless=False):
+        self.decoder = decoder
+        self.sink = sink
+        self.output = audio.Output(sink, gapless=gapless)
+        self.output.nearend = self.__preload
+        self.lock = threading.Lock()
+        self.track = None
+        self.nexttrack = None
+        self.upcoming = None
+        self.offset = 0
+
+
+    def start(self, filename, offset, volume, nextfilename=None):
+        if self.track and (self.track.filename != filename or not self.track.covers(offset)):
+            self.track.close()
+            self.track = None
+        with self.lock:
+            if not self.track and self.nexttrack and self.nexttrack.filename == filename and self.nexttrack.covers(offset):
+                self.track, self.nexttrack = self.nexttrack, None
+            if self.nexttrack and self.nexttrack.filename != nextfilename:
+                self.nexttrack.close()
+                self.nexttrack = None
+            self.upcoming = nextfilename if nextfilename != filename else None
+        if not self.track:
+            with METRICS.timer('decode.spawn'):
+                self.track = audio.Track(self.decoder, filename, offset)
+        self.track.gain = audio.linear(self.gain(filename) or 0.0)
+        self.output.setVolume(volume)
+        self.output.reset(self.track, offset)
+        self.offset = offset
+
+
+    def __preload(self):
+        with self.lock:
+            if self.upcoming and not self.nexttrack:
+                self.nexttrack = audio.Track(self.decoder, self.upcoming)
+
+
+    def play(self, remaining=None):
+        if not self.output.play():
+            return False
+        # A decoder that yields no audio, or stops short, is a failure rather than the end of the song.
+        reached = self.output.track.offset + self.output.cursor / audio.BYTERATE
+        return self.output.written > 0 and not self.early(reached - self.offset, remaining)
+
+
+    def interrupt(self):
+        self.output.interrupt()
+
+
+    def finish(self):
+        if self.track:
+            self.track.close()
+            self.track = None
+
+
+    def setVolume(self, level):
+        self.output.setVolume(level)
+        return True
+
+
+    def seek(self, filename, seconds):
+        if self.track and self.track.filename == filename and self.track.covers(seconds):
+            self.output.seek(seconds)
+            return True
+        return False
+
+
+    def position(self):
+        return self.output.position()
+
+
+    def duration(self, filename):
+        for track in (self.track, self.nexttrack):
+            if track and track.filename == filename:
+                return track.probedDuration(PROBEWAIT)
+        return None
+
+
+    def close(self):
+        self.interrupt()
+        self.sink.close()
+        with self.lock:
+            for track in (self.track, self.nexttrack):
+                if track:
+                    track.close()
+            self.track = None
+            self.nexttrack = None
+            self.upcoming = None
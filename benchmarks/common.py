@@ -0,0 +1,48 @@
+#!/usr/bin/env python
+import os
+import sys
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import musicformat
+
+# File name template: (header, format musicformat reports). Every recognized format (both mp3 and both aac
+# flavours) plus files the scanner skips by extension or rejects by header.
+SAMPLES = {
+    '{}.mp3': (b'ID3\x03\x00\x00\x00\x00\x00\x00', 'mp3'),
+    '{}-sync.mp3': (b'\xff\xfb\x90\x00', 'mp3'),
+    '{}.m4a': (b'\x00\x00\x00\x20ftypM4A \x00\x00\x00\x00', 'aac'),
+    '{}.aac': (b'\xff\xf1\x50\x80', 'aac'),
+    '{}.ogg': (b'OggS\x00\x02' + b'\x00' * 22 + b'\x01vorbis', 'ogg'),
+    '{}.opus': (b'OggS\x00\x02' + b'\x00' * 22 + b'OpusHead', 'opus'),
+    '{}.flac': (b'fLaC\x00\x00\x00\x22', 'flac'),
+    '{}.wav': (b'RIFF\x24\x00\x00\x00WAVEfmt ', 'wav'),
+    '{}.aiff': (b'FORM\x00\x00\x00\x24AIFFCOMM', 'aiff'),
+    '{}.ape': (b'MAC \x96\x0f\x00\x00', 'ape'),
+    '{}.wv': (b'wvpk\x00\x00\x00\x00', 'wv'),
+    '{}.bin': (b'not a music file at all', None),
+    'cover{}.jpg': (b'\xff\xd8\xff\xe0', None),
+    'rip{}.log': (b'EAC extraction', None),
+    'album{}.cue': (b'FILE "x" WAVE', None),
+    'info{}.nfo': (b'nfo', None),
+}
+
+
+def makeTree(directory, count, album):
+    # Fills artist/album directories with the album's SAMPLES names in turn until count files exist.
+    made = 0
+    albums = 0
+    while made < count:
+        albumdir = os.path.join(directory, f'artist{albums // 10}', f'album{albums}')
+        os.makedirs(albumdir)
+        for name in album:
+            if made >= count:
+                break
+            with open(os.path.join(albumdir, name.format(made)), 'wb') as musicfile:
+                musicfile.write(SAMPLES[name][0] + b'\x00' * 64)
+            made += 1
+        albums += 1
+    return directory
+
+
+def checkHeaders():
+    for name, (header, form) in SAMPLES.items():
+        assert musicformat.musicFormat(header.ljust(musicformat.HEADERSIZE, b'\x00')) == form, name
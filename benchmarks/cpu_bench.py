@@ -0,0 +1,85 @@
+#!/usr/bin/env python
+import io
+import os
+import sys
+import time
+import signal
+import tarfile
+import tempfile
+import subprocess
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+FFPLAY = """#!/bin/sh
+exec sleep 600
+"""
+
+FFPROBE = """#!/bin/sh
+echo '{"format": {"duration": "600.000000"}}'
+"""
+
+
+def makeFakeBinaries(directory):
+    bindir = os.path.join(directory, 'bin')
+    os.makedirs(bindir)
+    for name, script in (('ffplay', FFPLAY), ('ffprobe', FFPROBE)):
+        path = os.path.join(bindir, name)
+        with open(path, 'w') as binary:
+            binary.write(script)
+        os.chmod(path, 0o755)
+    return bindir
+
+
+def makeMusic(directory, count=10):
+    music = os.path.join(directory, 'Music')
+    os.makedirs(music)
+    for index in range(count):
+        with open(os.path.join(music, f'{index}.mp3'), 'wb') as song:
+            song.write(b'ID3\x03\x00\x00\x00\x00\x00\x00' + b'\x00' * 64)
+    return music
+
+
+def exportRevision(revision, directory):
+    archive = subprocess.run(['git', '-C', ROOT, 'archive', revision], stdout=subprocess.PIPE, check=True).stdout
+    tree = os.path.join(directory, 'tree')
+    with tarfile.open(fileobj=io.BytesIO(archive)) as tar:
+        tar.extractall(tree)
+    return tree
+
+
+def measure(tree, seconds):
+    with tempfile.TemporaryDirectory() as directory:
+        bindir = makeFakeBinaries(directory)
+        music = makeMusic(directory)
+        environment = dict(os.environ, PATH=f'{bindir}{os.pathsep}{os.environ["PATH"]}', HOME=directory, XDG_CACHE_HOME=os.path.join(directory, 'cache'))
+        process = subprocess.Popen([sys.executable, os.path.join(tree, 'pycli_music.py'), music], cwd=tree, env=environment,
+                                   stdin=subprocess.PIPE, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+        time.sleep(seconds)
+        process.send_signal(signal.SIGINT)
+        process.stdin.close()
+        deadline = time.monotonic() + 10
+        pid, status, usage = os.wait4(process.pid, os.WNOHANG)
+        while not pid:
+            if time.monotonic() > deadline:
+                process.kill()
+                pid, status, usage = os.wait4(process.pid, 0)
+            else:
+                time.sleep(0.05)
+                pid, status, usage = os.wait4(process.pid, os.WNOHANG)
+        process.returncode = status
+        return usage.ru_utime + usage.ru_stime
+
+
+def main(seconds=10.0, baseline=None):
+    results = list()
+    if baseline:
+        with tempfile.TemporaryDirectory() as directory:
+            results.append((f'baseline {baseline}', measure(exportRevision(baseline, directory), seconds)))
+    results.append(('working tree', measure(ROOT, seconds)))
+    for name, cputime in results:
+        print(f'{name:24} {cputime:8.3f}s CPU in {seconds:.0f}s  {cputime * 60 / seconds:8.3f}s CPU per minute of playback')
+
+
+if __name__ == '__main__':
+    arguments = sys.argv[1:]
+    main(float(arguments[0]) if arguments else 10.0, arguments[1] if len(arguments) > 1 else None)
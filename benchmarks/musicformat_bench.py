@@ -0,0 +1,79 @@
+#!/usr/bin/env python
+import os
+import sys
+import time
+import tempfile
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import musicformat
+from common import SAMPLES
+
+# Only formats the legacy classifier knows, so both implementations must agree.
+HEADERS = {extension: SAMPLES[name][0] for extension, name in
+           (('mp3', '{}.mp3'), ('aac', '{}.m4a'), ('ogg', '{}.ogg'), ('flac', '{}.flac'), ('wav', '{}.wav'), ('txt', '{}.bin'))}
+
+
+def legacyMusicFormatHex(filename):
+    return legacyClassify(str(open(filename, "rb").read(32).hex()))
+
+
+def legacyClassify(item):
+    if item[8:].startswith('667479704d344120') or item[8:].startswith('6674797069736f6d'):
+        return 'aac'
+    elif item.startswith('4f676753'):
+        return 'ogg'
+    elif item.startswith('494433'):
+        return 'mp3'
+    elif item.startswith('664c6143'):
+        return 'flac'
+    elif item.startswith('52494646') and item[16:].startswith('57415645'):
+        return 'wav'
+    else:
+        return None
+
+
+def makeFiles(directory, count):
+    files = list()
+    for index in range(count):
+        name, header = list(HEADERS.items())[index % len(HEADERS)]
+        path = os.path.join(directory, f'{index}.{name}')
+        with open(path, 'wb') as musicfile:
+            musicfile.write(header + b'\x00' * 64)
+        files.append(path)
+    return files
+
+
+def best(function, files, rounds):
+    timings = list()
+    for _ in range(rounds):
+        timer = time.perf_counter()
+        function(files)
+        timings.append(time.perf_counter() - timer)
+    return min(timings)
+
+
+def main(count=20000, rounds=5):
+    with tempfile.TemporaryDirectory() as directory:
+        files = makeFiles(directory, count)
+        assert [legacyMusicFormatHex(f) for f in files] == musicformat.musicFormats(files)
+        results = {
+            'legacy musicFormatHex': best(lambda files: [legacyMusicFormatHex(f) for f in files], files, rounds),
+            'musicFormatHex': best(lambda files: [musicformat.musicFormatHex(f) for f in files], files, rounds),
+            'musicFormats': best(musicformat.musicFormats, files, rounds),
+        }
+        headers = [header.ljust(musicformat.HEADERSIZE, b'\x00') for header in HEADERS.values()] * (count // len(HEADERS))
+        classified = {
+            'legacy hex + startswith (classify only)': best(lambda headers: [legacyClassify(header.hex()) for header in headers], headers, rounds),
+            'musicFormat (classify only)': best(lambda headers: [musicformat.musicFormat(header) for header in headers], headers, rounds),
+        }
+    report(results, count)
+    report(classified, len(headers))
+
+
+def report(results, count):
+    baseline = list(results.values())[0]
+    for name, elapsed in results.items():
+        print(f'{name:42} {elapsed * 1000:9.2f} ms  {count / elapsed:12.0f} files/sec  {baseline / elapsed:6.2f}x')
+
+
+if __name__ == '__main__':
+    main(*[int(arg) for arg in sys.argv[1:]])
@@ -0,0 +1,56 @@
+#!/usr/bin/env python
+import os
+import sys
+import time
+import random
+import tracemalloc
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import playlist
+
+
+def makePaths(count, root='/home/user/Music'):
+    for index in range(count):
+        album = index // 12
+        yield f'{root}/Artist {album // 8:05d}/Album {album:06d}/{index % 12 + 1:02d} - Some Track Title {index}.flac'
+
+
+def listPlaylist(count):
+    songs = list(makePaths(count))
+    nextsongs = songs.copy()
+    random.shuffle(songs)
+    random.shuffle(nextsongs)
+    return songs, nextsongs
+
+
+def compactPlaylist(count):
+    songs = playlist.Playlist(makePaths(count))
+    nextsongs = songs.copy()
+    songs.shuffle()
+    nextsongs.shuffle()
+    return songs, nextsongs
+
+
+def measure(function, count):
+    tracemalloc.start()
+    timer = time.perf_counter()
+    songs, nextsongs = function(count)
+    elapsed = time.perf_counter() - timer
+    current, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    timer = time.perf_counter()
+    for index in range(0, len(songs), max(1, len(songs) // 10000)):
+        songs[index]
+    lookups = (time.perf_counter() - timer) / min(len(songs), 10000)
+    return current, peak, elapsed, lookups
+
+
+def main(count=500000):
+    print(f'{count} tracks, songs + nextsongs')
+    print(f'{"implementation":16} {"retained MiB":>13} {"peak MiB":>9} {"build s":>8} {"lookup us":>10}')
+    for name, function in (('list of str', listPlaylist), ('Playlist', compactPlaylist)):
+        current, peak, elapsed, lookups = measure(function, count)
+        print(f'{name:16} {current / 2 ** 20:13.1f} {peak / 2 ** 20:9.1f} {elapsed:8.2f} {lookups * 1e6:10.2f}')
+
+
+if __name__ == '__main__':
+    main(*[int(arg) for arg in sys.argv[1:]])
@@ -0,0 +1,78 @@
+#!/usr/bin/env python
+import os
+import sys
+import time
+os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from PyQt5 import QtWidgets
+import playlist
+import playlistmodel
+from playlist_bench import makePaths
+
+
+class Songs:
+    # The two Player methods the views read, over a real Playlist.
+    def __init__(self, count):
+        self.songs = playlist.Playlist(makePaths(count))
+
+
+    def getPlaylistLength(self):
+        return len(self.songs)
+
+
+    def getSongAt(self, index):
+        return f'{index}: {self.songs.basename(index)}'
+
+
+def residentMemory():
+    with open('/proc/self/statm') as statm:
+        return int(statm.read().split()[1]) * os.sysconf('SC_PAGE_SIZE')
+
+
+def listWidget(app, songs):
+    view = QtWidgets.QListWidget()
+    for index in range(songs.getPlaylistLength()):
+        view.addItem(songs.getSongAt(index))
+    return view
+
+
+def listView(app, songs):
+    view = QtWidgets.QListView()
+    view.setUniformItemSizes(True)
+    view.setModel(playlistmodel.PlaylistModel(songs, view))
+    return view
+
+
+def measure(app, function, songs):
+    memory = residentMemory()
+    timer = time.perf_counter()
+    view = function(app, songs)
+    view.resize(400, 600)
+    view.show()
+    app.processEvents()
+    elapsed = time.perf_counter() - timer
+    timer = time.perf_counter()
+    view.scrollToBottom()
+    app.processEvents()
+    scrolled = time.perf_counter() - timer
+    grown = residentMemory() - memory
+    view.close()
+    view.deleteLater()
+    app.processEvents()
+    return elapsed, scrolled, grown
+
+
+def main(count=100000):
+    app = QtWidgets.QApplication(sys.argv[:1])
+    songs = Songs(count)
+    # The first window pays for platform and font setup; keep that out of both measurements.
+    measure(app, listView, Songs(1))
+    print(f'{count} rows')
+    print(f'{"view":12} {"populate s":>11} {"scroll s":>9} {"RSS MiB":>8}')
+    for name, function in (('QListView', listView), ('QListWidget', listWidget)):
+        elapsed, scrolled, grown = measure(app, function, songs)
+        print(f'{name:12} {elapsed:11.3f} {scrolled:9.3f} {grown / 2 ** 20:8.1f}')
+
+
+if __name__ == '__main__':
+    main(*[int(arg) for arg in sys.argv[1:]])
@@ -0,0 +1,62 @@
+#!/usr/bin/env python
+import os
+import sys
+import time
+import tempfile
+import tracemalloc
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import musicformat
+import scanner
+from common import makeTree
+
+# Per album directory: songs plus the usual cover art, rip log, cue sheet and nfo.
+ALBUM = ['{}.mp3', '{}.flac'] * 4 + ['cover{}.jpg', 'rip{}.log', 'album{}.cue', 'info{}.nfo']
+
+
+def legacyLoadPlaylist(music):
+    songs = list()
+    for root, dirs, files in os.walk(music):
+        for name in files:
+            songs.append(os.path.join(root, name))
+    for song in songs:
+        try:
+            form = musicformat.musicFormatHex(song)
+            if form is None:
+                songs.remove(song)
+        except FileNotFoundError:
+            songs.remove(song)
+    return songs
+
+
+def timed(function, *args):
+    timer = time.perf_counter()
+    result = function(*args)
+    return time.perf_counter() - timer, result
+
+
+def peak(function, *args):
+    tracemalloc.start()
+    function(*args)
+    _, peakmemory = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return peakmemory
+
+
+def main(sizes=(1000, 10000, 100000), legacylimit=10000):
+    print(f'{"files":>8} {"implementation":16} {"seconds":>9} {"files/sec":>11} {"songs":>8} {"peak KiB":>9}')
+    for size in sizes:
+        with tempfile.TemporaryDirectory() as directory:
+            makeTree(directory, size, ALBUM)
+            current = scanner.Scanner()
+            elapsed, songs = timed(current.scan, directory)
+            print(f'{size:8} {"Scanner.scan":16} {elapsed:9.3f} {size / elapsed:11.0f} {len(songs):8} {peak(current.scan, directory) / 1024:9.0f}')
+            if size <= legacylimit:
+                elapsed, songs = timed(legacyLoadPlaylist, directory)
+                print(f'{size:8} {"legacy":16} {elapsed:9.3f} {size / elapsed:11.0f} {len(songs):8} {peak(legacyLoadPlaylist, directory) / 1024:9.0f}')
+
+
+if __name__ == '__main__':
+    if len(sys.argv) > 1:
+        main([int(arg) for arg in sys.argv[1:]])
+    else:
+        main()
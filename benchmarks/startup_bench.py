@@ -0,0 +1,100 @@
+#!/usr/bin/env python
+import os
+import sys
+import time
+import signal
+import statistics
+import subprocess
+import tempfile
+from cpu_bench import ROOT, makeFakeBinaries, makeMusic
+
+# Seconds; a run over any of these exits non-zero.
+BUDGETS = {
+    'import pycli_music': 0.040,
+    'import GUI modules': 0.060,
+    'CLI first song': 0.150,
+    'GUI window shown': 0.150,
+    'GUI player ready': 0.250,
+}
+
+GUIHARNESS = """
+import sys, runpy
+sys.argv = [sys.argv[1]]
+namespace = runpy.run_path(sys.argv[0], run_name='startup')
+from PyQt5 import QtCore, QtWidgets
+app = QtWidgets.QApplication(sys.argv)
+form = namespace['MusicGUI']()
+def ready(player):
+    print('ready', flush=True)
+    player.end()
+    app.quit()
+form.playerReady.connect(ready)
+form.playerFailed.connect(lambda message: app.quit())
+# The same order as pyqt-music.pyw: the window counts as shown once the event loop is past startPlayer.
+form.show()
+QtCore.QTimer.singleShot(0, form.startPlayer)
+QtCore.QTimer.singleShot(0, lambda: print('shown', flush=True))
+app.exec_()
+"""
+
+
+def importTime(statement, modules):
+    output = subprocess.run([sys.executable, '-X', 'importtime', '-c', statement], cwd=ROOT, stderr=subprocess.PIPE, stdout=subprocess.DEVNULL, text=True).stderr
+    total = 0
+    for line in output.splitlines():
+        if line.startswith('import time:') and line.split('|')[-1].strip() in modules:
+            total += int(line.split('|')[1])
+    return total / 1e6
+
+
+def timeToLines(command, environment, markers):
+    # Wall time from spawning the process until each marker first appears on stdout.
+    timer = time.perf_counter()
+    process = subprocess.Popen(command, cwd=ROOT, env=environment, stdin=subprocess.DEVNULL, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, text=True)
+    times = dict()
+    for line in process.stdout:
+        for marker in markers:
+            if marker not in times and line.startswith(marker):
+                times[marker] = time.perf_counter() - timer
+        if len(times) == len(markers):
+            break
+    # Interrupted like a user would, so the player stops its own ffplay; killing it outright would orphan that.
+    process.send_signal(signal.SIGINT)
+    try:
+        process.communicate(timeout=10)
+    except subprocess.TimeoutExpired:
+        process.kill()
+        process.communicate()
+    return [times.get(marker) for marker in markers]
+
+
+def main(runs=5):
+    results = {name: list() for name in BUDGETS}
+    with tempfile.TemporaryDirectory() as directory:
+        bindir = makeFakeBinaries(directory)
+        music = makeMusic(directory)
+        environment = dict(os.environ, PATH=f'{bindir}{os.pathsep}{os.environ["PATH"]}', HOME=directory, XDG_CACHE_HOME=os.path.join(directory, 'cache'),
+                           QT_QPA_PLATFORM='offscreen', PYTHONDONTWRITEBYTECODE='')
+        subprocess.run([sys.executable, '-m', 'compileall', '-q', ROOT], stdout=subprocess.DEVNULL)
+        for run in range(runs):
+            results['import pycli_music'].append(importTime('import pycli_music', ('pycli_music',)))
+            results['import GUI modules'].append(importTime('import design', ('design',)))
+            results['CLI first song'].extend(timeToLines([sys.executable, 'pycli_music.py', '--no-console', music], environment, ('Playing song',)))
+            shown, ready = timeToLines([sys.executable, '-c', GUIHARNESS, os.path.join(ROOT, 'pyqt-music.pyw')], environment, ('shown', 'ready'))
+            results['GUI window shown'].append(shown)
+            results['GUI player ready'].append(ready)
+    failed = False
+    print(f'{"startup":20} {"median s":>9} {"max s":>7} {"budget s":>9}')
+    for name, budget in BUDGETS.items():
+        times = [value for value in results[name] if value is not None]
+        if not times:
+            print(f'{name:20} {"n/a":>9}')
+            continue
+        median = statistics.median(times)
+        failed = failed or median > budget
+        print(f'{name:20} {median:9.3f} {max(times):7.3f} {budget:9.3f}{"  OVER BUDGET" if median > budget else ""}')
+    return 1 if failed else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main(*[int(arg) for arg in sys.argv[1:]]))
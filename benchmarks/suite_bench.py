@@ -0,0 +1,170 @@
+#!/usr/bin/env python
+import os
+import sys
+import json
+import time
+import platform
+import tempfile
+import subprocess
+from cpu_bench import ROOT, makeFakeBinaries
+sys.path.insert(0, ROOT)
+import musicformat
+import scanner
+import libraryindex
+from instrumentation import percentile
+from common import SAMPLES, makeTree, checkHeaders
+
+# Every format musicformat recognizes, plus cover art and rip logs the scanner skips.
+ALBUM = [name for name in SAMPLES if not name.endswith(('.cue', '.nfo'))]
+
+
+def summary(samples, items=1):
+    return {'count': len(samples), 'mean': sum(samples) / len(samples), 'min': min(samples),
+            'p50': percentile(samples, 0.5), 'p95': percentile(samples, 0.95), 'p99': percentile(samples, 0.99),
+            'throughput': items * len(samples) / sum(samples)}
+
+
+def timings(function, rounds, *args):
+    samples = list()
+    for _ in range(rounds):
+        timer = time.perf_counter()
+        function(*args)
+        samples.append(time.perf_counter() - timer)
+    return samples
+
+
+def benchScan(music, count, rounds, directory):
+    results = dict()
+    results['scan.cold'] = summary(timings(scanner.Scanner().scan, rounds, music), count)
+    index = libraryindex.LibraryIndex(os.path.join(directory, 'library.sqlite3'))
+    indexed = scanner.Scanner(index=index)
+    indexed.scan(music)
+    results['scan.indexed'] = summary(timings(indexed.scan, rounds, music), count)
+    index.close()
+    return results
+
+
+def benchSniff(music, rounds):
+    files = list(scanner.Scanner().prefilter(scanner.Scanner().walk(music)))
+    results = dict()
+    results['sniff.batch'] = summary(timings(musicformat.musicFormats, rounds, files), len(files))
+    samples = list()
+    for filename in files[:10000]:
+        timer = time.perf_counter()
+        musicformat.musicFormatHex(filename)
+        samples.append(time.perf_counter() - timer)
+    results['sniff.file'] = summary(samples)
+    return results
+
+
+def settle(player, previous, timeout=5.0):
+    # Transitions finish on the player thread; wait for the replacement ffplay to be spawned.
+    deadline = time.perf_counter() + timeout
+    while player.backend.process is previous or not player.backend.process:
+        if time.perf_counter() > deadline:
+            raise TimeoutError('no ffplay was started')
+        time.sleep(0.0001)
+
+
+def transition(player, function, *args):
+    previous = player.backend.process
+    timer = time.perf_counter()
+    function(*args)
+    settle(player, previous)
+    return time.perf_counter() - timer
+
+
+def benchPlayer(music, transitions, directory):
+    import pycli_music
+    import control
+    results = dict()
+    player = pycli_music.Player(music, index=False)
+    try:
+        results['loadPlaylist'] = summary(timings(player.loadPlaylist, 3, music), player.getPlaylistLength())
+        player.nonblockingLoop()
+        settle(player, None)
+        results['next'] = summary(timings(player.next, transitions))
+        results['skipNext'] = summary([transition(player, player.skipNext) for _ in range(transitions)])
+        length = player.getPlaylistLength()
+        results['skipTo'] = summary([transition(player, player.skipTo, (index * 7919) % length) for index in range(transitions)])
+        results['setVolume'] = summary([transition(player, player.setVolume, 100 - index % 50) for index in range(transitions)])
+        server = control.ControlServer(player, os.path.join(directory, 'control.sock'))
+        server.start()
+        client = control.ControlClient(server.path)
+        try:
+            client.send('state')
+            for command in ('state', 'queue'):
+                samples = list()
+                for _ in range(transitions * 20):
+                    timer = time.perf_counter()
+                    client.send(command)
+                    samples.append(time.perf_counter() - timer)
+                results[f'control.{command}'] = summary(samples)
+        finally:
+            client.close()
+            server.stop()
+    finally:
+        player.end()
+    return results
+
+
+def revision():
+    try:
+        commit = subprocess.run(['git', '-C', ROOT, 'rev-parse', 'HEAD'], stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, text=True, check=True).stdout.strip()
+        dirty = subprocess.run(['git', '-C', ROOT, 'status', '--porcelain', '--untracked-files=no'], stdout=subprocess.PIPE, text=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+    return commit + ('-dirty' if dirty else '')
+
+
+def compare(previous, current):
+    print(f'{"benchmark":16} {"p50 before":>12} {"p50 now":>12} {"change":>8}', file=sys.stderr)
+    for name, result in current['results'].items():
+        before = previous['results'].get(name)
+        if before:
+            print(f'{name:16} {before["p50"] * 1000:10.3f}ms {result["p50"] * 1000:10.3f}ms {result["p50"] / before["p50"] - 1:+8.1%}', file=sys.stderr)
+
+
+def main(files=5000, rounds=5, transitions=50, output=None, baseline=None):
+    checkHeaders()
+    with tempfile.TemporaryDirectory() as directory:
+        bindir = makeFakeBinaries(directory)
+        os.environ['PATH'] = f'{bindir}{os.pathsep}{os.environ["PATH"]}'
+        os.environ['XDG_CACHE_HOME'] = os.path.join(directory, 'cache')
+        os.environ['XDG_RUNTIME_DIR'] = directory
+        music = makeTree(os.path.join(directory, 'Music'), files, ALBUM)
+        results = dict()
+        results.update(benchScan(music, files, rounds, directory))
+        results.update(benchSniff(music, rounds))
+        results.update(benchPlayer(music, transitions, directory))
+    report = {'revision': revision(), 'time': time.time(), 'python': platform.python_version(), 'platform': platform.platform(),
+              'parameters': {'files': files, 'rounds': rounds, 'transitions': transitions}, 'unit': 'seconds', 'results': results}
+    text = json.dumps(report, indent=1)
+    if output:
+        with open(output, 'w') as outputfile:
+            outputfile.write(text + '\n')
+    else:
+        print(text)
+    if baseline:
+        with open(baseline) as baselinefile:
+            compare(json.load(baselinefile), report)
+
+
+if __name__ == '__main__':
+
+
+    HELPER = """
+    Benchmark scanning, sniffing, track transitions and control latency against fake ffplay/ffprobe binaries.
+    >python benchmarks/suite_bench.py [--files=N] [--rounds=N] [--transitions=N] [--output=FILE] [--compare=FILE]
+    Prints (or writes to FILE) a JSON report; --compare prints p50 changes against an earlier report to stderr.
+    """
+
+    options = dict()
+    for arg in sys.argv[1:]:
+        if arg in ('--help', '-h', '--?'):
+            print(HELPER)
+            sys.exit(0)
+        name, _, value = arg.lstrip('-').partition('=')
+        options[name] = value
+    main(int(options.get('files', 5000)), int(options.get('rounds', 5)), int(options.get('transitions', 50)),
+         options.get('output'), options.get('compare'))
@@ -0,0 +1,250 @@
+#!/usr/bin/env python
+import os
+import sys
+import json
+import queue
+import socket
+import threading
+import socketserver
+import libraryindex
+from instrumentation import METRICS
+
+# Short names for the Player methods most clients need; any name in METHODS also works as is.
+COMMANDS = {
+    'next': 'skipNext', 'skip': 'skipNext', 'previous': 'skipPrevious', 'back': 'skipPrevious',
+    'play': 'play', 'pause': 'pause', 'toggle': 'playPauseToggle', 'stop': 'stop',
+    'seek': 'seek', 'seekto': 'seekTo', 'forward': 'seekForward', 'rewind': 'seekBack',
+    'volume': 'setVolume', 'up': 'volumeUp', 'down': 'volumeDown', 'mute': 'volumeMute', 'max': 'volumeMax',
+    'skipto': 'skipTo', 'queue': 'upcomingSongs', 'playlist': 'getPlaylist', 'state': 'state',
+    'repeat': 'repeatToggle', 'shuffle': 'shuffleToggle', 'metadata': 'currentSongMetadata',
+    'download': 'youtubeDL', 'batch': 'youtubeDLBatch', 'downloads': 'downloadStatus', 'cancel': 'cancelDownload', 'retry': 'retryDownload',
+    'refresh': 'refreshPlaylist', 'metrics': 'metricsSnapshot', 'quit': 'end',
+}
+METHODS = set(COMMANDS.values()) | {'currentSong', 'nextSong', 'previousSong', 'currentSongName', 'currentSongStep', 'currentSongDuration',
+                                    'getSongAt', 'getPlaylistLength', 'isPlaying', 'pauseState', 'repeatState', 'shuffleState',
+                                    'isScanning', 'scanStats', 'metadataStats', 'startPreprobe', 'preprobeProgress',
+                                    'startLoudnessAnalysis', 'loudnessProgress', 'currentSongGain'}
+EVENTQUEUE = 256
+
+
+class ControlSocketInUse(Exception):
+    pass
+
+
+def socketPath():
+    if os.environ.get('XDG_RUNTIME_DIR'):
+        return os.path.join(os.environ['XDG_RUNTIME_DIR'], 'pycli-music.sock')
+    return os.path.join(libraryindex.cacheDirectory(), 'control.sock')
+
+
+class ControlHandler(socketserver.StreamRequestHandler):
+    def setup(self):
+        super().setup()
+        self.writelock = threading.Lock()
+        self.events = None
+
+
+    def handle(self):
+        try:
+            for line in self.rfile:
+                if not line.strip():
+                    continue
+                try:
+                    request = json.loads(line)
+                except ValueError as error:
+                    self.send({'error': f'invalid request: {error}'})
+                    continue
+                if not isinstance(request, dict) or not isinstance(request.get('args', list()), list):
+                    self.send({'error': 'invalid request'})
+                    continue
+                command = request.get('command')
+                if command == 'subscribe':
+                    self.subscribe(request.get('args'))
+                    self.send({'id': request.get('id'), 'result': True})
+                elif command == 'unsubscribe':
+                    self.unsubscribe()
+                    self.send({'id': request.get('id'), 'result': True})
+                else:
+                    self.send(self.server.execute(request))
+        except (OSError, ValueError):
+            pass
+        finally:
+            self.unsubscribe()
+
+
+    def send(self, message):
+        data = (json.dumps(message) + '\n').encode()
+        with self.writelock:
+            self.wfile.write(data)
+            self.wfile.flush()
+
+
+    def subscribe(self, kinds=None):
+        if self.events:
+            self.unsubscribe()
+        self.events = queue.Queue(EVENTQUEUE)
+        sender = threading.Thread(target=self.__sendEvents, args=(self.events,))
+        sender.daemon = True
+        sender.start()
+        self.server.player.subscribe(self.__queueEvent, kinds)
+
+
+    def unsubscribe(self):
+        if self.events:
+            self.server.player.unsubscribe(self.__queueEvent)
+            self.events.put(None)
+            self.events = None
+
+
+    def __queueEvent(self, event):
+        events = self.events
+        if events:
+            try:
+                events.put_nowait(event)
+            except queue.Full:
+                # A client that stopped reading loses events instead of stalling the player.
+                pass
+
+
+    def __sendEvents(self, events):
+        for event in iter(events.get, None):
+            try:
+                self.send(event)
+            except (OSError, ValueError):
+                break
+
+
+class ControlServer(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    daemon_threads = True
+
+    def __init__(self, player, path=None):
+        self.player = player
+        self.path = path or socketPath()
+        if os.path.exists(self.path):
+            try:
+                with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as probe:
+                    probe.connect(self.path)
+                raise ControlSocketInUse(self.path)
+            except (ConnectionRefusedError, FileNotFoundError):
+                os.unlink(self.path)
+        os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        super().__init__(self.path, ControlHandler)
+        os.chmod(self.path, 0o600)
+        self.thread = None
+
+
+    def start(self):
+        self.thread = threading.Thread(target=self.serve_forever)
+        self.thread.daemon = True
+        self.thread.start()
+
+
+    def stop(self):
+        if self.thread:
+            self.shutdown()
+            self.thread = None
+        self.server_close()
+        try:
+            os.unlink(self.path)
+        except OSError:
+            pass
+
+
+    def execute(self, request):
+        command = request.get('command')
+        args = request.get('args', list())
+        name = COMMANDS.get(command, command)
+        if name not in METHODS:
+            return {'id': request.get('id'), 'error': f'unknown command: {command}'}
+        try:
+            with METRICS.timer('control.command'):
+                result = getattr(self.player, name)(*args)
+        except Exception as error:
+            return {'id': request.get('id'), 'error': f'{type(error).__name__}: {error}'}
+        return {'id': request.get('id'), 'result': result}
+
+
+class ControlClient:
+    def __init__(self, path=None):
+        self.socket = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        self.socket.connect(path or socketPath())
+        self.file = self.socket.makefile('rwb')
+        self.requests = 0
+
+
+    def close(self):
+        self.file.close()
+        self.socket.close()
+
+
+    def send(self, command, *args):
+        self.requests += 1
+        self.file.write((json.dumps({'id': self.requests, 'command': command, 'args': args}) + '\n').encode())
+        self.file.flush()
+        for line in self.file:
+            response = json.loads(line)
+            if 'event' in response:
+                continue
+            if 'error' in response:
+                raise RuntimeError(response['error'])
+            return response.get('result')
+        raise ConnectionError('player closed the connection')
+
+
+    def events(self, *kinds):
+        self.send('subscribe', *kinds)
+        for line in self.file:
+            message = json.loads(line)
+            if 'event' in message:
+                yield message
+
+
+def parseArgument(argument):
+    try:
+        return json.loads(argument)
+    except ValueError:
+        return argument
+
+
+if __name__ == '__main__':
+
+
+    HELPER = f"""
+    Control a pycli-music player started with --daemon.
+    >python control.py [--socket=PATH] command [arguments]
+    Commands:
+        {', '.join(sorted(COMMANDS))}
+        subscribe [track|position|state|playlist|volume ...]: Print events as JSON lines until interrupted
+    Player method names such as 'currentSongStep' work as commands too.
+    """
+
+    arguments = sys.argv[1:]
+    path = None
+    if arguments and arguments[0].startswith('--socket='):
+        path = arguments.pop(0).split('=', 1)[-1]
+    if not arguments or arguments[0] in ('--help', '-h', '--?'):
+        print(HELPER)
+        sys.exit(0)
+    try:
+        client = ControlClient(path)
+    except OSError as error:
+        print(f'pycli-music is not running with --daemon ({error}).')
+        sys.exit(1)
+    try:
+        if arguments[0] == 'subscribe':
+            for event in client.events(*arguments[1:]):
+                print(json.dumps(event), flush=True)
+        else:
+            print(json.dumps(client.send(arguments[0], *[parseArgument(argument) for argument in arguments[1:]])))
+    except ConnectionError as error:
+        # The player exits before it can answer 'quit'.
+        if COMMANDS.get(arguments[0], arguments[0]) != 'end':
+            print(error)
+            sys.exit(1)
+    except RuntimeError as error:
+        print(error)
+        sys.exit(1)
+    except KeyboardInterrupt:
+        pass
+    finally:
+        client.close()
@@ -194,9 +194,10 @@ class Ui_MainWindow(object):
         self.horizontalLayout_4.addWidget(self.youtubedlEdit)
         self.verticalLayout.addLayout(self.horizontalLayout_4)
         self.horizontalLayout.addLayout(self.verticalLayout)
-        self.playlistWidget = QtWidgets.QListWidget(self.centralwidget)
-        self.playlistWidget.setObjectName("playlistWidget")
-        self.horizontalLayout.addWidget(self.playlistWidget)
+        self.playlistView = QtWidgets.QListView(self.centralwidget)
+        self.playlistView.setUniformItemSizes(True)
+        self.playlistView.setObjectName("playlistView")
+        self.horizontalLayout.addWidget(self.playlistView)
         self.verticalLayout_2.addLayout(self.horizontalLayout)
         MainWindow.setCentralWidget(self.centralwidget)
         self.menubar = QtWidgets.QMenuBar(MainWindow)
@@ -0,0 +1,260 @@
+#!/usr/bin/env python
+import os
+import re
+import time
+import queue
+import itertools
+import threading
+import subprocess
+from instrumentation import METRICS
+
+QUEUED = 'queued'
+DOWNLOADING = 'downloading'
+DONE = 'done'
+FAILED = 'failed'
+CANCELLED = 'cancelled'
+
+PROGRESS = 'progress'
+DESTINATION = 'destination'
+FINISHED = 'finished'
+ERROR = 'error'
+MESSAGE = 'message'
+
+# Progress events closer together than this are coalesced into the latest one.
+INTERVAL = 0.25
+
+PROGRESSLINE = re.compile(r'^\[download\]\s+(?P<percent>[\d.]+)% of\s+~?(?P<total>[\d.]+\s*[KMGTP]?i?B)'
+                          r'(?:\s+at\s+(?P<speed>[\d.]+\s*[KMGTP]?i?B)/s|\s+at\s+Unknown speed)?'
+                          r'(?:\s+ETA\s+(?P<eta>[\d:]+)|\s+ETA\s+Unknown ETA|\s+in\s+[\d:]+)?')
+DESTINATIONLINE = re.compile(r'^\[(?:download|ffmpeg|ExtractAudio)\] Destination: (?P<destination>.+)$')
+DOWNLOADEDLINE = re.compile(r'^\[download\] (?P<destination>.+) has already been downloaded')
+UNITS = {'B': 1, 'KB': 1000, 'MB': 1000 ** 2, 'GB': 1000 ** 3, 'TB': 1000 ** 4, 'PB': 1000 ** 5,
+         'KiB': 1024, 'MiB': 1024 ** 2, 'GiB': 1024 ** 3, 'TiB': 1024 ** 4, 'PiB': 1024 ** 5}
+
+
+def parseBytes(text):
+    number, unit = re.match(r'([\d.]+)\s*(\S+)', text).groups()
+    return int(float(number) * UNITS.get(unit, 1))
+
+
+def parseClock(text):
+    seconds = 0
+    for part in text.split(':'):
+        seconds = seconds * 60 + int(part)
+    return seconds
+
+
+def parseLine(line, jobid=None):
+    progress = PROGRESSLINE.match(line)
+    if progress:
+        total = parseBytes(progress.group('total'))
+        percent = float(progress.group('percent'))
+        return DownloadEvent(jobid, PROGRESS, percent=percent, downloaded=int(total * percent / 100), total=total,
+                             speed=parseBytes(progress.group('speed')) if progress.group('speed') else None,
+                             eta=parseClock(progress.group('eta')) if progress.group('eta') else None)
+    destination = DESTINATIONLINE.match(line) or DOWNLOADEDLINE.match(line)
+    if destination:
+        return DownloadEvent(jobid, DESTINATION, destination=os.path.abspath(destination.group('destination')))
+    if line.startswith('ERROR:'):
+        return DownloadEvent(jobid, ERROR, message=line[len('ERROR:'):].strip())
+    return DownloadEvent(jobid, MESSAGE, message=line)
+
+
+def formatBytes(count):
+    for unit in ('B', 'KiB', 'MiB', 'GiB'):
+        if count < 1024 or unit == 'GiB':
+            return f'{count:.1f}{unit}' if unit != 'B' else f'{count}B'
+        count /= 1024
+
+
+class DownloadEvent:
+    def __init__(self, jobid, kind, percent=None, downloaded=None, total=None, speed=None, eta=None, destination=None, message=None):
+        self.jobid = jobid
+        self.kind = kind
+        self.percent = percent
+        self.downloaded = downloaded
+        self.total = total
+        self.speed = speed
+        self.eta = eta
+        self.destination = destination
+        self.message = message
+
+
+    def __str__(self):
+        if self.kind == PROGRESS:
+            speed = f' at {formatBytes(self.speed)}/s' if self.speed is not None else ''
+            eta = f' ETA {self.eta // 60:02}:{self.eta % 60:02}' if self.eta is not None else ''
+            return f'[{self.jobid}] {self.percent:5.1f}% of {formatBytes(self.total)}{speed}{eta}'
+        if self.kind in (DESTINATION, FINISHED):
+            return f'[{self.jobid}] {self.kind}: {self.destination}'
+        return f'[{self.jobid}] {self.kind}: {self.message}'
+
+
+def readLinks(filename):
+    with open(filename) as links:
+        return [line.strip() for line in links if line.strip() and not line.lstrip().startswith(('#', ';'))]
+
+
+class Job:
+    def __init__(self, jobid, link):
+        self.id = jobid
+        self.link = link
+        self.state = QUEUED
+        self.attempts = 0
+        self.percent = 0.0
+        self.downloaded = None
+        self.total = None
+        self.speed = None
+        self.eta = None
+        self.destination = None
+        self.line = None
+        self.process = None
+
+
+    def status(self):
+        return {'id': self.id, 'link': self.link, 'state': self.state, 'attempts': self.attempts, 'percent': self.percent,
+                'downloaded': self.downloaded, 'total': self.total, 'speed': self.speed, 'eta': self.eta, 'destination': self.destination}
+
+
+class DownloadManager:
+    def __init__(self, command, workers=2, retries=1, finished=None, interval=INTERVAL):
+        self.command = command
+        self.workers = workers
+        self.retries = retries
+        self.interval = interval
+        self.finished = finished
+        self.queue = queue.Queue()
+        self.jobs = dict()
+        self.ids = itertools.count(1)
+        self.lock = threading.Lock()
+        self.threads = list()
+        self.stopped = False
+
+
+    def enqueue(self, link, callback=None):
+        with self.lock:
+            job = Job(next(self.ids), link)
+            self.jobs[job.id] = job
+            self.__startWorkers()
+        self.queue.put((job, callback))
+        return job
+
+
+    def enqueueFile(self, filename, callback=None):
+        return [self.enqueue(link, callback) for link in readLinks(filename)]
+
+
+    def cancel(self, jobid):
+        with self.lock:
+            job = self.jobs.get(jobid)
+            if not job or job.state not in (QUEUED, DOWNLOADING):
+                return False
+            job.state = CANCELLED
+            process = job.process
+        if process and process.poll() is None:
+            process.terminate()
+        return True
+
+
+    def retry(self, jobid, callback=None):
+        with self.lock:
+            job = self.jobs.get(jobid)
+            if not job or job.state not in (FAILED, CANCELLED):
+                return False
+            job.state = QUEUED
+            job.attempts = 0
+            self.__startWorkers()
+        self.queue.put((job, callback))
+        return True
+
+
+    def status(self):
+        with self.lock:
+            return [job.status() for job in self.jobs.values()]
+
+
+    def active(self):
+        with self.lock:
+            return sum(1 for job in self.jobs.values() if job.state in (QUEUED, DOWNLOADING))
+
+
+    def stop(self):
+        with self.lock:
+            self.stopped = True
+            jobids = list(self.jobs)
+        for jobid in jobids:
+            self.cancel(jobid)
+        for thread in self.threads:
+            self.queue.put(None)
+
+
+    def __startWorkers(self):
+        self.threads = [thread for thread in self.threads if thread.is_alive()]
+        while not self.stopped and len(self.threads) < self.workers:
+            thread = threading.Thread(target=self.__work)
+            thread.daemon = True
+            thread.start()
+            self.threads.append(thread)
+
+
+    def __work(self):
+        for item in iter(self.queue.get, None):
+            job, callback = item
+            with self.lock:
+                if job.state != QUEUED or self.stopped:
+                    continue
+                job.state = DOWNLOADING
+            started = time.perf_counter()
+            while not self.__download(job, callback):
+                with self.lock:
+                    if job.state != DOWNLOADING:
+                        break
+                    if job.attempts > self.retries:
+                        job.state = FAILED
+                        break
+            else:
+                with self.lock:
+                    job.state = DONE
+                METRICS.record('download.time', time.perf_counter() - started)
+                if job.total:
+                    METRICS.count('download.bytes', job.total)
+                if self.finished and job.destination:
+                    self.finished(job.destination)
+                if callback:
+                    callback(DownloadEvent(job.id, FINISHED, percent=100.0, destination=job.destination))
+
+
+    def __download(self, job, callback):
+        with self.lock:
+            if job.state != DOWNLOADING:
+                return False
+            job.attempts += 1
+            # Lines are only de-duplicated within an attempt, so a retry failing the same way is reported again.
+            job.line = None
+            job.process = subprocess.Popen(self.command(job.link), bufsize=1, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, text=True, errors='replace')
+        emitted = 0.0
+        pending = None
+        for line in iter(job.process.stdout.readline, ''):
+            line = line.rstrip()
+            if not line or line == job.line:
+                continue
+            job.line = line
+            event = parseLine(line, job.id)
+            if event.kind == PROGRESS:
+                job.percent, job.downloaded, job.total, job.speed, job.eta = event.percent, event.downloaded, event.total, event.speed, event.eta
+                if event.percent < 100 and time.monotonic() - emitted < self.interval:
+                    pending = event
+                    continue
+            elif event.kind == DESTINATION:
+                job.destination = event.destination
+            if callback:
+                if pending and event.kind != PROGRESS:
+                    callback(pending)
+                pending = None
+                emitted = time.monotonic()
+                callback(event)
+        job.process.stdout.close()
+        with self.lock:
+            returncode = job.process.wait()
+            job.process = None
+            return returncode == 0 and job.state == DOWNLOADING
@@ -0,0 +1,130 @@
+#!/usr/bin/env python
+from collections import deque
+import json
+import time
+import threading
+
+# Latest samples kept per timer for percentiles.
+SAMPLES = 1024
+DUMPINTERVAL = 10
+
+
+def percentile(samples, fraction):
+    ordered = sorted(samples)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * fraction))]
+
+
+class NullTimer:
+    def __enter__(self):
+        return self
+
+
+    def __exit__(self, *exception):
+        return False
+
+
+NULLTIMER = NullTimer()
+
+
+class Timer:
+    def __init__(self, metrics, name):
+        self.metrics = metrics
+        self.name = name
+        self.started = None
+
+
+    def __enter__(self):
+        self.started = time.perf_counter()
+        return self
+
+
+    def __exit__(self, *exception):
+        self.metrics.record(self.name, time.perf_counter() - self.started)
+        return False
+
+
+class Metrics:
+    # Call sites check `enabled` (or get NULLTIMER) first, so a disabled instance costs one attribute read.
+    def __init__(self):
+        self.enabled = False
+        self.lock = threading.Lock()
+        self.timers = dict()
+        self.counters = dict()
+        self.started = time.time()
+        self.dumpthread = None
+        self.dumpstopped = threading.Event()
+
+
+    def enable(self):
+        self.enabled = True
+
+
+    def disable(self):
+        self.enabled = False
+        self.stopDump()
+
+
+    def reset(self):
+        with self.lock:
+            self.timers = dict()
+            self.counters = dict()
+            self.started = time.time()
+
+
+    def count(self, name, amount=1):
+        if self.enabled:
+            with self.lock:
+                self.counters[name] = self.counters.get(name, 0) + amount
+
+
+    def record(self, name, seconds):
+        if self.enabled:
+            with self.lock:
+                timer = self.timers.get(name)
+                if timer is None:
+                    timer = self.timers[name] = [0, 0.0, seconds, seconds, deque(maxlen=SAMPLES)]
+                timer[0] += 1
+                timer[1] += seconds
+                timer[2] = min(timer[2], seconds)
+                timer[3] = max(timer[3], seconds)
+                timer[4].append(seconds)
+
+
+    def timer(self, name):
+        if self.enabled:
+            return Timer(self, name)
+        return NULLTIMER
+
+
+    def snapshot(self):
+        with self.lock:
+            timers = {name: {'count': count, 'total': total, 'min': low, 'max': high, 'mean': total / count,
+                             'p50': percentile(samples, 0.5), 'p95': percentile(samples, 0.95), 'p99': percentile(samples, 0.99)}
+                      for name, (count, total, low, high, samples) in self.timers.items()}
+            return {'time': time.time(), 'since': self.started, 'enabled': self.enabled, 'timers': timers, 'counters': dict(self.counters)}
+
+
+    def startDump(self, filename, interval=DUMPINTERVAL):
+        self.stopDump()
+        self.dumpstopped.clear()
+        self.dumpthread = threading.Thread(target=self.__dump, args=(filename, interval))
+        self.dumpthread.daemon = True
+        self.dumpthread.start()
+
+
+    def stopDump(self):
+        self.dumpstopped.set()
+        if self.dumpthread and self.dumpthread is not threading.current_thread():
+            self.dumpthread.join()
+        self.dumpthread = None
+
+
+    def __dump(self, filename, interval):
+        with open(filename, 'a') as dump:
+            while not self.dumpstopped.wait(interval):
+                dump.write(json.dumps(self.snapshot()) + '\n')
+                dump.flush()
+            dump.write(json.dumps(self.snapshot()) + '\n')
+
+
+METRICS = Metrics()
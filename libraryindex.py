@@ -0,0 +1,180 @@
+#!/usr/bin/env python
+from collections import deque
+import os
+import json
+import sqlite3
+import threading
+
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS dirs (
+    path TEXT PRIMARY KEY,
+    parent TEXT,
+    mtime INTEGER
+);
+CREATE INDEX IF NOT EXISTS dirs_parent ON dirs (parent);
+CREATE TABLE IF NOT EXISTS tracks (
+    path TEXT PRIMARY KEY,
+    dir TEXT,
+    mtime INTEGER,
+    size INTEGER,
+    format TEXT,
+    duration REAL,
+    metadata TEXT,
+    loudness TEXT
+);
+CREATE INDEX IF NOT EXISTS tracks_dir ON tracks (dir);
+"""
+
+
+def cacheDirectory():
+    if os.environ.get('XDG_CACHE_HOME'):
+        cache = os.environ['XDG_CACHE_HOME']
+    else:
+        cache = os.path.join(os.path.expanduser('~'), '.cache')
+    return os.path.join(cache, 'pycli-music')
+
+
+def subtree(directory):
+    # Every path strictly below directory sorts between 'directory/' and 'directory0'.
+    prefix = os.path.join(directory, '')
+    return prefix, prefix[:-1] + chr(ord(os.sep) + 1)
+
+
+class LibraryIndex:
+    def __init__(self, filename=None):
+        if filename:
+            self.filename = filename
+        else:
+            self.filename = os.path.join(cacheDirectory(), 'library.sqlite3')
+        os.makedirs(os.path.dirname(self.filename), exist_ok=True)
+        self.lock = threading.Lock()
+        self.connection = sqlite3.connect(self.filename, check_same_thread=False)
+        with self.lock, self.connection:
+            self.connection.executescript(SCHEMA)
+            columns = [row[1] for row in self.connection.execute('PRAGMA table_info(tracks)')]
+            for column in ('metadata', 'loudness'):
+                if column not in columns:
+                    self.connection.execute(f'ALTER TABLE tracks ADD COLUMN {column} TEXT')
+
+
+    def close(self):
+        with self.lock:
+            self.connection.close()
+
+
+    def __knownDirs(self, music):
+        low, high = subtree(music)
+        dirs = dict()
+        children = dict()
+        rows = self.connection.execute('SELECT path, parent, mtime FROM dirs WHERE path = ? OR (path >= ? AND path < ?)', (music, low, high))
+        for path, parent, mtime in rows:
+            dirs[path] = mtime
+            children.setdefault(parent, list()).append(path)
+        return dirs, children
+
+
+    def refresh(self, music, scanner, full=False):
+        return list(self.update(music, scanner, full))
+
+
+    def update(self, music, scanner, full=False):
+        music = os.path.abspath(music)
+        with self.lock:
+            dirs, children = self.__knownDirs(music)
+        visited = set()
+        changed = list()
+        tosniff = dict()
+        cachedsongs = deque()
+
+        def candidates():
+            stack = [music]
+            while stack:
+                directory = stack.pop()
+                try:
+                    dirmtime = os.stat(directory).st_mtime_ns
+                except OSError:
+                    continue
+                visited.add(directory)
+                if not full and dirs.get(directory) == dirmtime:
+                    with self.lock:
+                        rows = self.connection.execute('SELECT path, format FROM tracks WHERE dir = ?', (directory,)).fetchall()
+                    scanner.cached += len(rows)
+                    cachedsongs.extend(path for path, form in rows if form)
+                    stack.extend(children.get(directory, ()))
+                    continue
+                files = dict()
+                subdirs = list()
+                try:
+                    with os.scandir(directory) as entries:
+                        for entry in entries:
+                            try:
+                                if entry.is_dir(follow_symlinks=False):
+                                    subdirs.append(entry.path)
+                                elif entry.is_file():
+                                    stat = entry.stat()
+                                    files[entry.path] = (stat.st_mtime_ns, stat.st_size)
+                            except OSError:
+                                pass
+                except OSError:
+                    continue
+                with self.lock:
+                    known = {path: (mtime, size, form) for path, mtime, size, form in self.connection.execute('SELECT path, mtime, size, format FROM tracks WHERE dir = ?', (directory,))}
+                for path, signature in files.items():
+                    if path in known and known[path][:2] == signature:
+                        scanner.cached += 1
+                        if known[path][2]:
+                            cachedsongs.append(path)
+                    else:
+                        tosniff[path] = (directory,) + signature
+                        yield path
+                removed = [(path,) for path in known if path not in files]
+                changed.append((directory, os.path.dirname(directory), dirmtime, removed))
+                stack.extend(subdirs)
+
+        sniffed = dict()
+        for path, form in scanner.sniffAll(scanner.prefilter(candidates())):
+            while cachedsongs:
+                yield cachedsongs.popleft()
+            sniffed[path] = form
+            if form:
+                yield path
+        while cachedsongs:
+            yield cachedsongs.popleft()
+        with self.lock, self.connection:
+            for directory, parent, dirmtime, removed in changed:
+                self.connection.executemany('DELETE FROM tracks WHERE path = ?', removed)
+                self.connection.execute('INSERT OR REPLACE INTO dirs (path, parent, mtime) VALUES (?, ?, ?)', (directory, parent, dirmtime))
+            self.connection.executemany('INSERT OR REPLACE INTO tracks (path, dir, mtime, size, format, duration, metadata) VALUES (?, ?, ?, ?, ?, NULL, NULL)',
+                ((path, directory, mtime, size, sniffed.get(path)) for path, (directory, mtime, size) in tosniff.items()))
+            gone = [(directory,) for directory in dirs if directory not in visited]
+            self.connection.executemany('DELETE FROM tracks WHERE dir = ?', gone)
+            self.connection.executemany('DELETE FROM dirs WHERE path = ?', gone)
+
+
+    def metadata(self, path, mtime, size):
+        with self.lock:
+            row = self.connection.execute('SELECT metadata FROM tracks WHERE path = ? AND mtime = ? AND size = ?', (path, mtime, size)).fetchone()
+        if row and row[0]:
+            return json.loads(row[0])
+        return None
+
+
+    def setMetadata(self, path, mtime, size, metadata):
+        with self.lock, self.connection:
+            self.connection.execute('UPDATE tracks SET duration = ?, metadata = ? WHERE path = ? AND mtime = ? AND size = ?',
+                (metadata.get('duration'), json.dumps(metadata), path, mtime, size))
+
+
+    def loudness(self, path, mtime, size):
+        with self.lock:
+            row = self.connection.execute('SELECT loudness FROM tracks WHERE path = ? AND mtime = ? AND size = ?', (path, mtime, size)).fetchone()
+        if row and row[0]:
+            return json.loads(row[0])
+        return None
+
+
+    def setLoudness(self, path, mtime, size, loudness):
+        with self.lock, self.connection:
+            self.connection.execute('UPDATE tracks SET loudness = ? WHERE path = ? AND mtime = ? AND size = ?',
+                (json.dumps(loudness), path, mtime, size))
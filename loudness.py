@@ -0,0 +1,70 @@
+#!/usr/bin/env python
+import json
+import math
+import subprocess
+import metadata
+from instrumentation import METRICS
+
+# ReplayGain 2.0 reference level; gains are also capped so the true peak stays under PEAKLIMIT.
+TARGET = -18.0
+PEAKLIMIT = -1.0
+MAXGAIN = 12.0
+
+
+def analyzeCommand(decoder, filename):
+    return [decoder, '-nostdin', '-hide_banner', '-nostats', '-i', filename, '-vn', '-af', 'loudnorm=print_format=json', '-f', 'null', '-']
+
+
+def parseAnalysis(output):
+    text = output.decode('utf-8', 'replace')
+    report = json.loads(text[text.rindex('{'):text.rindex('}') + 1])
+    return {
+        'integrated': float(report['input_i']),
+        'truepeak': float(report['input_tp']),
+        'range': float(report['input_lra']),
+        'threshold': float(report['input_thresh']),
+    }
+
+
+def gainFor(analysis, target=TARGET):
+    if not math.isfinite(analysis['integrated']):
+        return 0.0
+    gain = target - analysis['integrated']
+    if math.isfinite(analysis['truepeak']):
+        gain = min(gain, PEAKLIMIT - analysis['truepeak'])
+    return max(-MAXGAIN, min(MAXGAIN, gain))
+
+
+class LoudnessCache(metadata.MetadataCache):
+    # EBU R128 measurements, cached like probe results and invalidated by the same mtime and size key.
+    # They carry no duration, so loudness progress has no 'known' total.
+    tally = None
+
+    def __init__(self, decoder, capacity=4096, index=None, target=TARGET):
+        super().__init__(decoder, capacity, index)
+        self.target = target
+
+
+    def measure(self, filename, nice=False):
+        command = analyzeCommand(self.prober, filename)
+        if nice:
+            command = metadata.NICE + command
+        with METRICS.timer('loudness'):
+            output = subprocess.run(command, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, check=True).stderr
+        return parseAnalysis(output)
+
+
+    def fetch(self, key):
+        return self.index.loudness(*key)
+
+
+    def persist(self, key, analysis):
+        self.index.setLoudness(*key, analysis)
+
+
+    def gain(self, filename):
+        # Never measures; songs not analyzed yet play unchanged.
+        analysis = self.get(filename)
+        if analysis is None:
+            return None
+        return gainFor(analysis, self.target)
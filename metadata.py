@@ -0,0 +1,202 @@
+#!/usr/bin/env python
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+import os
+import json
+import itertools
+import shutil
+import threading
+import subprocess
+from instrumentation import METRICS
+
+NICE = ['nice', '-n', '10'] if shutil.which('nice') else list()
+
+
+def probeCommand(prober, filename):
+    return [prober, '-v', 'quiet', '-of', 'json', '-hide_banner', '-select_streams', 'a:0',
+            '-show_entries', 'format=duration,bit_rate:format_tags:stream=codec_name,sample_rate,channels', '-i', filename]
+
+
+def parseProbe(output):
+    probe = json.loads(output)
+    form = probe['format']
+    streams = probe.get('streams') or [dict()]
+    return {
+        'duration': float(form['duration']),
+        'bitrate': int(form.get('bit_rate') or 0) or None,
+        'samplerate': int(streams[0].get('sample_rate') or 0) or None,
+        'channels': streams[0].get('channels'),
+        'codec': streams[0].get('codec_name'),
+        'tags': {key.lower(): value for key, value in form.get('tags', dict()).items()},
+    }
+
+
+class MetadataCache:
+    # Field BackgroundProber sums into progress()['known']; None leaves 'known' out.
+    tally = 'duration'
+
+    def __init__(self, prober, capacity=4096, index=None):
+        self.prober = prober
+        self.capacity = capacity
+        self.index = index
+        self.entries = OrderedDict()
+        self.lock = threading.Lock()
+        self.hits = 0
+        self.indexhits = 0
+        self.misses = 0
+
+
+    def key(self, filename):
+        stat = os.stat(filename)
+        return (filename, stat.st_mtime_ns, stat.st_size)
+
+
+    def get(self, filename):
+        try:
+            key = self.key(filename)
+        except OSError:
+            return None
+        with self.lock:
+            metadata = self.entries.get(key)
+            if metadata:
+                self.entries.move_to_end(key)
+                self.hits += 1
+                return metadata
+        if self.index:
+            metadata = self.fetch(key)
+            if metadata:
+                with self.lock:
+                    self.indexhits += 1
+                self.__store(key, metadata, persist=False)
+                return metadata
+        return None
+
+
+    def lookup(self, filename, nice=False):
+        metadata = self.get(filename)
+        if metadata:
+            return metadata
+        key = self.key(filename)
+        metadata = self.measure(filename, nice)
+        with self.lock:
+            self.misses += 1
+        self.__store(key, metadata)
+        return metadata
+
+
+    def measure(self, filename, nice=False):
+        command = probeCommand(self.prober, filename)
+        if nice:
+            command = NICE + command
+        with METRICS.timer('probe'):
+            output = subprocess.check_output(command, stderr=subprocess.DEVNULL)
+        return parseProbe(output)
+
+
+    def fetch(self, key):
+        return self.index.metadata(*key)
+
+
+    def persist(self, key, metadata):
+        self.index.setMetadata(*key, metadata)
+
+
+    def duration(self, filename):
+        return self.lookup(filename)['duration']
+
+
+    def __store(self, key, metadata, persist=True):
+        with self.lock:
+            self.entries[key] = metadata
+            self.entries.move_to_end(key)
+            while len(self.entries) > self.capacity:
+                self.entries.popitem(last=False)
+        if persist and self.index:
+            self.persist(key, metadata)
+
+
+    def stats(self):
+        with self.lock:
+            return {'entries': len(self.entries), 'capacity': self.capacity, 'hits': self.hits, 'indexhits': self.indexhits, 'misses': self.misses}
+
+
+class BackgroundProber:
+    def __init__(self, cache, workers=2, rate=10):
+        self.cache = cache
+        self.workers = workers
+        self.rate = rate
+        self.thread = None
+        self.stopped = threading.Event()
+        self.lock = threading.Lock()
+        self.total = 0
+        self.probed = 0
+        self.failed = 0
+        self.known = 0.0
+
+
+    def start(self, songs, counter=0):
+        self.stop()
+        self.stopped.clear()
+        total = len(songs)
+        order = (songs[index] for index in itertools.chain(range(counter, total), range(counter)) if index < len(songs))
+        with self.lock:
+            self.total = total
+            self.probed = 0
+            self.failed = 0
+            self.known = 0.0
+        self.thread = threading.Thread(target=self.__run, args=(order,))
+        self.thread.daemon = True
+        self.thread.start()
+
+
+    def stop(self):
+        self.stopped.set()
+        if self.thread and self.thread is not threading.current_thread():
+            self.thread.join()
+        self.thread = None
+
+
+    def isRunning(self):
+        return bool(self.thread and self.thread.is_alive())
+
+
+    def __run(self, order):
+        slots = threading.BoundedSemaphore(self.workers)
+        with ThreadPoolExecutor(max_workers=self.workers) as executor:
+            for song in order:
+                if self.stopped.is_set():
+                    break
+                metadata = self.cache.get(song)
+                if metadata:
+                    self.__done(metadata)
+                    continue
+                slots.acquire()
+                if self.stopped.wait(1 / self.rate):
+                    slots.release()
+                    break
+                executor.submit(self.__probe, song, slots)
+
+
+    def __probe(self, song, slots):
+        try:
+            self.__done(self.cache.lookup(song, nice=True))
+        except (OSError, subprocess.CalledProcessError, ValueError, KeyError):
+            with self.lock:
+                self.failed += 1
+        finally:
+            slots.release()
+
+
+    def __done(self, metadata):
+        with self.lock:
+            self.probed += 1
+            if self.cache.tally:
+                self.known += metadata.get(self.cache.tally, 0.0)
+
+
+    def progress(self):
+        with self.lock:
+            progress = {'total': self.total, 'probed': self.probed, 'failed': self.failed, 'running': self.isRunning()}
+            if self.cache.tally:
+                progress['known'] = self.known
+            return progress
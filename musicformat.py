@@ -1,16 +1,85 @@
 #!/usr/bin/env python
+import time
+import struct
+from instrumentation import METRICS
 
-def musicFormatHex(filename):
-    item = str(open(filename, "rb").read(32).hex())
-    if item[8:].startswith('667479704d344120') or item[8:].startswith('6674797069736f6d'):
+HEADERSIZE = 36
+LEAD = struct.Struct('>I')
+
+
+def magic(text):
+    return LEAD.unpack(text)[0]
+
+
+def ogg(header):
+    if header[28:36] == b'OpusHead':
+        return 'opus'
+    return 'ogg'
+
+
+def riff(header):
+    if header[8:12] == b'WAVE':
+        return 'wav'
+    return None
+
+
+def aiff(header):
+    if header[8:12] == b'AIFF' or header[8:12] == b'AIFC':
+        return 'aiff'
+    return None
+
+
+MAGIC = {
+    magic(b'OggS'): ogg,
+    magic(b'fLaC'): 'flac',
+    magic(b'RIFF'): riff,
+    magic(b'FORM'): aiff,
+    magic(b'MAC '): 'ape',
+    magic(b'wvpk'): 'wv',
+}
+
+FTYP = {b'M4A ', b'M4B ', b'M4P ', b'isom', b'iso2', b'mp42'}
+
+
+def musicFormat(header):
+    if len(header) < 4:
+        return None
+    form = MAGIC.get(LEAD.unpack_from(header)[0])
+    if form:
+        if callable(form):
+            return form(header)
+        return form
+    if header[4:8] == b'ftyp' and bytes(header[8:12]) in FTYP:
         return 'aac'
-    elif item.startswith('4f676753'):
-        return 'ogg'
-    elif item.startswith('494433'):
+    if header[:3] == b'ID3':
         return 'mp3'
-    elif item.startswith('664c6143'):
-        return 'flac'
-    elif item.startswith('52494646') and item[16:].startswith('57415645'):
-        return 'wav'
-    else:
-        return None
\ No newline at end of file
+    if header[0] == 0xFF:
+        if header[1] & 0xE6 == 0xE2:
+            return 'mp3'
+        if header[1] & 0xF6 == 0xF0:
+            return 'aac'
+    return None
+
+
+def musicFormats(filenames):
+    timer = time.perf_counter() if METRICS.enabled else None
+    buffer = bytearray(HEADERSIZE)
+    view = memoryview(buffer)
+    formats = list()
+    for filename in filenames:
+        try:
+            with open(filename, 'rb', buffering=0) as musicfile:
+                size = musicfile.readinto(buffer)
+        except OSError:
+            formats.append(None)
+            continue
+        formats.append(musicFormat(view[:size]))
+    if timer is not None:
+        METRICS.record('sniff.batch', time.perf_counter() - timer)
+        METRICS.count('sniff.files', len(formats))
+    return formats
+
+
+def musicFormatHex(filename):
+    with open(filename, 'rb', buffering=0) as musicfile:
+        return musicFormat(musicfile.read(HEADERSIZE))
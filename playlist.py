@@ -0,0 +1,158 @@
+#!/usr/bin/env python
+from array import array
+import os
+import random
+
+
+class PathTable:
+    def __init__(self):
+        self.dirs = list()
+        self.dirids = dict()
+        self.dirindex = array('I')
+        self.names = bytearray()
+        self.offsets = array('Q', [0])
+        # Track ids per directory id, only built once something looks a path up.
+        self.dirtracks = None
+
+
+    def __len__(self):
+        return len(self.dirindex)
+
+
+    def add(self, path):
+        directory, name = os.path.split(path)
+        dirid = self.dirids.get(directory)
+        if dirid is None:
+            dirid = len(self.dirs)
+            self.dirs.append(directory)
+            self.dirids[directory] = dirid
+        self.dirindex.append(dirid)
+        self.names.extend(name.encode('utf-8', 'surrogateescape'))
+        self.offsets.append(len(self.names))
+        if self.dirtracks is not None:
+            if dirid == len(self.dirtracks):
+                self.dirtracks.append(array('I'))
+            self.dirtracks[dirid].append(len(self.dirindex) - 1)
+        return len(self.dirindex) - 1
+
+
+    def find(self, path):
+        directory, name = os.path.split(path)
+        dirid = self.dirids.get(directory)
+        if dirid is None:
+            return None
+        if self.dirtracks is None:
+            self.dirtracks = [array('I') for directory in self.dirs]
+            for trackid, entry in enumerate(self.dirindex):
+                self.dirtracks[entry].append(trackid)
+        name = name.encode('utf-8', 'surrogateescape')
+        # The latest entry wins, as a song added again after being removed gets a new id.
+        for trackid in reversed(self.dirtracks[dirid]):
+            if self.names[self.offsets[trackid]:self.offsets[trackid + 1]] == name:
+                return trackid
+        return None
+
+
+    def under(self, directory):
+        prefix = os.path.join(directory, '')
+        return [trackid for trackid in range(len(self)) if self.directory(trackid) == directory or self.directory(trackid).startswith(prefix)]
+
+
+    def basename(self, trackid):
+        return self.names[self.offsets[trackid]:self.offsets[trackid + 1]].decode('utf-8', 'surrogateescape')
+
+
+    def directory(self, trackid):
+        return self.dirs[self.dirindex[trackid]]
+
+
+    def path(self, trackid):
+        return os.path.join(self.directory(trackid), self.basename(trackid))
+
+
+class Playlist:
+    def __init__(self, songs=(), table=None, order=None):
+        if table is None:
+            table = PathTable()
+        self.table = table
+        if order is None:
+            order = array('I')
+        self.order = order
+        for song in songs:
+            self.append(song)
+
+
+    def __len__(self):
+        return len(self.order)
+
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self.table.path(trackid) for trackid in self.order[index]]
+        return self.table.path(self.order[index])
+
+
+    def __iter__(self):
+        for trackid in self.order:
+            yield self.table.path(trackid)
+
+
+    def append(self, path):
+        trackid = self.table.add(path)
+        self.order.append(trackid)
+        return trackid
+
+
+    def appendId(self, trackid):
+        self.order.append(trackid)
+
+
+    def trackId(self, index):
+        return self.order[index]
+
+
+    def basename(self, index):
+        return self.table.basename(self.order[index])
+
+
+    def insertSorted(self, trackid, start=0):
+        path = self.table.path(trackid)
+        low, high = start, len(self.order)
+        while low < high:
+            middle = (low + high) // 2
+            if self.table.path(self.order[middle]) < path:
+                low = middle + 1
+            else:
+                high = middle
+        self.order.insert(low, trackid)
+
+
+    def swap(self, first, second):
+        self.order[first], self.order[second] = self.order[second], self.order[first]
+
+
+    def copy(self):
+        return Playlist(table=self.table, order=array('I', self.order))
+
+
+    def discard(self, trackids, counter=0):
+        # Returns the new index of the song at counter, or of the one before it if that song was removed.
+        kept = array('I')
+        removed = 0
+        for index, trackid in enumerate(self.order):
+            if trackid not in trackids:
+                kept.append(trackid)
+            elif index <= counter:
+                removed += 1
+        self.order = kept
+        return max(counter - removed, 0)
+
+
+    def shuffle(self, start=0):
+        tail = self.order[start:]
+        random.shuffle(tail)
+        self.order[start:] = tail
+
+
+    def sort(self, start=0):
+        self.order[start:] = array('I', sorted(self.order[start:], key=self.table.path))
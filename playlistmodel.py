@@ -0,0 +1,54 @@
+#!/usr/bin/env python
+from PyQt5 import QtCore, QtGui
+
+
+class PlaylistModel(QtCore.QAbstractListModel):
+    # Rows are read from the player when the view paints them, so only visible songs are ever formatted.
+    def __init__(self, player, parent=None):
+        super().__init__(parent)
+        self.player = player
+        self.length = player.getPlaylistLength()
+        self.current = None
+        self.bold = QtGui.QFont()
+        self.bold.setBold(True)
+
+
+    def rowCount(self, parent=QtCore.QModelIndex()):
+        if parent.isValid():
+            return 0
+        return self.length
+
+
+    def data(self, index, role=QtCore.Qt.DisplayRole):
+        if not index.isValid() or index.row() >= self.length:
+            return None
+        if role == QtCore.Qt.DisplayRole:
+            try:
+                return self.player.getSongAt(index.row())
+            except IndexError:
+                return None
+        if role == QtCore.Qt.FontRole and index.row() == self.current:
+            return self.bold
+        return None
+
+
+    def refresh(self):
+        length = self.player.getPlaylistLength()
+        if length > self.length:
+            self.beginInsertRows(QtCore.QModelIndex(), self.length, length - 1)
+            self.length = length
+            self.endInsertRows()
+        elif length < self.length:
+            self.beginRemoveRows(QtCore.QModelIndex(), length, self.length - 1)
+            self.length = length
+            self.endRemoveRows()
+        if length:
+            # Reordered rows keep their count; views only re-read the rows they show.
+            self.dataChanged.emit(self.index(0), self.index(length - 1), [QtCore.Qt.DisplayRole])
+
+
+    def setCurrent(self, row):
+        previous, self.current = self.current, row
+        for changed in (previous, row):
+            if changed is not None and changed < self.length:
+                self.dataChanged.emit(self.index(changed), self.index(changed), [QtCore.Qt.FontRole])
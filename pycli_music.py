@@ -1,15 +1,34 @@
 #!/usr/bin/env python
-from pathlib import Path
 import os
 import sys
 import time
-import json
 import signal
 import shutil
 import random
 import subprocess
 import threading
-import musicformat
+import scanner
+import libraryindex
+import metadata
+import playlist
+import instrumentation
+from instrumentation import METRICS
+
+
+TRACK = 'track'
+POSITION = 'position'
+STATE = 'state'
+PLAYLIST = 'playlist'
+VOLUME = 'volume'
+EVENTS = (TRACK, POSITION, STATE, PLAYLIST, VOLUME)
+TICKRATE = 1
+# Playlist events are coalesced so a library scan or a burst of downloads doesn't redraw per song.
+PLAYLISTINTERVAL = 0.25
+# Seconds to wait after a song fails to play, doubling with every failure in a row up to FAILUREBACKOFFMAX.
+FAILUREBACKOFF = 0.1
+FAILUREBACKOFFMAX = 5.0
+# What probing a song that FFprobe can't read raises.
+PROBEERRORS = (OSError, subprocess.CalledProcessError, ValueError, KeyError)
 
 
 class PlayerNotFound(Exception):
@@ -21,52 +40,78 @@ class ProberNotFound(Exception):
 
 
 class Player:
-    def __init__(self, filename=None, shuffle=False, repeat=False):
-        self.songs = list()
+    def __init__(self, filename=None, shuffle=False, repeat=False, scanworkers=None, index=True, live=False, gapless=False, streaming=False, refresh=False, watch=False, downloadworkers=2, metrics=False, backend=None, sink=None, normalize=False):
+        if metrics:
+            self.enableMetrics(metrics if isinstance(metrics, str) else None)
+        self.songs = playlist.Playlist()
+        self.nextsongs = self.songs.copy()
+        self.scanning = False
+        self.songended = None
+        self.refresh = refresh
+        self.refreshthread = None
+        self.watch = watch
+        self.watcher = None
+        self.removed = set()
         self.counter = 0
         self.repeat = repeat
         self.filename = filename
         self.shuffle = shuffle
         self.playstate = True
         self.onstate = True
-        self.musicprocess = False
-        self.youtubedlprocess = False
+        self.shutdown = threading.Event()
         self.songcomplete = False
+        self.failures = 0
         self.pausestate = False
         self.currentlyplaying = 'None'
         self.youtubedl = self.__getYoutubeDL()
-        self.youtubedlcomplete = True
+        self.downloads = None
+        self.downloadworkers = downloadworkers
         self.stepper = 0
+        self.steppertimer = None
+        self.generation = 0
+        self.condition = threading.Condition()
+        self.subscribers = list()
+        self.subscriberlock = threading.Lock()
+        self.dispatcher = None
+        self.tickrate = TICKRATE
+        self.playlistchanged = False
+        self.announced = None
         self.volume = 100
         self.currentsongduration = None
         self.player = self.__getPlayer()
         self.prober = self.__getProber()
-        self.loadPlaylists()
-        self.__shuffle()
+        self.decoder = self.__getDecoder()
+        self.backend = self.__getBackend(backend, live or gapless or sink is not None, gapless, sink)
+        self.index = self.__getIndex(index)
+        self.scanner = scanner.Scanner(scanworkers, index=self.index)
+        self.metadata = metadata.MetadataCache(self.prober, index=self.index)
+        self.preprober = metadata.BackgroundProber(self.metadata)
+        self.loudness = None
+        if normalize and self.decoder:
+            import loudness
+            self.loudness = loudness.LoudnessCache(self.decoder, index=self.index)
+        self.backend.loudness = self.loudness
+        self.analyzer = metadata.BackgroundProber(self.loudness, workers=1) if self.loudness else None
+        if streaming:
+            self.streamPlaylists()
+        else:
+            self.loadPlaylists()
+            self.__shuffle()
+            if watch:
+                self.startWatcher()
 
 
-    def loadPlaylist(self, filename=None):
-        songs = list()
+    def musicPath(self, filename=None):
+        # Absolute, so scanned songs match the paths the watcher and the index report.
         if filename:
-            music = filename
+            return os.path.abspath(filename)
         else:
-            music = os.path.join(Path.home(), 'Music')
-        if os.path.isdir(music):
-            for root, dirs, files in os.walk(music):
-                for name in files:
-                    songs.append(os.path.join(root, name))
-        else:
-            if os.path.isabs(music):
-                songs.append(music)
-            else:
-                songs.append(os.path.join(os.getcwd(), music))
-        for song in songs:
-            try:
-                form = musicformat.musicFormatHex(song)
-                if form is None:
-                    songs.remove(song)
-            except FileNotFoundError:
-                songs.remove(song)
+            return os.path.join(os.path.expanduser('~'), 'Music')
+
+
+    def loadPlaylist(self, filename=None):
+        with METRICS.timer('playlist.load'):
+            songs = playlist.Playlist(self.scanner.iterate(self.musicPath(filename)))
         if len(songs) < 1:
             self.stop()
             raise FileNotFoundError
@@ -75,19 +120,192 @@ class Player:
 
     def loadPlaylists(self):
         self.songs = self.loadPlaylist(self.filename)
-        self.nextsongs = self.loadPlaylist(self.filename)
+        self.nextsongs = self.songs.copy()
+
+
+    def streamPlaylists(self):
+        with self.condition:
+            self.songs = playlist.Playlist()
+            self.nextsongs = self.songs.copy()
+            self.scanning = True
+        scanthread = threading.Thread(target=self.__streamPlaylist, args=(self.musicPath(self.filename),))
+        scanthread.daemon = True
+        scanthread.start()
+        with self.condition:
+            while self.scanning and not self.songs:
+                self.condition.wait()
+            if not self.songs:
+                self.stop()
+                raise FileNotFoundError
+
+
+    def __streamPlaylist(self, music):
+        try:
+            for song in self.scanner.iterate(music):
+                if not self.isOnline():
+                    break
+                with self.condition:
+                    self.nextsongs.appendId(self.songs.append(song))
+                    if self.shuffle:
+                        self.__shuffleIn(self.songs, self.counter + 1)
+                        self.__shuffleIn(self.nextsongs, 0)
+                    self.playlistchanged = True
+                    self.condition.notify_all()
+        finally:
+            with self.condition:
+                if not self.shuffle:
+                    self.songs.sort(self.counter + 1)
+                    self.nextsongs.sort()
+                self.scanning = False
+                self.playlistchanged = True
+                self.condition.notify_all()
+            if self.watch and self.isOnline():
+                self.startWatcher()
+
+
+    def __shuffleIn(self, songs, start):
+        # Inside-out Fisher-Yates: the newest song swaps into a uniformly random slot of songs[start:].
+        if len(songs) - 1 > start:
+            slot = random.randint(start, len(songs) - 1)
+            songs.swap(slot, len(songs) - 1)
+
+
+    def __prepareNextCycle(self):
+        if self.refresh:
+            self.refreshPlaylist()
+        elif self.shuffle or self.removed:
+            cyclethread = threading.Thread(target=self.__rebuildNextCycle)
+            cyclethread.daemon = True
+            cyclethread.start()
+
+
+    def __rebuildNextCycle(self):
+        with self.condition:
+            nextsongs = self.songs.copy()
+            removed = set(self.removed)
+            mark = len(self.songs.table)
+        nextsongs.discard(removed)
+        if self.shuffle:
+            nextsongs.shuffle()
+        with self.condition:
+            for trackid in range(mark, len(self.songs.table)):
+                if trackid not in self.removed:
+                    self.__insert(nextsongs, trackid, 0)
+            self.nextsongs = nextsongs
+
+
+    def __insert(self, songs, trackid, start):
+        if self.shuffle:
+            songs.appendId(trackid)
+            self.__shuffleIn(songs, start)
+        else:
+            songs.insertSorted(trackid, start)
+
+
+    def startWatcher(self):
+        music = self.musicPath(self.filename)
+        if self.watcher or not os.path.isdir(music):
+            return False
+        import watcher
+        self.watcher = watcher.watch(music, self.__watchEvent)
+        self.watcher.start()
+        return True
+
+
+    def __watchEvent(self, event, path, isdir):
+        import watcher
+        if event == watcher.DELETED:
+            with self.condition:
+                if isdir:
+                    self.removed.update(self.songs.table.under(path))
+                else:
+                    trackid = self.songs.table.find(path)
+                    if trackid is not None:
+                        self.removed.add(trackid)
+                self.playlistchanged = True
+                self.condition.notify_all()
+        elif not isdir:
+            self.addSong(path)
+
+
+    def addSong(self, path):
+        if not list(self.scanner.accept(self.scanner.sniff(list(self.scanner.prefilter([path]))))):
+            return False
+        with self.condition:
+            trackid = self.songs.table.find(path)
+            if trackid is not None and trackid not in self.removed:
+                return False
+            trackid = self.songs.table.add(path)
+            self.__insert(self.songs, trackid, self.counter + 1)
+            self.__insert(self.nextsongs, trackid, 0)
+            self.playlistchanged = True
+            self.condition.notify_all()
+        return True
+
+
+    def refreshPlaylist(self):
+        with self.condition:
+            if self.scanning or (self.refreshthread and self.refreshthread.is_alive()):
+                return False
+            self.refreshthread = threading.Thread(target=self.__refreshPlaylist, args=(self.musicPath(self.filename),))
+            self.refreshthread.daemon = True
+            self.refreshthread.start()
+            return True
+
+
+    def __refreshPlaylist(self, music):
+        with self.condition:
+            songs = self.songs.copy()
+        known = set(songs)
+        found = set()
+        added = list()
+        for song in self.scanner.iterate(music):
+            if not self.isOnline():
+                return
+            found.add(song)
+            if song not in known:
+                added.append(song)
+        removed = {trackid for trackid in songs.order if songs.table.path(trackid) not in found}
+        nextsongs = songs.copy()
+        nextsongs.discard(removed)
+        if self.shuffle:
+            nextsongs.shuffle()
+        with self.condition:
+            if removed:
+                self.counter = self.songs.discard(removed, self.counter)
+                self.nextsongs.discard(removed)
+            for song in added:
+                trackid = self.songs.append(song)
+                nextsongs.appendId(trackid)
+                if self.shuffle:
+                    self.__shuffleIn(self.songs, self.counter + 1)
+                    self.__shuffleIn(nextsongs, 0)
+            if not self.shuffle and added:
+                self.songs.sort(self.counter + 1)
+                nextsongs.sort()
+            self.nextsongs = nextsongs
+            self.playlistchanged = True
+            self.condition.notify_all()
+
+
+    def isScanning(self):
+        return self.scanning
+
+
+    def scanStats(self):
+        return self.scanner.stats()
 
 
     def getPlaylist(self):
         songs = list()
-        for index, song in enumerate(self.songs):
-            songs.append(f'{index}: {os.path.split(song)[-1]}')
+        for index in range(len(self.songs)):
+            songs.append(f'{index}: {self.songs.basename(index)}')
         return songs
 
 
     def getSongAt(self, index):
         if index <= len(self.songs):
-            return f'{index}: {os.path.split(self.songs[index])[-1]}'
+            return f'{index}: {self.songs.basename(index)}'
 
 
     def getPlaylistLength(self):
@@ -95,17 +313,28 @@ class Player:
 
 
     def sanityCheck(self, index):
-        if not os.path.exists(self.songs[index]):
-            self.songs[index].pop()
+        trackid = self.songs.trackId(index)
+        if trackid in self.removed:
+            return False
+        elif not self.watcher and not os.path.exists(self.songs[index]):
+            self.removed.add(trackid)
             return False
         else:
             return True
 
 
     def setVolume(self, level):
+        # Levels arrive from the control socket too, so anything but a number is refused and the rest clamped to 0-100.
+        if isinstance(level, bool) or not isinstance(level, (int, float)):
+            raise TypeError(f'volume must be a number from 0 to 100, not {level!r}')
+        level = max(0, min(100, round(level)))
         self.volume = level
-        self.pause()
-        self.play()
+        with self.condition:
+            applied = self.backend.setVolume(level)
+        if not applied:
+            self.pause()
+            self.play()
+        self.__notify(VOLUME)
 
 
     def volumeMax(self):
@@ -127,16 +356,29 @@ class Player:
 
 
     def next(self):
+        skipped = 0
+        with METRICS.timer('next'):
+            while self.__advance() and not self.sanityCheck(self.counter) and skipped < len(self.songs):
+                skipped += 1
+
+
+    def __advance(self):
+        with self.condition:
+            while self.scanning and self.isOnline() and self.counter >= len(self.songs) - 1:
+                self.condition.wait()
         if self.counter < (len(self.songs) - 1):
             self.counter += 1
         elif self.repeat:
-            self.songs = self.nextsongs.copy()
-            self.counter = 0
-            self.nextsongs = self.loadPlaylist(self.filename)
+            with self.condition:
+                self.songs, self.nextsongs = self.nextsongs, self.nextsongs.copy()
+                self.counter = 0
+                self.playlistchanged = True
+            self.__prepareNextCycle()
         else:
             self.stop()
             self.counter = 0
-        self.sanityCheck(self.counter)
+            return False
+        return True
 
 
     def skipNext(self):
@@ -152,17 +394,30 @@ class Player:
 
 
     def seekForward(self):
-        if self.currentsongduration > (self.stepper + 5):
-            self.pause()
-            self.stepper += 5
-            self.play()
+        if self.currentSongDuration() > (self.currentSongStep() + 5):
+            self.seek(5)
 
 
     def seekBack(self):
-        if self.stepper > 5:
-            self.pause()
-            self.stepper -= 5
-            self.play()
+        if self.currentSongStep() > 5:
+            self.seek(-5)
+
+
+    def seek(self, seconds):
+        self.seekTo(self.currentSongStep() + seconds)
+
+
+    def seekTo(self, seconds):
+        seconds = max(0, min(seconds, self.currentSongDuration()))
+        with self.condition:
+            if self.isPlaying() and self.backend.seek(self.currentSong(), seconds):
+                pass
+            elif self.isPlaying():
+                self.pause()
+                self.stepper = seconds
+                self.play()
+            else:
+                self.stepper = seconds
 
 
     def skipTo(self, index):
@@ -191,12 +446,15 @@ class Player:
 
 
     def __shuffle(self):
-        if self.shuffle:
-            random.shuffle(self.songs)
-            random.shuffle(self.nextsongs)
-        else:
-            self.songs.sort()
-            self.nextsongs.sort()
+        with self.condition:
+            if self.shuffle:
+                self.songs.shuffle()
+                self.nextsongs.shuffle()
+            else:
+                self.songs.sort()
+                self.nextsongs.sort()
+            self.playlistchanged = True
+            self.condition.notify_all()
 
 
     def previous(self):
@@ -226,6 +484,7 @@ class Player:
 
     def repeatToggle(self):
         self.repeat = not self.repeat
+        self.__notify(STATE)
 
 
     def repeatState(self):
@@ -235,6 +494,7 @@ class Player:
     def shuffleToggle(self):
         self.shuffle = not self.shuffle
         self.__shuffle()
+        self.__notify(STATE)
 
 
     def shuffleState(self):
@@ -242,23 +502,49 @@ class Player:
 
 
     def end(self):
-        self.onstate = False
-        self.stop()
-        if self.youtubedlprocess and not self.youtubedlcomplete:
-            self.youtubedlprocess.terminate()
+        # Quitting, the loop's cleanup and the front-ends' shutdown all end the player; only the first call does the work.
+        with self.condition:
+            if not self.onstate:
+                return
+            self.onstate = False
+        self.__halt()
+        self.preprober.stop()
+        if self.analyzer:
+            self.analyzer.stop()
+        METRICS.stopDump()
+        if self.watcher:
+            self.watcher.stop()
+        if self.downloads:
+            self.downloads.stop()
+        with self.condition:
+            self.backend.close()
+        self.shutdown.set()
+        self.__notify(STATE)
+
+
+    def waitForEnd(self, timeout=None):
+        return self.shutdown.wait(timeout)
 
 
     def stop(self):
-        self.playstate = False
-        self.stepper = 0
-        time.sleep(0.2)
-        if self.musicprocess and not self.songComplete():
-            self.musicprocess.terminate()
+        self.__halt()
+        self.__notify(STATE)
+
+
+    def __halt(self):
+        with self.condition:
+            self.playstate = False
+            self.stepper = 0
+            self.steppertimer = None
+            self.__interrupt()
 
 
     def play(self):
-        self.playstate = True
-        self.pausestate = False
+        with self.condition:
+            self.playstate = True
+            self.pausestate = False
+            self.condition.notify_all()
+        self.__notify(STATE)
 
 
     def playPauseToggle(self):
@@ -269,11 +555,115 @@ class Player:
 
 
     def pause(self):
-        self.playstate = False
-        self.pausestate = True
-        time.sleep(0.2)
-        if self.musicprocess and not self.songComplete():
-            self.musicprocess.terminate()
+        with self.condition:
+            self.stepper = self.currentSongStep()
+            self.steppertimer = None
+            self.playstate = False
+            self.pausestate = True
+            self.__interrupt()
+        self.__notify(STATE)
+
+
+    def __interrupt(self):
+        self.generation += 1
+        self.backend.interrupt()
+        self.condition.notify_all()
+
+
+    def subscribe(self, callback, events=None):
+        with self.subscriberlock:
+            self.subscribers.append((callback, set(events or EVENTS)))
+            if not self.dispatcher:
+                self.dispatcher = threading.Thread(target=self.__dispatch)
+                self.dispatcher.daemon = True
+                self.dispatcher.start()
+        with self.condition:
+            self.condition.notify_all()
+
+
+    def unsubscribe(self, callback):
+        with self.subscriberlock:
+            self.subscribers = [subscriber for subscriber in self.subscribers if subscriber[0] != callback]
+
+
+    def setTickRate(self, rate):
+        with self.condition:
+            self.tickrate = rate
+            self.condition.notify_all()
+
+
+    def __wants(self, kind):
+        with self.subscriberlock:
+            return any(kind in events for callback, events in self.subscribers)
+
+
+    def __notify(self, kind):
+        with self.subscriberlock:
+            callbacks = [callback for callback, events in self.subscribers if kind in events]
+        if callbacks:
+            event = self.__event(kind)
+            for callback in callbacks:
+                callback(event)
+
+
+    def __event(self, kind):
+        if kind == TRACK:
+            event = {'song': self.currentSong(), 'name': self.currentSongName(), 'index': self.counter, 'duration': self.currentsongduration}
+        elif kind == POSITION:
+            event = {'position': self.currentSongStep(), 'duration': self.currentsongduration}
+        elif kind == PLAYLIST:
+            event = {'length': len(self.songs), 'index': self.counter, 'scanning': self.scanning}
+        elif kind == VOLUME:
+            event = {'volume': self.volume}
+        else:
+            event = self.state()
+        event['event'] = kind
+        return event
+
+
+    def __dispatch(self):
+        # Position ticks only run while something is playing and someone listens, so an idle player never wakes up.
+        nexttick = 0.0
+        playlistdue = 0.0
+        while self.isOnline():
+            with self.condition:
+                now = time.monotonic()
+                ticking = self.isPlaying() and self.steppertimer is not None and self.__wants(POSITION)
+                deadlines = list()
+                if ticking:
+                    deadlines.append(nexttick)
+                if self.playlistchanged:
+                    deadlines.append(playlistdue)
+                if not deadlines:
+                    self.condition.wait()
+                    continue
+                if min(deadlines) > now:
+                    self.condition.wait(min(deadlines) - now)
+                    continue
+                tick = ticking and nexttick <= now
+                changed = self.playlistchanged and playlistdue <= now
+                if tick:
+                    nexttick = now + 1 / self.tickrate
+                if changed:
+                    self.playlistchanged = False
+                    playlistdue = now + PLAYLISTINTERVAL
+            if changed:
+                self.__notify(PLAYLIST)
+            if tick:
+                self.__notify(POSITION)
+
+
+    def state(self):
+        return {'song': self.currentSong() if self.songs else None, 'index': self.counter, 'length': len(self.songs),
+                'position': self.currentSongStep(), 'duration': self.currentsongduration, 'playing': self.isPlaying(),
+                'paused': self.pauseState(), 'online': self.isOnline(), 'volume': self.volume, 'repeat': self.repeat, 'shuffle': self.shuffle}
+
+
+    def upcomingSongs(self, count=10):
+        songs = self.songs[self.counter + 1:self.counter + 1 + count]
+        if self.repeat and len(songs) < count:
+            songs += self.nextsongs[:count - len(songs)]
+        return songs
 
 
     def pauseState(self):
@@ -286,36 +676,148 @@ class Player:
 
     def currentSongDuration(self):
         if not self.currentsongduration:
-            probecommand = [self.prober, '-v', 'quiet', '-of', 'json', '-hide_banner', '-show_entries', 'format=duration', '-i', self.currentSong()]
-            self.currentsongduration = float((json.loads(subprocess.check_output(probecommand)))['format']['duration'])
+            with METRICS.timer('duration'):
+                self.currentsongduration = self.backend.duration(self.currentSong()) or self.metadata.duration(self.currentSong())
             return self.currentsongduration
         else:
             return self.currentsongduration
         
 
+    def currentSongMetadata(self):
+        return self.metadata.lookup(self.currentSong())
+
+
+    def metadataStats(self):
+        return self.metadata.stats()
+
+
+    def startPreprobe(self, workers=2, rate=10):
+        self.preprober.workers = workers
+        self.preprober.rate = rate
+        self.preprober.start(self.songs, self.counter)
+
+
+    def preprobeProgress(self):
+        return self.preprober.progress()
+
+
+    def startLoudnessAnalysis(self, workers=1):
+        if not self.analyzer:
+            return False
+        self.analyzer.workers = workers
+        self.analyzer.start(self.songs, self.counter)
+        return True
+
+
+    def loudnessProgress(self):
+        if not self.analyzer:
+            return None
+        return self.analyzer.progress()
+
+
+    def currentSongGain(self):
+        if not self.loudness:
+            return None
+        return self.loudness.gain(self.currentSong())
+
+
+    def enableMetrics(self, filename=None, interval=instrumentation.DUMPINTERVAL):
+        METRICS.enable()
+        if filename:
+            METRICS.startDump(filename, interval)
+
+
+    def disableMetrics(self):
+        METRICS.disable()
+
+
+    def metricsSnapshot(self):
+        snapshot = METRICS.snapshot()
+        snapshot['scan'] = self.scanner.stats()
+        snapshot['metadata'] = self.metadata.stats()
+        return snapshot
+
+
     def currentSongStep(self):
-        return self.stepper
+        timer = self.steppertimer
+        if timer is None:
+            return self.stepper
+        position = self.backend.position()
+        if position is not None:
+            return position
+        return time.monotonic() - timer
 
 
     def __play(self):
         self.songcomplete = False
         if self.player and self.prober:
             self.currentlyplaying = self.currentSongName()
-            duration = self.currentSongDuration()
-            timer = time.time()
-            stepper = 0
-            command = [self.player, '-nodisp', '-autoexit', '-hide_banner', '-ss', str(self.stepper), '-volume', str(self.volume), self.currentSong()]
-            self.musicprocess = subprocess.Popen(command, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
-            while self.stepper < duration and self.isPlaying():
-                if time.time() >= (timer + stepper):
-                    stepper += 1
-                    self.stepper += 1
-            self.currentsongduration = None
-            if self.stepper >= duration:
+            generation = self.generation
+            # Live backends report the duration from their decoder once started, so only the others probe up front.
+            try:
+                duration = None if self.backend.live else self.currentSongDuration()
+            except PROBEERRORS:
+                with self.condition:
+                    self.currentsongduration = None
+                    if generation != self.generation:
+                        return False
+                    self.stepper = 0
+                return self.__failed(generation)
+            with self.condition:
+                if not self.isPlaying():
+                    return False
+                generation = self.generation
+                self.backend.start(self.currentSong(), self.stepper, self.volume, self.nextSong())
+            if duration is None:
+                # A live backend's decoder reports the duration as soon as it has opened the song.
+                try:
+                    duration = self.currentSongDuration()
+                except PROBEERRORS:
+                    pass
+            with self.condition:
+                announce = False
+                if generation == self.generation:
+                    self.steppertimer = time.monotonic() - self.stepper
+                    self.condition.notify_all()
+                    if self.songended is not None:
+                        METRICS.record('track.gap', time.perf_counter() - self.songended)
+                        self.songended = None
+                    announce = self.announced != (self.counter, self.currentSong())
+                    self.announced = (self.counter, self.currentSong())
+            if announce:
+                self.__notify(TRACK)
+            self.__notify(STATE)
+            played = self.backend.play(None if duration is None else max(duration - self.stepper, 0))
+            with self.condition:
+                self.currentsongduration = None
+                if generation != self.generation:
+                    return False
                 self.stepper = 0
-                self.songcomplete = True
-                return True
-            return False
+                self.steppertimer = None
+                self.backend.finish()
+                if played:
+                    self.failures = 0
+                    self.songcomplete = True
+                    if METRICS.enabled:
+                        self.songended = time.perf_counter()
+                    return True
+            return self.__failed(generation)
+        return False
+
+
+    def __failed(self, generation):
+        with self.condition:
+            METRICS.count('play.failed')
+            self.failures += 1
+            # A streaming scan is still adding songs, so the ones found so far failing isn't a whole cycle failing.
+            if self.failures < len(self.songs) or self.scanning:
+                # Back off before moving on, so a player that can't start doesn't spin through the playlist.
+                backoff = min(FAILUREBACKOFF * 2 ** (self.failures - 1), FAILUREBACKOFFMAX)
+                self.condition.wait_for(lambda: generation != self.generation or not self.isOnline(), backoff)
+                return generation == self.generation
+        # Every song of a whole cycle failed to play in a row; stop rather than loop over them again.
+        self.failures = 0
+        self.stop()
         return False
 
 
@@ -345,6 +847,53 @@ class Player:
             raise ProberNotFound
 
 
+    def __getDecoder(self):
+        if shutil.which("avconv"):
+            return "avconv"
+        elif shutil.which("ffmpeg"):
+            return "ffmpeg"
+        else:
+            return None
+
+
+    def __getBackend(self, backend, live, gapless, sink):
+        if backend is not None and not isinstance(backend, str):
+            return backend
+        # Imported here, like the watcher, loudness and download modules, to keep importing pycli_music cheap.
+        import audio
+        import backends
+        if (backend == backends.PCM or live) and self.decoder:
+            try:
+                if sink is None:
+                    sink = audio.Sink(self.player)
+                elif isinstance(sink, str):
+                    sink = audio.FileSink(sink)
+                return backends.PCMBackend(self.decoder, sink, gapless)
+            except (audio.SinkNotFound, OSError):
+                pass
+        return backends.SubprocessBackend(self.player)
+
+
+    def __getIndex(self, index):
+        if index is True:
+            try:
+                return libraryindex.LibraryIndex()
+            except (OSError, libraryindex.sqlite3.Error):
+                return None
+        elif index:
+            return index
+        else:
+            return None
+
+
+    def __getDownloads(self):
+        with self.condition:
+            if not self.downloads:
+                import downloads
+                self.downloads = downloads.DownloadManager(self.__youtubeDLCommand, self.downloadworkers, finished=self.addSong)
+            return self.downloads
+
+
     def __getYoutubeDL(self):
         if shutil.which("youtube-dl"):
             return True
@@ -361,33 +910,41 @@ class Player:
 
 
     def youtubeDL(self, link, function=None):
-        if self.youtubedl and self.youtubedlcomplete == True and link:
-            if function:
-                youtubedlthread = threading.Thread(target=self.__youtubeDL, args=(link, function))
-            else:
-                youtubedlthread = threading.Thread(target=self.__youtubeDL, args=(link,))
-            youtubedlthread.start()
+        if self.youtubedl and link:
+            METRICS.count('download.queued')
+            return self.__getDownloads().enqueue(link, function).id
+
+
+    def youtubeDLBatch(self, filename, function=None):
+        if self.youtubedl:
+            return [job.id for job in self.__getDownloads().enqueueFile(filename, function)]
+        return list()
 
 
     def isYoutubeDLReady(self):
-        if self.youtubedl and self.youtubedlcomplete == True:
-            return True
-        else:
+        return self.youtubedl
+
+
+    def downloadStatus(self):
+        if not self.downloads:
+            return list()
+        return self.downloads.status()
+
+
+    def cancelDownload(self, jobid):
+        if not self.downloads:
+            return False
+        return self.downloads.cancel(jobid)
+
+
+    def retryDownload(self, jobid, function=None):
+        if not self.downloads:
             return False
+        return self.downloads.retry(jobid, function)
 
 
-    def __youtubeDL(self, link, function=None):
-        self.youtubedlcomplete = False
-        lastline = None
-        command = ['youtube-dl', '-ix', '-o', f"{os.path.join(Path.home(), 'Music')}/%(uploader)s/%(title)s.%(ext)s", f'{link}']
-        self.youtubedlprocess = subprocess.Popen(command, bufsize=1, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL)
-        for line in iter(self.youtubedlprocess.stdout.readline, b''):
-            if line != lastline and line != '':
-                newline = line
-                if function:
-                    function(f'{newline}')
-            lastline = line
-        self.youtubedlcomplete = True
+    def __youtubeDLCommand(self, link):
+        return ['youtube-dl', '-ix', '--newline', '-o', f"{os.path.join(os.path.expanduser('~'), 'Music')}/%(uploader)s/%(title)s.%(ext)s", f'{link}']
 
 
     def nonblockingLoop(self, function=None, *args, **kwargs):
@@ -409,6 +966,9 @@ class Player:
                             function()
                     if self.__play():
                         self.next()
+                with self.condition:
+                    while self.isOnline() and not self.isPlaying():
+                        self.condition.wait()
         except PlayerNotFound:
             raise PlayerNotFound
         except FileNotFoundError:
@@ -427,6 +987,20 @@ if __name__ == '__main__':
         '-r','--repeat' : Repeat all songs indefinitely
         '-s','--shuffle': Shuffle all songs
         '--no-console'  : Suppress console
+        '--scan-workers=N': Sniff music files with N threads
+        '--no-index'    : Don't use the library index in ~/.cache/pycli-music
+        '--live'        : Decode with FFmpeg into one persistent player (live volume)
+        '--sink=FILE'   : Like --live, writing raw PCM to FILE instead of a sound card
+        '--gapless'     : Like --live, decoding the next song ahead for gapless playback
+        '--preprobe'    : Probe all song durations in the background
+        '--normalize'   : Measure loudness (EBU R128) in the background and level songs to -18 LUFS
+        '--stream'      : Start playing as soon as the first song is found
+        '--refresh'     : Rescan for new and deleted songs in the background on every repeat
+        '--watch'       : Add new songs and drop deleted ones as soon as they change on disk
+        '--download-workers=N': Run up to N youtube-dl downloads at once
+        '--daemon'      : Run headless, controlled through control.py over a Unix socket
+        '--socket=PATH' : Control socket for --daemon (default $XDG_RUNTIME_DIR/pycli-music.sock)
+        '--metrics[=FILE]': Time hot paths; with FILE, append a JSON snapshot every 10 seconds
     Short arguments may be combined, such as '-rs'.
     Ctrl-c to exit.
     """
@@ -445,6 +1019,10 @@ if __name__ == '__main__':
         'w', 'pause'            : Pause song
         'repeat'                : Toggle repeat
         'shuffle'               : Toggle shuffle
+        'youtube-dl' links/files: Queue downloads of links, or of every link in a file
+        'downloads'             : List downloads
+        'cancel' N, 'retry' N   : Cancel or retry download N
+        'metrics'               : Show hot-path timings (needs --metrics)
     """
 
     
@@ -452,44 +1030,63 @@ if __name__ == '__main__':
         while True:
             control = None
             control = input(f'\033[{height};0Hpycli-music>>> ')
-            if control == 'skip' or control == 'next' or control == 'k' or control == 'n':
-                player.skipNext()
-            elif control == 'exit' or control == 'quit' or control == 'x' or control == 'q':
-                player.end()
-            elif control == 'back' or control == 'prev' or control == 'e' or control == 'b':
-                player.skipPrevious()
-            elif control == 'stop' or control == 's':
-                player.stop()
-                printout('Stopped.')
-            elif control == 'play' or control == 'p':
-                player.play()
-                if not player.pauseState():
-                    printoutCurrent()
-            elif control == 'pause' or control == 'w':
-                player.pause()
-                printout('Paused.')
-            elif control == 'help' or control == 'h' or control == '?':
-                printout(HELPER2)
-            elif control == 'repeat':
-                player.repeatToggle()
-                printout(f'Repeat {"on" if player.repeatState() else "off"}.')
-            elif control == 'shuffle':
-                player.shuffleToggle()
-                printout(f'Shuffle {"on" if player.shuffleState() else "off"}.')
-            elif control.startswith('youtube-dl'):
-                player.youtubeDL(control.split()[-1], printDownload)
-                printout('Downloading...')
-            elif control == 'up' or control == 'u' or control == '+':
-                player.volumeUp()
-            elif control == 'down' or control == 'd' or control == '-':
-                player.volumeDown()
-            elif control == 'max' or control == 'M':
-                player.volumeMax()
-            elif control == 'mute' or control == 'm':
-                player.volumeMute()
+            with METRICS.timer('console.command'):
+                command(control)
             time.sleep(0.1)
 
 
+    def command(control):
+        if control == 'skip' or control == 'next' or control == 'k' or control == 'n':
+            player.skipNext()
+        elif control == 'exit' or control == 'quit' or control == 'x' or control == 'q':
+            player.end()
+        elif control == 'back' or control == 'prev' or control == 'e' or control == 'b':
+            player.skipPrevious()
+        elif control == 'stop' or control == 's':
+            player.stop()
+            printout('Stopped.')
+        elif control == 'play' or control == 'p':
+            player.play()
+            if not player.pauseState():
+                printoutCurrent()
+        elif control == 'pause' or control == 'w':
+            player.pause()
+            printout('Paused.')
+        elif control == 'help' or control == 'h' or control == '?':
+            printout(HELPER2)
+        elif control == 'repeat':
+            player.repeatToggle()
+            printout(f'Repeat {"on" if player.repeatState() else "off"}.')
+        elif control == 'shuffle':
+            player.shuffleToggle()
+            printout(f'Shuffle {"on" if player.shuffleState() else "off"}.')
+        elif control.startswith('youtube-dl'):
+            jobs = list()
+            for link in control.split()[1:]:
+                if os.path.isfile(link):
+                    jobs.extend(player.youtubeDLBatch(link, printDownload))
+                else:
+                    jobs.append(player.youtubeDL(link, printDownload))
+            printout(f'Queued {len(jobs)} download{"s" if len(jobs) != 1 else ""}.')
+        elif control == 'downloads':
+            printout(' '.join(f'{job["id"]}:{job["state"]}({job["percent"]:.0f}%)' for job in player.downloadStatus()) or 'No downloads.')
+        elif control.startswith('cancel ') and control.split()[-1].isdigit():
+            printout('Cancelled.' if player.cancelDownload(int(control.split()[-1])) else 'Nothing to cancel.')
+        elif control.startswith('retry ') and control.split()[-1].isdigit():
+            printout('Retrying.' if player.retryDownload(int(control.split()[-1]), printDownload) else 'Nothing to retry.')
+        elif control == 'metrics':
+            timers = player.metricsSnapshot()['timers']
+            printout(' '.join(f'{name}:{timer["count"]}x p50={timer["p50"] * 1000:.1f}ms p99={timer["p99"] * 1000:.1f}ms' for name, timer in sorted(timers.items())) or 'No metrics.')
+        elif control == 'up' or control == 'u' or control == '+':
+            player.volumeUp()
+        elif control == 'down' or control == 'd' or control == '-':
+            player.volumeDown()
+        elif control == 'max' or control == 'M':
+            player.volumeMax()
+        elif control == 'mute' or control == 'm':
+            player.volumeMute()
+
+
     def printout(statement):
         if not no_console:
             sys.stdout.write(f'\033[s\033[{height - 1};0H\033[K{statement[:width]}\033[u')
@@ -506,10 +1103,16 @@ if __name__ == '__main__':
         printout(f'Playing song: {player.currentSongName()}')
 
 
+    def printTrack(event):
+        printout(f'Playing song: {event["name"]}')
+
+
     def shutdownfn():
         print('Exiting.')
         if player:
             player.end()
+        if server:
+            server.stop()
         sys.exit(0)
 
 
@@ -524,12 +1127,29 @@ if __name__ == '__main__':
 
 
     signal.signal(signal.SIGINT, sigintHandler)
+    signal.signal(signal.SIGTERM, sigintHandler)
     signal.signal(signal.SIGWINCH, sigwinchHandler)
     width, height = shutil.get_terminal_size()
     no_console = False
     shuffle = False
     repeat = False
     filename = None
+    scanworkers = None
+    index = True
+    live = False
+    gapless = False
+    preprobe = False
+    streaming = False
+    refresh = False
+    watch = False
+    downloadworkers = 2
+    daemon = False
+    socketpath = None
+    metrics = False
+    sink = None
+    normalize = False
+    player = None
+    server = None
     if len(sys.argv) > 1:
         if "--help" in sys.argv or "--?" in sys.argv:
             printout(HELPER)
@@ -543,6 +1163,35 @@ if __name__ == '__main__':
                         repeat = True
                     if "--no-console" in arg:
                         no_console = True
+                    if arg.startswith("--scan-workers="):
+                        scanworkers = int(arg.split('=')[-1])
+                    if "--no-index" in arg:
+                        index = False
+                    if "--live" in arg:
+                        live = True
+                    if "--gapless" in arg:
+                        gapless = True
+                    if "--preprobe" in arg:
+                        preprobe = True
+                    if "--normalize" in arg:
+                        normalize = True
+                    if "--stream" in arg:
+                        streaming = True
+                    if "--refresh" in arg:
+                        refresh = True
+                    if "--watch" in arg:
+                        watch = True
+                    if arg.startswith("--download-workers="):
+                        downloadworkers = int(arg.split('=')[-1])
+                    if "--daemon" in arg:
+                        daemon = True
+                        no_console = True
+                    if arg.startswith("--socket="):
+                        socketpath = arg.split('=', 1)[-1]
+                    if arg.startswith("--sink="):
+                        sink = arg.split('=', 1)[-1]
+                    if arg.startswith("--metrics"):
+                        metrics = arg.split('=', 1)[-1] if '=' in arg else True
                 else:
                     if 's' in arg:
                         shuffle = True
@@ -550,14 +1199,28 @@ if __name__ == '__main__':
                         repeat = True
             else:
                 filename = arg
-    player = Player(filename, shuffle, repeat)
-    print(f'pycli-music: Shuffle: {"On" if shuffle else "Off"} Repeat: {"On" if repeat else "Off"}\n')
+    player = Player(filename, shuffle, repeat, scanworkers, index, live, gapless, streaming, refresh, watch, downloadworkers, metrics, sink=sink, normalize=normalize)
+    scanstats = player.scanStats()
+    print(f'pycli-music: Shuffle: {"On" if shuffle else "Off"} Repeat: {"On" if repeat else "Off"}')
+    if player.isScanning():
+        print(f'Scanning in the background, {player.getPlaylistLength()} songs found so far.\n')
+    else:
+        print(f'Scanned {scanstats["files"] + scanstats["cached"]} files ({scanstats["cached"]} indexed) in {scanstats["elapsed"]:.2f}s ({scanstats["throughput"]:.0f} files/sec, {scanstats["workers"]} workers)\n')
+    if preprobe:
+        player.startPreprobe()
+    if normalize:
+        player.startLoudnessAnalysis()
+    if daemon:
+        import control
+        server = control.ControlServer(player, socketpath)
+        server.start()
+        print(f'Listening on {server.path}')
+    player.subscribe(printTrack, (TRACK,))
+    player.nonblockingLoop()
     if not no_console:
         thread = threading.Thread(target=console)
         thread.daemon = True
-    player.nonblockingLoop(printoutCurrent)
-    time.sleep(0.1)
-    thread.start()
-    while player.isOnline():
-        pass
+        time.sleep(0.1)
+        thread.start()
+    player.waitForEnd()
     shutdownfn()
\ No newline at end of file
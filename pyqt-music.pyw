@@ -1,18 +1,35 @@
 #!/usr/bin/env python
+import os
 import sys
-import PyQt5
-import design
 import time
-import pycli_music
+import threading
+from PyQt5 import QtCore, QtGui, QtWidgets
+import design
+
+# Milliseconds after the last auto-repeat before a held seek button restarts a non-live player.
+SEEKDELAY = 300
 
 
-class MusicGUI(PyQt5.QtWidgets.QMainWindow, design.Ui_MainWindow):
-    def __init__(self):
-        super(PyQt5.QtWidgets.QMainWindow, self).__init__()
+class MusicGUI(QtWidgets.QMainWindow, design.Ui_MainWindow):
+    # Player events arrive on player threads; signals hand them to the GUI thread.
+    playerEvent = QtCore.pyqtSignal(dict)
+    downloadEvent = QtCore.pyqtSignal(object)
+    # The player is built on a worker thread, as loading the library can take a while.
+    playerReady = QtCore.pyqtSignal(object)
+    playerFailed = QtCore.pyqtSignal(str)
+
+    def __init__(self, watch=False, streaming=False):
+        super(QtWidgets.QMainWindow, self).__init__()
         self.setupUi(self)
-        self.player = pycli_music.Player(None, True, True)
-        self.player.nonblockingLoop()
-        self.counter = 0
+        self.watch = watch
+        self.streaming = streaming
+        self.player = None
+        self.duration = 0
+        self.pendingseek = 0
+        self.seektimer = QtCore.QTimer(self)
+        self.seektimer.setSingleShot(True)
+        self.seektimer.setInterval(SEEKDELAY)
+        self.seektimer.timeout.connect(self.applySeek)
         self.playButton.clicked.connect(self.playPauseToggle)
         self.stopButton.clicked.connect(self.stop)
         self.nextButton.clicked.connect(self.next)
@@ -22,24 +39,99 @@ class MusicGUI(PyQt5.QtWidgets.QMainWindow, design.Ui_MainWindow):
         self.volumeSlider.sliderReleased.connect(self.setVolume)
         self.maxButton.clicked.connect(self.maxVolume)
         self.muteButton.clicked.connect(self.muteVolume)
-        self.forwardButton.clicked.connect(self.player.seekForward)
-        self.backButton.clicked.connect(self.player.seekBack)
-        self.repeatBox.stateChanged.connect(self.player.repeatToggle)
-        self.playlistWidget.itemDoubleClicked.connect(self.playlistItem)
+        self.forwardButton.clicked.connect(self.seekForward)
+        self.backButton.clicked.connect(self.seekBack)
+        for button in (self.forwardButton, self.backButton):
+            button.setAutoRepeat(True)
+            button.setAutoRepeatDelay(300)
+            button.setAutoRepeatInterval(100)
+        self.repeatBox.stateChanged.connect(self.repeat)
+        self.playlistView.doubleClicked.connect(self.playlistItem)
         self.youtubedlEdit.returnPressed.connect(self.youtubedl)
-        self.songlabeltimer = PyQt5.QtCore.QTimer()
-        self.songlabeltimer.timeout.connect(self.updateSongLabel)
-        self.songlabeltimer.start(100)
+        self.playerEvent.connect(self.handleEvent)
+        self.downloadEvent.connect(self.updateDownloads)
+        self.playerReady.connect(self.setupPlayer)
+        self.playerFailed.connect(self.showError)
+        self.centralwidget.setEnabled(False)
+        self.songLabel.setText('Loading library...')
+
+
+    def startPlayer(self):
+        loader = threading.Thread(target=self.loadPlayer)
+        loader.daemon = True
+        loader.start()
+
+
+    def loadPlayer(self):
+        # Imported here so the window is on screen before the backend loads and the library scan starts.
+        import pycli_music
+        # Live playback seeks within decoded audio, so scrubbing with the seek buttons starts no processes.
+        try:
+            player = pycli_music.Player(None, True, True, live=True, watch=self.watch, streaming=self.streaming)
+        except FileNotFoundError:
+            self.playerFailed.emit('No music found in ~/Music.')
+            return
+        except (pycli_music.PlayerNotFound, pycli_music.ProberNotFound):
+            self.playerFailed.emit('FFplay and FFprobe (or avplay and avprobe) are needed to play music.')
+            return
+        self.playerReady.emit(player)
+
+
+    def setupPlayer(self, player):
+        import playlistmodel
+        self.player = player
+        self.playlistModel = playlistmodel.PlaylistModel(self.player, self)
+        self.playlistView.setModel(self.playlistModel)
+        self.player.setTickRate(4)
+        self.player.subscribe(self.playerEvent.emit)
+        self.player.nonblockingLoop()
+        self.centralwidget.setEnabled(True)
         self.updatePlayLabel("Playing")
         if not self.player.isYoutubeDLReady():
             self.youtubedlEdit.setEnabled(False)
             self.youtubedlEdit.setText('youtube-dl not found.')
 
 
+    def showError(self, message):
+        self.songLabel.setText(message)
+        QtWidgets.QMessageBox.critical(self, 'pycli-music', message)
+
+
     def youtubedl(self):
-        self.player.youtubeDL(self.youtubedlEdit.text())
-        self.youtubedlEdit.setEnabled(False)
-        self.youtubedlEdit.setText('Downloading...')
+        for link in self.youtubedlEdit.text().split():
+            if os.path.isfile(link):
+                self.player.youtubeDLBatch(link, self.downloadEvent.emit)
+            else:
+                self.player.youtubeDL(link, self.downloadEvent.emit)
+        self.youtubedlEdit.clear()
+        self.updateDownloads()
+
+
+    def seekBack(self):
+        self.queueSeek(-5)
+
+
+    def seekForward(self):
+        self.queueSeek(5)
+
+
+    def queueSeek(self, seconds):
+        if self.player.backend.live:
+            self.player.seek(seconds)
+        else:
+            # Every seek restarts ffplay, so a held button seeks once after it is released.
+            self.pendingseek += seconds
+            self.seektimer.start()
+
+
+    def applySeek(self):
+        seconds, self.pendingseek = self.pendingseek, 0
+        if seconds:
+            self.player.seek(seconds)
+
+
+    def repeat(self):
+        self.player.repeatToggle()
 
 
     def maxVolume(self):
@@ -56,15 +148,15 @@ class MusicGUI(PyQt5.QtWidgets.QMainWindow, design.Ui_MainWindow):
         self.player.setVolume(self.volumeSlider.value())
 
 
-    def playlistItem(self):
-        if self.player.skipTo(self.playlistWidget.currentRow()):
+    def playlistItem(self, index):
+        if self.player.skipTo(index.row()):
             pass
         else:
             self.updatePlaylist()
 
 
     def updatePlaylist(self):
-        self.counter = 0
+        self.playlistModel.refresh()
 
 
     def shuffle(self):
@@ -97,40 +189,55 @@ class MusicGUI(PyQt5.QtWidgets.QMainWindow, design.Ui_MainWindow):
 
 
     def shutdownfn(self):
-        self.player.end()
+        if self.player:
+            self.player.end()
         sys.exit(0)
 
 
-    def updateSongLabel(self):
-        self.songLabel.setText(self.player.currentlyPlaying())
-        songstep = stripLeadingZeros(time.strftime("%H:%M:%S", time.gmtime(self.player.currentSongStep())))
-        duration = stripLeadingZeros(time.strftime("%H:%M:%S", time.gmtime(round(self.player.currentSongDuration()))))
-        timelabeltext = f'{songstep} / {duration}'
-        self.timeLabel.setText(timelabeltext)
-        self.progressBar.setValue((self.player.currentSongStep()/round(self.player.currentSongDuration()))*100)
-        if self.player.firstSong() and self.player.currentSongStep() <= 1:
+    def handleEvent(self, event):
+        if event['event'] == 'track':
+            self.songLabel.setText(event['name'])
+            self.playlistModel.setCurrent(event['index'])
+            self.duration = round(event['duration'] or 0)
+            self.updateTime(0)
+        elif event['event'] == 'position':
+            self.duration = round(event['duration'] or self.duration)
+            self.updateTime(event['position'])
+        elif event['event'] == 'playlist':
             self.updatePlaylist()
-        elif self.counter < self.player.getPlaylistLength():
-            if not self.playlistWidget.item(self.counter):
-                self.playlistWidget.addItem(self.player.getSongAt(self.counter))
+        elif event['event'] == 'volume':
+            self.volumeSlider.setValue(event['volume'])
+        elif event['event'] == 'state':
+            if event['paused']:
+                self.updatePlayLabel("Paused")
+            elif event['playing']:
+                self.updatePlayLabel("Playing")
             else:
-                self.playlistWidget.item(self.counter).setText(self.player.getSongAt(self.counter))
-            self.counter += 1
-        if self.player.isYoutubeDLReady():
-            self.youtubedlEdit.setEnabled(True)
-            if self.youtubedlEdit.text() == 'Downloading...':
-                self.youtubedlEdit.clear()
+                self.updatePlayLabel("Stopped")
+
+
+    def updateTime(self, position):
+        songstep = stripLeadingZeros(time.strftime("%H:%M:%S", time.gmtime(position)))
+        duration = stripLeadingZeros(time.strftime("%H:%M:%S", time.gmtime(self.duration)))
+        self.timeLabel.setText(f'{songstep} / {duration}')
+        if self.duration:
+            self.progressBar.setValue(int(position / self.duration * 100))
+
+
+    def updateDownloads(self, event=None):
+        active = self.player.downloads.active() if self.player.downloads else 0
+        self.youtubedlEdit.setPlaceholderText(f'Downloading {active}...' if active else 'Links or a file of links')
 
 
     def updatePlayLabel(self, string):
         self.playingLabel.setText(string)
-        self.playingLabel.setFont(PyQt5.QtGui.QFont("", weight=PyQt5.QtGui.QFont.Bold))
+        self.playingLabel.setFont(QtGui.QFont("", weight=QtGui.QFont.Bold))
 
 
 def stripLeadingZeros(string):
     strippedstring = string
     for index, char in enumerate(string):
-        if char is not '0' and char is not ':' and char is not ' ':
+        if char != '0' and char != ':' and char != ' ':
             break
         else:
             strippedstring = string[(index + 1):]
@@ -138,8 +245,10 @@ def stripLeadingZeros(string):
 
 
 if __name__ == '__main__':
-    app = PyQt5.QtWidgets.QApplication(sys.argv)
-    form = MusicGUI()
+    app = QtWidgets.QApplication(sys.argv)
+    # '--watch' follows changes to ~/Music, '--stream' shows the window before the library scan finishes.
+    form = MusicGUI('--watch' in sys.argv, '--stream' in sys.argv)
     form.show()
+    QtCore.QTimer.singleShot(0, form.startPlayer)
     app.exec_()
     
\ No newline at end of file
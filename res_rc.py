@@ -1,1196 +1,4 @@
-# -*- coding: utf-8 -*-
+# Kept under the name pyuic5 imports from design.py; the icons themselves live in res.rcc (rebuild with resources.py).
+import resources
 
-# Resource object code
-#
-# Created by: The Resource Compiler for PyQt5 (Qt v5.11.1)
-#
-# WARNING! All changes made in this file will be lost!
-
-from PyQt5 import QtCore
-
-qt_resource_data = b"\
-\x00\x00\x06\xbe\
-\x89\
-\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
-\x00\x00\x30\x00\x00\x00\x30\x08\x06\x00\x00\x00\x57\x02\xf9\x87\
-\x00\x00\x00\x04\x73\x42\x49\x54\x08\x08\x08\x08\x7c\x08\x64\x88\
-\x00\x00\x00\x09\x70\x48\x59\x73\x00\x00\x0e\xc4\x00\x00\x0e\xc4\
-\x01\x95\x2b\x0e\x1b\x00\x00\x00\x19\x74\x45\x58\x74\x53\x6f\x66\
-\x74\x77\x61\x72\x65\x00\x77\x77\x77\x2e\x69\x6e\x6b\x73\x63\x61\
-\x70\x65\x2e\x6f\x72\x67\x9b\xee\x3c\x1a\x00\x00\x06\x3b\x49\x44\
-\x41\x54\x68\x81\xd5\x99\x6b\x6c\x14\x55\x14\xc7\x7f\x77\xb6\x14\
-\x0a\x2d\x6f\x30\x14\xc2\x43\x05\x42\x8a\xa1\xee\x4c\x29\x04\x90\
-\x8a\x6f\xa4\x26\x44\x49\x0c\x6a\xa2\xa2\x12\x34\x0a\x4a\x88\xc6\
-\x18\x35\xa8\x01\x51\x83\x40\xe4\x11\x09\xc4\xd7\x17\xa3\x51\x51\
-\x51\x3e\x88\x21\x52\x4c\x6d\xa7\xad\xad\x3c\xa2\xd5\xa0\x08\xc8\
-\xd3\x74\xcb\xc3\x6d\xeb\x5c\x3f\x9c\xbb\xec\xb4\x6c\x77\x76\x81\
-\xdd\xe2\xff\xcb\x9e\x73\xee\x9d\xb9\xff\xbb\xe7\x9c\xfb\x38\x03\
-\x97\x3f\xde\x02\x3e\xea\x6a\x12\xe9\x42\xf9\xe4\xe1\xc0\x59\x60\
-\x42\x17\x71\x49\x1b\xbd\x80\x7a\x60\x88\xcf\xb6\x1e\xf8\xb8\x6b\
-\xe8\x5c\x18\xde\x01\x36\xfa\xf4\x98\x17\x8a\xbb\x86\x4e\xfa\x18\
-\x0a\x34\x03\x61\x9f\x6d\x1d\xf0\x61\xd7\xd0\x49\x0d\x65\x1d\xf4\
-\xa5\xc0\x76\x9f\x3e\x16\x88\x02\x83\xb3\x45\xa8\x53\x94\x94\x94\
-\x5c\x69\xdb\xf6\x66\xdb\xb6\xbf\x37\xa6\x9e\xc0\x6f\xc0\x4c\x5f\
-\xb7\x7c\xe0\x30\x70\xa3\xcf\xb6\x0b\x78\xd2\xff\x2e\x2b\x93\x44\
-\x3b\xc2\xb6\xed\x9e\xb6\x6d\xbf\xe6\x79\xde\x3e\xe0\x7e\xa0\xd4\
-\x70\x38\x03\xdc\x07\x6c\x00\xfa\x9b\xee\xa7\x80\x35\xc0\x42\xdf\
-\x2b\x36\x03\x0f\xfa\xdf\xe9\x5f\xae\x32\x8a\x70\x38\x3c\x4d\x29\
-\xf5\x36\x12\x0a\xe7\xd0\xa3\x47\x8f\xde\x15\x15\x15\xcd\x46\x7d\
-\x13\x18\x80\x4c\x06\x60\x20\xf0\x3b\x70\x2d\xf0\x33\x71\xaf\xcc\
-\x00\xaa\x20\x0b\x1e\xb0\x6d\xbb\x8f\xe3\x38\x1b\x94\x52\x3b\x3a\
-\x92\x4f\x80\x67\x11\xaf\xc4\xc2\xe6\x38\x92\xb8\x0b\x8c\x7e\x0a\
-\xf8\x04\x98\x1b\x7b\x20\xa3\x13\x08\x87\xc3\xb3\x80\xbd\x5a\xeb\
-\x47\xe8\xc4\xdb\x85\x85\x85\x67\x7c\xea\x19\xe0\x39\x60\x99\xaf\
-\xff\x1a\xe0\x01\x64\x7f\x00\xd8\x0a\xdc\x1c\x7b\x20\x23\x21\x34\
-\x79\xf2\xe4\xbc\x96\x96\x96\xe5\xc0\xe3\x01\x63\x9c\x75\x5d\xb7\
-\x67\x07\x9b\x02\x6a\x80\xe7\x81\xcf\x8d\xad\xde\xe8\x9f\x22\x61\
-\x75\x04\x18\x09\x1c\xe8\xd4\x03\x73\xe6\xcc\x09\x15\x17\x17\xf7\
-\x4d\x97\xbc\xe3\x38\x13\x5b\x5a\x5a\xea\x80\x27\x02\xc8\x83\x84\
-\x44\x47\x68\x43\xf6\x25\xdf\xf3\x5b\x80\x72\x23\x1f\x07\xea\x30\
-\x61\x76\xde\x00\x25\x25\x25\x25\x9e\xe7\xbd\x68\x3a\xe4\x02\x27\
-\x94\x52\x9b\xa2\xd1\xe8\xb2\x86\x86\x86\xbf\x3b\x63\x52\x56\x56\
-\x96\xd3\xdc\xdc\xbc\xd8\x0c\xdc\x2d\x80\x78\x0c\xfb\x5d\xd7\x1d\
-\xd5\x49\x5b\x03\xf0\x28\xf0\x1d\x92\x17\x5b\x90\xe3\x85\x87\x84\
-\xd8\x08\x60\x6e\x3b\x0f\x38\x8e\x33\xcf\xf3\xbc\x0a\x64\x3d\xce\
-\x35\xe6\x01\x5a\xeb\x25\xb9\xb9\xb9\x95\xc5\xc5\xc5\xa3\x13\x8d\
-\xe4\x38\xce\xd8\x48\x24\xb2\x0b\x58\x9e\x06\x79\x48\xec\x81\x18\
-\xde\x03\xee\x35\x72\x95\x21\x3e\xd1\xe8\x3b\xcd\xa4\xe2\x49\xec\
-\x38\xce\x4d\x5a\xeb\x0d\x49\x08\x8c\x0e\x85\x42\x5f\xfa\xc3\xaa\
-\xac\xac\xac\x47\x38\x1c\x5e\xa4\xb5\xae\x51\x4a\x95\xa4\x41\x1c\
-\x00\xa5\xd4\xc9\x24\xcd\xef\x03\x77\x01\x79\x86\xfc\xb7\xc0\x54\
-\xd3\xb6\x1b\xc9\x81\x5e\x16\x40\x69\x69\x69\x6f\xad\xf5\x07\x40\
-\x28\x60\xcc\xd1\xa1\x50\x68\x45\x51\x51\x51\xbe\x6d\xdb\x0b\x9b\
-\x9b\x9b\x1b\x95\x52\x2b\x91\x9d\x34\x6d\x68\xad\x8f\x26\x69\x3e\
-\x84\x24\x73\x6c\xc5\xa9\x45\xf6\x03\x90\xbd\xe1\x14\x30\xce\x02\
-\x68\x6b\x6b\x5b\x0c\x0c\x4a\x71\xdc\x79\x79\x79\x79\x07\x91\x4d\
-\x67\x68\xba\xa4\x3b\xe0\x58\x40\xfb\x76\x60\x9a\x91\xfd\x13\xd0\
-\xc0\x5e\x60\xbc\x85\x84\xd1\xbc\x34\x06\xb5\xb4\xd6\xbd\xd3\x61\
-\x99\x04\x41\x13\xa8\x00\xa6\x18\xb9\x0e\x18\x43\xdc\xdb\x7b\x80\
-\xb1\x96\x6d\xdb\xd3\xb9\xf8\x7f\xf2\x42\x71\x3c\xa0\xbd\x0a\x18\
-\x0f\x74\x37\x7d\x23\xc8\xdd\x00\xe0\x28\x30\xc8\x22\xee\xa2\xac\
-\x23\x20\x07\x40\x2e\x31\x47\x80\x61\x46\x3f\x46\x3c\xd4\x4f\x00\
-\x03\x2c\xe2\x71\x95\x75\x28\xa5\x82\x26\x00\x72\x78\x2b\x34\x72\
-\xc2\x09\x14\x26\x7a\x2a\x1b\xd0\x5a\x9f\x48\xa1\xdb\x21\xda\x4f\
-\x60\xa0\x91\x4f\x02\xfd\x2c\xad\x75\xff\x84\x8f\x65\x01\x4a\xa9\
-\xa0\x24\x06\x39\xe0\xe5\x19\xb9\x0d\xc8\x31\xb2\x06\x94\xa5\x94\
-\xd2\x99\x20\x77\x09\xd1\x0d\x68\x35\x72\x0e\x32\x89\x73\xb2\xa5\
-\x94\x0a\x5a\x09\x32\x06\xad\x75\x2a\x7b\xcf\x79\xa4\x8d\x1c\x02\
-\xfe\xb5\xb4\xd6\x07\x32\x41\x2e\x15\x84\x42\xa1\x54\x2e\xe8\x83\
-\x90\x78\x07\x09\xa5\x7f\x8c\xdc\x0d\xe3\x01\x37\x13\xe4\x52\x81\
-\xe7\x79\xa9\x4c\x60\x14\x72\xe1\x07\xd9\xaf\x0e\x19\x79\x30\x70\
-\xcc\xd2\x5a\xef\xc8\x04\xb9\x14\x11\x14\x42\xdd\x90\x23\xf4\x1f\
-\x46\x1f\x0a\xfc\x69\xe4\x21\xc0\x61\xcb\x75\xdd\x4a\xe0\x97\xcc\
-\xf0\x4b\x0e\xa5\x54\x90\x07\xc2\xc0\x3e\x24\x89\xfb\x22\x97\xfa\
-\x98\x07\x64\x02\x00\x5a\xeb\xb5\x69\x8c\xdb\x86\x54\xcd\x2e\x1a\
-\x29\x24\xf1\x14\xe4\xec\x0f\x70\x0d\xb0\x1f\x59\x56\x41\x76\xe7\
-\x83\x16\x40\x24\x12\x59\x47\x3c\xce\x82\xf0\x46\x4e\x4e\xce\x30\
-\x60\x11\xf0\x57\x3a\x84\x13\x20\xc8\x03\x33\x90\x1b\x19\xc8\x89\
-\xa1\xd6\xd7\x56\x04\xec\xb1\x00\x1a\x1b\x1b\xa3\x96\x65\xdd\x89\
-\x9c\x3d\x92\xa1\xb2\xa9\xa9\xe9\x85\xca\xca\xca\x88\xeb\xba\xab\
-\x5a\x5b\x5b\xaf\x56\x4a\x3d\x9d\xc2\x73\x09\x11\x10\x42\x7d\x91\
-\x73\xda\xd7\xbe\x09\xd4\x19\xf9\x0a\x24\x7f\x76\x9f\xbb\x91\x55\
-\x55\x55\xd5\x69\xad\x67\x03\x4d\x89\xde\xa6\xb5\xde\xe5\x79\x5e\
-\x79\x63\x63\x63\x34\x66\xab\xaf\xaf\x3f\x5d\x5d\x5d\xbd\xc2\xf3\
-\x3c\x07\x48\x7b\x35\x0b\x38\x05\xcc\x46\xee\x03\x11\xa3\x4f\x27\
-\xee\x8d\xf1\x48\x2e\x9c\x6c\x77\x27\xae\xa9\xa9\xd9\xe6\x79\xde\
-\x04\x60\x2d\xf0\x2b\x10\x51\x4a\x55\x03\x8f\x45\xa3\xd1\xeb\x6b\
-\x6b\x6b\x13\x6e\xfd\xb5\xb5\xb5\x7b\x0a\x0a\x0a\x26\x01\xcf\x10\
-\xdf\x35\x53\x41\x7e\x92\xb6\x05\xc4\x4b\xec\x63\x91\x70\x8b\xd5\
-\x52\xa7\x02\x95\x90\x81\xba\x90\x6d\xdb\xa5\xc0\xbb\xc8\xe5\x23\
-\x08\x11\xd7\x75\xfb\x24\xb0\x4f\x46\x2e\xf5\x63\x90\xfb\xf0\x22\
-\x24\x1f\xee\x30\xed\xdb\x81\xcf\x80\x55\x97\xbc\x32\xe7\xba\x6e\
-\x65\x6e\x6e\x6e\x31\xb0\x1a\x39\x70\x25\x43\x3e\x89\xff\xc4\x97\
-\x81\x57\x11\xf2\x00\x77\x13\xff\x42\xd3\x1d\x98\x04\xec\xa0\x93\
-\x87\x2f\x19\x1c\xc7\x99\xa9\xb5\xde\x48\xfb\xcf\x45\xed\xd0\xda\
-\xda\x9a\x5f\x5f\x5f\x7f\xda\x67\xba\x1d\x78\x1d\x59\x36\xdb\x80\
-\xab\x90\x1a\xd1\x10\x24\x3f\x6f\x03\x36\x21\x9b\x9a\x97\xd1\xda\
-\x68\x75\x75\xf5\x56\x60\x1c\xe2\x0d\xaf\x93\x6e\xbd\x7c\x72\x08\
-\xa9\x2d\x2d\x21\x7e\x68\x7b\x18\x09\x97\xd8\xe2\x32\xdb\xe8\x1e\
-\x64\xa1\x3a\xed\xba\x6e\x93\xeb\xba\x0b\x91\x55\x64\x6f\x40\xf7\
-\xa7\x90\x2b\xe4\x17\x46\x2f\x00\xe6\x23\x15\x10\x90\xd3\x68\x39\
-\x52\x23\x05\xb2\xf8\x81\xc3\x75\xdd\x9d\x05\x05\x05\x61\xad\xf5\
-\x2b\xc8\xa7\xa2\x18\x62\xe1\x53\x04\x2c\xa6\x7d\x85\xe4\x21\xe0\
-\x47\xcc\x8a\x03\xcc\x32\xbf\xdf\x64\x92\x6b\x20\x6c\xdb\x1e\x1e\
-\x0e\x87\xd7\xdb\xb6\x5d\x6d\x4c\x79\xc8\x99\xe7\x1e\x5f\xb7\x10\
-\xb2\x94\x97\xfb\x6c\x5f\x21\xdf\xce\x2e\x4b\x5c\xd7\x41\x9f\x0f\
-\xfc\x44\x3c\x4a\x46\x21\x7b\xcc\x88\x6c\x92\xba\x50\xf4\x43\x2e\
-\xf0\xb7\xf8\x6c\xcb\x90\x0a\xf5\xff\x02\xab\xf1\x25\x2a\xd0\x07\
-\x29\xa3\xdc\xda\x35\x74\xd2\x43\x1e\x52\xd4\x1d\xe9\xb3\x2d\x05\
-\x7e\x20\x8b\x1f\x25\x2f\x16\x7e\xa2\x03\x91\x03\xdd\x0d\x5d\xc4\
-\xe5\xa2\xb1\x12\xd8\xd6\x59\xe3\x7f\x58\x66\xc6\xa7\xf2\xed\x68\
-\xf2\x00\x00\x00\x00\x49\x45\x4e\x44\xae\x42\x60\x82\
-\x00\x00\x05\xb4\
-\x89\
-\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
-\x00\x00\x30\x00\x00\x00\x30\x08\x06\x00\x00\x00\x57\x02\xf9\x87\
-\x00\x00\x00\x04\x73\x42\x49\x54\x08\x08\x08\x08\x7c\x08\x64\x88\
-\x00\x00\x00\x09\x70\x48\x59\x73\x00\x00\x0e\xc4\x00\x00\x0e\xc4\
-\x01\x95\x2b\x0e\x1b\x00\x00\x00\x19\x74\x45\x58\x74\x53\x6f\x66\
-\x74\x77\x61\x72\x65\x00\x77\x77\x77\x2e\x69\x6e\x6b\x73\x63\x61\
-\x70\x65\x2e\x6f\x72\x67\x9b\xee\x3c\x1a\x00\x00\x05\x31\x49\x44\
-\x41\x54\x68\x81\xcd\x5a\x4d\x68\x5c\x55\x14\xfe\xbe\xfb\xa6\x93\
-\x4c\x9b\x46\x94\x16\x51\xa1\x82\x60\x35\x54\x43\xfa\x5e\x47\x89\
-\xa5\x34\xba\x10\x04\x5d\x94\x76\x51\xe8\xa6\x45\x2c\x2a\x5a\x70\
-\x61\x41\x44\x0a\x22\xa2\xd0\x0a\x8a\xa5\xad\x4a\x41\xd0\x6e\x5c\
-\xf9\x03\x8a\x0b\x71\x23\x31\x9d\xf7\x68\x37\x59\x55\xa5\x45\x44\
-\x6d\x55\x62\xd3\xa4\x99\x49\xe6\x7e\x2e\xe6\xbd\xf4\x65\x32\x33\
-\x99\x79\xf7\x85\xfa\xc1\x70\x67\xde\x3d\xf7\x9c\xfb\xdd\xf3\xce\
-\xfd\x39\x77\x08\x47\x04\x41\x30\x01\xa0\x1c\xff\xfc\x03\x80\x05\
-\xb0\x16\x80\x97\x41\x5d\x2d\xfe\x14\x01\x6c\x00\x20\x00\x27\xa3\
-\x28\x7a\xbe\x5d\x83\x42\x06\x23\xcd\x18\x02\xc0\xf8\xfb\x1d\x39\
-\xe8\x4b\x83\x00\x76\x76\x12\x70\x26\x20\xe9\x2a\xc9\xf5\x00\x2e\
-\x01\x78\x07\xc0\x20\x1a\x23\x98\x09\x24\xaf\x49\x22\x80\xc3\x00\
-\x6e\x03\x30\xdd\x49\xde\x99\x00\xc9\x8b\x00\xee\x02\xf0\x6d\x14\
-\x45\xef\xb9\xea\x4b\x10\x04\xc1\x63\x00\x1e\x07\xf0\x53\x27\x39\
-\x93\x83\xad\x64\x10\xd6\xe4\xa0\x6b\x99\x5e\x92\x1d\x07\xd9\x99\
-\x80\x24\x2f\x5d\xe6\x05\x49\x49\xc7\x57\x97\x80\x31\xa6\x10\x97\
-\xb9\x7a\x20\xd1\x8b\x15\x3c\x9b\x87\x07\x92\x19\x88\x1d\x05\x7b\
-\x84\xb5\xb6\x2b\x7d\x79\xc4\xc0\x4d\x45\x1e\xb3\x90\x24\x65\x6a\
-\x5b\x2e\x97\x77\x5a\x6b\x9f\x01\xb0\x09\xc0\x2d\x00\x4a\x00\xaa\
-\x92\xaa\x24\x37\x03\x80\xa4\x1d\xbe\xef\x87\x24\xfb\x01\x14\x25\
-\xcd\x02\xf8\xd7\x18\x73\x81\xe4\xa9\x3c\x16\x32\x35\x95\x5d\x61\
-\xfb\xf6\xed\xeb\xab\xd5\xea\x37\x00\xfa\x9b\xeb\xc8\x25\x6f\xcf\
-\xad\x24\x83\xe6\x3a\x49\x3b\x24\xed\xcb\x23\x06\x32\xb5\x9b\x9a\
-\x9a\xaa\xa2\x47\xd2\x4d\x20\x80\xd9\x9b\x16\x03\x93\x93\x93\x35\
-\x49\x1f\x03\xa8\x66\x54\x71\x1d\xc0\x71\x67\x02\x4d\xee\xee\x15\
-\xaf\xa3\xb1\xf9\xcb\x62\x77\xa1\x50\x28\x1c\xcd\xc3\x03\x99\xa7\
-\xd1\x28\x8a\x7e\x07\x70\x82\xe4\x6c\x8f\x4d\x67\x24\xbd\x39\x31\
-\x31\x71\xf5\xff\x30\x8d\xbe\x66\xad\xbd\xd6\x4b\x03\x49\x57\x00\
-\x1c\x03\xf2\x5d\xc8\x32\x21\x8a\xa2\x59\x63\xcc\x7e\x49\x33\x5d\
-\x36\x99\x35\xc6\x1c\x88\xa2\x68\x1e\xc8\x81\x00\xc9\x4c\xd3\x68\
-\x1a\x61\x18\x7e\x0d\xe0\x47\x92\x0b\x9d\xe4\x24\xd5\x48\x7e\x19\
-\x86\xe1\xf7\xc9\x33\x67\x02\xd6\xda\x7a\x5c\x76\x34\xbe\x12\x3c\
-\xcf\x3b\x28\x69\xbe\x93\x0c\xc9\x79\x49\x2f\xa5\x9f\xe5\xe1\x81\
-\x85\xb8\xac\xbb\xe8\xa9\x54\x2a\xbf\x00\x38\x03\x60\xae\x8d\xc8\
-\x75\x92\xef\xc6\x81\xbf\x88\x3c\x82\x38\x19\xf9\x8e\xa3\xd7\x0d\
-\xac\xb5\xaf\x00\x68\x37\x10\x35\xcf\xf3\xde\x6e\x7e\x98\x87\x07\
-\x36\xc4\xe5\xed\xae\xba\xce\x9d\x3b\x77\x05\x8d\x63\x69\x73\x40\
-\xcf\x90\x7c\x75\x62\x62\xe2\x6a\x73\x9b\x3c\x3c\x50\x02\x00\x6b\
-\x33\xad\x47\xcb\x30\x37\x37\xf7\x06\x80\x3f\x53\x8f\x24\xe9\xe7\
-\x30\x0c\x4f\xb4\x92\xef\x48\x60\xeb\xd6\xad\xbb\x83\x20\xb8\x1c\
-\x04\xc1\x87\xed\x64\x24\xfd\x10\x7f\xfd\xae\xdb\x4e\x6e\xd9\xb2\
-\x65\xc0\xf7\xfd\xa7\xca\xe5\xf2\x48\x73\xdd\xe4\xe4\x64\xcd\x18\
-\xb3\x17\xa9\x57\xd3\x5a\xbb\x07\x6d\x56\xec\xb6\x04\x46\x46\x46\
-\xee\x35\xc6\x9c\x01\xb0\x11\xc0\x81\x72\xb9\xfc\x5c\x2b\xb9\x62\
-\xb1\xf8\x02\x80\xa1\xc1\xc1\xc1\x93\xdd\x12\x28\x95\x4a\xbb\x48\
-\x7e\x61\xad\xfd\xa8\x55\x7d\xa5\x52\xa9\x58\x6b\xf7\x92\x1c\xf7\
-\x3c\xef\x89\xf3\xe7\xcf\x5f\x68\xa7\xab\xdd\x22\x64\x82\x20\x38\
-\x0b\xc0\x4f\xc9\xcc\x18\x63\x86\xe3\xd9\xc2\x09\xbe\xef\x9f\x22\
-\x79\x90\xe4\x5c\x18\x86\x25\x17\x5d\x2d\x3d\xe0\xfb\xfe\xd3\x92\
-\xee\xc3\x52\x82\x7d\xf5\x7a\xfd\x03\x17\x63\x29\xd4\x00\x40\xd2\
-\x5f\xae\x8a\x96\x11\x18\x1d\x1d\x2d\x91\x7c\x8b\xe4\x40\x53\x55\
-\x81\xe4\xc3\x41\x10\x3c\xea\x6a\x54\xd2\x74\x5c\x5e\x77\xd5\xb5\
-\x8c\xc0\xfc\xfc\xfc\x61\x00\x7d\x6d\xe4\x07\x24\xbd\x0f\xc7\x03\
-\x7c\x92\xc1\x20\xe9\x9c\x8a\x59\x42\x20\x08\x82\x0d\x92\x5e\x06\
-\xb0\xae\x5d\x03\x92\x9b\x7c\xdf\xdf\xe5\x62\x54\x52\x92\x2a\x71\
-\x3e\xd2\x2e\x21\x40\xf2\x18\x56\xce\x2a\x0f\x90\x3c\x3e\x3a\x3a\
-\xea\x12\x7c\x5e\x53\x99\x19\x8b\x04\xca\xe5\x72\x59\xd2\x1e\xb4\
-\x38\x64\xb7\xc0\x60\xad\x56\x3b\x92\xd9\xa8\x31\xc9\x2b\xe8\x72\
-\x26\x6e\xe8\x02\x80\xb1\xb1\xb1\x42\xbd\x5e\xff\x14\xf1\xaa\xda\
-\x05\xd6\x02\x78\x31\x08\x82\xfb\xb3\x18\xcd\x6b\xd5\x06\x62\x02\
-\xd3\xd3\xd3\x87\x48\xde\x89\xde\x82\xb3\x4f\xd2\xe9\x8c\x76\x9d\
-\x47\x3e\x81\x19\x1e\x1e\x5e\x07\xe0\x08\x3a\x04\x6e\x1b\x78\x00\
-\x1e\xdc\xb6\x6d\xdb\x58\xaf\x46\x53\x87\x20\x67\x98\xbe\xbe\xbe\
-\x43\xc8\x18\x4c\x24\x07\x24\x1d\xcd\xab\x33\x59\x60\xac\xb5\xcf\
-\xa2\xf7\xd1\x4f\x63\x28\x08\x82\x4d\xbd\x34\x70\x3d\x47\xa7\x61\
-\xd0\x48\x10\xf5\x9a\xd6\x48\x3a\x52\x93\x64\xbb\xcd\x24\xaf\x06\
-\x0a\xc5\x62\xf1\x91\x6a\xb5\xba\x1b\xc0\x66\x92\x1b\xe3\xfb\xae\
-\x9a\xa4\xaa\xa4\x87\x48\x0e\x01\x98\x02\xf0\x39\x1a\xb9\xfa\x12\
-\x1a\xa4\xff\x26\xf9\x9b\x31\xe6\xab\x4a\xa5\x72\xa9\x47\xbb\xb9\
-\x11\x2e\x8c\x8f\x8f\xff\x03\xa0\xe5\x7e\xdf\xf7\xfd\xd3\x00\x86\
-\x48\x5e\x0e\xc3\x70\x7f\x5e\x46\xf3\x44\x57\x27\xb2\x3c\xdf\x59\
-\x00\x30\x66\xd1\xac\xb3\xde\x8e\x04\x8c\x31\xc9\x8a\x93\xdf\xca\
-\x03\x40\x92\x05\x00\x92\xce\x7a\x3b\x12\x48\xe5\x7a\x9c\x52\x26\
-\xcd\x90\xb4\x90\x2e\x5d\xb0\x92\x07\x92\x54\x89\xb3\xa1\x36\x7a\
-\x9d\x07\x66\xa5\x18\x58\x15\x0f\xe4\xe9\xd9\x8e\xfb\x71\x6b\xed\
-\x50\x9c\xff\x7f\xc0\xf7\xfd\x4f\x3c\xcf\x5b\x3c\x41\xd5\xeb\xf5\
-\xf5\x24\xfb\x49\xce\x59\x6b\x6b\x9e\xe7\x2d\x5e\x54\x48\xf2\x24\
-\x15\x01\xac\x8d\xef\xd0\xa6\x93\x51\x97\x64\x25\x3d\x09\x00\x24\
-\xef\x5e\x55\x02\xb8\x71\x7b\xb2\x86\xe4\xbe\xf4\x2e\x32\x75\x57\
-\x05\x92\x6d\x77\x98\xc9\x15\x54\xab\xfa\x3c\x2e\xc7\x3b\x12\xf0\
-\x3c\xef\x33\x6b\xed\x4e\x34\x16\xb0\x5f\x91\xca\x98\xc5\xfb\xa0\
-\x64\x1a\x4c\x3a\x32\x83\xc6\x1f\x3d\xd6\xa0\xb1\xe3\x4c\x7a\x5d\
-\xc5\x8d\x83\x3c\x48\xde\x03\xa0\x5f\xd2\x59\x57\x02\xff\x01\x51\
-\xb3\xf1\xca\x2f\xef\x3b\x28\x00\x00\x00\x00\x49\x45\x4e\x44\xae\
-\x42\x60\x82\
-\x00\x00\x03\xed\
-\x89\
-\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
-\x00\x00\x30\x00\x00\x00\x30\x08\x06\x00\x00\x00\x57\x02\xf9\x87\
-\x00\x00\x00\x04\x73\x42\x49\x54\x08\x08\x08\x08\x7c\x08\x64\x88\
-\x00\x00\x00\x09\x70\x48\x59\x73\x00\x00\x0e\xc4\x00\x00\x0e\xc4\
-\x01\x95\x2b\x0e\x1b\x00\x00\x00\x19\x74\x45\x58\x74\x53\x6f\x66\
-\x74\x77\x61\x72\x65\x00\x77\x77\x77\x2e\x69\x6e\x6b\x73\x63\x61\
-\x70\x65\x2e\x6f\x72\x67\x9b\xee\x3c\x1a\x00\x00\x03\x6a\x49\x44\
-\x41\x54\x68\x81\xed\x98\x4d\x6c\x1b\x45\x14\x80\xbf\x37\x59\x43\
-\x10\xa5\x70\x47\xa8\xf2\x01\x21\x1a\x09\x14\xcf\x46\x95\x6a\x24\
-\x72\x83\x13\x07\x4a\x2e\x14\x2e\x44\x6a\x91\xb8\xf2\x7b\x28\x2a\
-\x48\x2d\x0d\x1c\x9b\x1b\x1c\x29\x89\x1a\x4e\x80\x80\x1e\x90\x90\
-\x0a\xa4\x49\x77\xc7\x26\x15\x3f\xe5\xc7\x82\x5e\x10\x34\x12\x84\
-\x0a\x62\xc9\xec\x3e\x0e\x49\x2b\x63\x76\x9d\x5d\x7b\xdb\x12\xb1\
-\xdf\xc5\xd2\xbc\x37\xdf\xcc\x78\xc6\xd6\x9b\x81\x92\x92\x92\x92\
-\x92\xff\x3d\x63\x63\x63\x37\x6c\x07\x67\x12\x62\xad\x9d\x02\xe6\
-\x81\xef\x81\xb9\x38\x8e\x67\x1b\x8d\xc6\xc5\x61\xa4\xbe\xef\xef\
-\x53\xd5\x93\x9b\xce\xf9\x4e\xa7\x33\xbb\xb2\xb2\xf2\x4b\x01\xf3\
-\xfd\x17\x06\x78\x74\xf3\xf3\x4e\xe0\x45\x63\x4c\xcb\x5a\x7b\xb4\
-\x5e\xaf\xdf\x32\x84\xb7\xdb\x79\xa8\x52\xa9\xb4\xac\xb5\xaf\x0c\
-\xe9\x4c\xc4\x00\xf7\xf4\xb4\xed\x00\x5e\x68\xb7\xdb\x5f\xd7\x6a\
-\xb5\xfd\x83\x48\x55\xb5\xd7\x79\x33\xf0\x7c\xbb\xdd\x3e\x5f\xab\
-\xd5\x1e\x1b\xc4\x99\x86\x58\x6b\xd7\x80\x9d\xa9\x09\x22\x1f\xaa\
-\xea\xc1\x30\x0c\x2f\x64\x95\x5a\x6b\x7f\x05\x6e\xeb\x93\x72\x0a\
-\x38\x90\xc7\x99\x86\x61\xe3\xdb\x49\x45\x55\x1f\x04\xce\xf9\xbe\
-\x7f\x10\x90\x8c\xde\x1d\x5b\xc4\x1f\x00\xce\x59\x6b\x9f\xcc\xe1\
-\x4c\x44\xac\xb5\x11\x1b\x0b\xc9\xc2\x27\x23\x23\x23\xd3\xcb\xcb\
-\xcb\xdf\xf4\x4b\xb2\xd6\x76\x00\x2f\xa3\xf3\x53\x11\x99\x0e\x82\
-\xe0\x7c\xc6\xfc\x7f\x60\x80\xbf\x72\xe4\xdf\x17\x45\x51\xd3\x5a\
-\xfb\xdc\xd4\xd4\xd4\x48\x9f\xbc\x3c\xce\xba\xaa\x36\x32\x38\x13\
-\x31\xc0\x7a\xce\x3e\x37\x01\xc7\x5a\xad\x96\xf3\x7d\x7f\x1f\xc9\
-\xbb\x37\xa8\xb3\xe1\xfb\xfe\x23\x29\xce\x44\xc4\x5a\xfb\x03\xb0\
-\x2b\xe7\x80\xdd\x7c\x21\x22\xaf\x56\xab\xd5\x13\x0b\x0b\x0b\x11\
-\x80\xb5\xb6\x05\x54\x8b\x74\xa6\x21\xd6\xda\x26\x70\xef\x10\x83\
-\x5d\xe6\x4b\x11\x99\xa9\x56\xab\x27\x5a\xad\xd6\x59\x60\xbc\x48\
-\x67\xda\x42\xa4\x56\xab\x7d\x2c\x22\xf7\x17\x30\xd8\x95\x41\x55\
-\x15\x11\xd9\x5d\xa0\xf3\x2b\x55\x7d\xc9\x39\x77\x12\xd0\xee\x80\
-\x11\x91\xdf\x0a\x1c\x08\x60\x77\xc1\x93\x07\xb8\x5b\x44\xe6\xad\
-\xb5\x8b\x13\x13\x13\x7b\xbb\x03\x06\x28\x7a\x01\x57\x93\x3d\x71\
-\x1c\x9f\xf6\x7d\x7f\xf6\x72\x59\xb2\xdd\x16\x00\x60\x54\xf5\xa9\
-\x76\xbb\xbd\x38\x3e\x3e\xbe\xeb\x6a\x1c\xa1\x6b\xc5\x98\x31\xe6\
-\x9d\xcc\xff\xb7\xff\x51\xd6\x0c\x70\xeb\xf5\x9e\xc5\x20\x88\xc8\
-\x22\xf0\xf0\x76\x5c\x40\x07\x98\x59\x5f\x5f\x9f\x0c\xc3\x70\xd5\
-\x8b\xe3\x78\xa7\xc8\x50\x05\xe1\xb5\xe4\x3d\x11\x79\xba\xbb\xf0\
-\xf3\x28\x78\x07\x54\xf5\x33\x11\xb9\x11\xb0\x45\x39\x45\x64\x31\
-\x8a\xa2\x43\x8d\x46\xe3\xa3\xde\x98\x31\xc6\xf4\xbb\x78\xe4\xe1\
-\x8c\xaa\x3e\xe4\x9c\xab\x03\x7d\xeb\x97\xbc\xce\x20\x08\xf6\x26\
-\x4d\x1e\xc0\x53\xd5\x61\x77\xe0\x8c\xaa\x1e\x75\xce\xbd\xdb\xd5\
-\x36\xac\xf3\x73\xe0\x48\x18\x86\x6f\xd3\x53\x3a\xf4\xe2\xd1\xe7\
-\x3a\xb9\x05\xcb\x22\x72\x38\x08\x82\x0f\x12\x62\x03\x39\x55\xf5\
-\xac\x31\xe6\x70\x10\x04\xef\x67\xed\xe3\xb1\x51\x8b\xe7\xe1\x4f\
-\xe0\xe5\x30\x0c\x5f\x03\xe2\x94\x9c\x81\x9c\xce\xb9\x7e\xce\x44\
-\x3c\x20\xcf\x2d\xe8\xb4\xaa\x3e\xe1\x9c\xfb\x6e\x8b\xbc\x5c\xce\
-\x28\x8a\xa6\x9b\xcd\xe6\xb7\x39\xfa\x5c\xc1\x23\xdb\x0f\x6e\x4d\
-\x55\x9f\x71\xce\xbd\xc1\x16\x67\x72\x93\x2c\xce\xdf\x37\x9d\xaf\
-\x67\x74\x26\xe2\x01\x97\xe8\x7f\x66\x4f\x01\x07\x9c\x73\x79\x9e\
-\x40\x2e\x91\xe1\x59\x25\xa7\x33\x11\x0f\x58\x05\x6e\x4f\x88\xfd\
-\xa4\xaa\xcf\x3a\xe7\xde\x1c\xc0\xbb\x0a\xdc\x51\xb0\x33\x11\x03\
-\x34\x7b\xda\xfe\x00\x8e\x8d\x8e\x8e\xde\x35\xe8\x40\x22\x92\xe4\
-\x9c\x19\xc6\x99\x86\x07\xbc\x05\xec\x07\x7e\x04\xe6\x3a\x9d\xce\
-\xf1\x02\x1e\x62\xe7\x80\xc7\x81\x0b\xaa\x3a\x57\xa9\x54\x8e\x2f\
-\x2d\x2d\xfd\x3c\xa4\x33\x9d\xc9\xc9\xc9\xac\x8f\x50\xd7\xd5\x59\
-\x52\x52\x52\x52\x52\xd2\xcb\xdf\xe5\x94\x5b\x13\x12\xa8\x24\x46\
-\x00\x00\x00\x00\x49\x45\x4e\x44\xae\x42\x60\x82\
-\x00\x00\x04\x63\
-\x89\
-\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
-\x00\x00\x30\x00\x00\x00\x30\x08\x06\x00\x00\x00\x57\x02\xf9\x87\
-\x00\x00\x00\x04\x73\x42\x49\x54\x08\x08\x08\x08\x7c\x08\x64\x88\
-\x00\x00\x00\x09\x70\x48\x59\x73\x00\x00\x0e\xc4\x00\x00\x0e\xc4\
-\x01\x95\x2b\x0e\x1b\x00\x00\x00\x19\x74\x45\x58\x74\x53\x6f\x66\
-\x74\x77\x61\x72\x65\x00\x77\x77\x77\x2e\x69\x6e\x6b\x73\x63\x61\
-\x70\x65\x2e\x6f\x72\x67\x9b\xee\x3c\x1a\x00\x00\x03\xe0\x49\x44\
-\x41\x54\x68\x81\xed\x98\x4d\x68\x5c\x55\x14\x80\xbf\xf3\xe6\x99\
-\xa6\x35\xcd\x54\xa5\x10\xa8\x7f\x59\x14\x8b\x31\x38\xbc\x3b\xd9\
-\x18\x02\x59\x08\xee\x04\xc1\xe9\x46\xba\xb0\x62\x76\xba\x28\x6a\
-\xdd\x15\x05\xa1\x12\xb1\xda\x95\x7f\x54\x2a\x15\x2d\x59\x0a\x52\
-\xd1\xc5\x48\x1b\x35\xe4\xbd\x97\x09\x36\xfe\x60\xfb\x10\xdb\x68\
-\xd0\x2e\x4c\x83\xfd\x49\xe6\xbd\xe3\x22\xd3\x1a\xc3\xcc\xdc\x79\
-\x33\x03\x6d\x74\xbe\xe5\x3d\xf7\x7d\xe7\x9e\xb9\x97\x3b\xef\x1d\
-\xe8\xd0\xa1\x43\x87\x0e\xff\x67\x04\xc0\x18\x93\x0d\x82\x60\x09\
-\x48\xda\x25\xce\xe5\x72\xdb\x4a\xa5\xd2\x22\xa0\xcd\x3a\x0a\x85\
-\x42\x26\x8a\xa2\x9d\x22\xd2\x07\xac\x24\x49\x72\xc5\x71\x9c\xab\
-\x71\x1c\x2f\x65\xb3\xd9\xf9\x62\xb1\x58\x16\xcf\xf3\x9e\x10\x91\
-\x63\xc0\x3c\x70\xdc\x75\xdd\x43\x53\x53\x53\xe7\x5b\x59\xbc\xe7\
-\x79\x4f\x8b\xc8\x3b\xc0\x39\x55\xfd\x48\x44\xde\x08\x82\xe0\xb7\
-\xb4\x9e\x7c\x3e\x7f\x44\x55\x9f\xac\x11\x5e\x06\x8e\x3a\xc0\xee\
-\xca\xc0\x0e\x60\x5f\xb9\x5c\x3e\x63\x8c\x79\x73\x70\x70\xf0\xb6\
-\xe6\x96\x0f\x6b\x9c\x77\x89\xc8\x0b\xc0\x59\x63\xcc\xb8\x31\x26\
-\x9b\x46\xa2\xaa\x77\xd6\x09\x77\x01\x0f\x3b\x22\x32\xb8\x2e\xb0\
-\x09\x78\xb6\xab\xab\xeb\xc7\x7c\x3e\xff\x14\x95\x63\x96\x86\x2a\
-\xce\xcd\xc0\x73\xc0\x0f\xf9\x7c\x7e\x4f\x0a\x55\xaf\x25\xbe\xd5\
-\x01\xee\xa8\x11\xdc\xae\xaa\xef\x19\x63\xbe\xcc\xe5\x72\x3b\x53\
-\x24\x05\xb8\xbd\xc6\x78\x9f\xaa\x7e\x60\x8c\x39\x61\x8c\xb9\xbb\
-\x01\xcf\x26\x4b\xbc\xdb\x01\x7a\x2c\x93\x46\x32\x99\xcc\x8c\x31\
-\xe6\x19\xc0\xb1\x65\x1c\x1d\x1d\xed\x06\x6e\xb1\x4c\x7b\x04\xf8\
-\xd6\xf3\xbc\x31\xea\xef\xb0\x6b\xf1\x38\xd6\x05\x55\xb8\x15\x38\
-\xec\x79\xde\x49\x63\xcc\xae\x06\x9f\xb1\xd1\x2b\x22\x6f\x5b\x76\
-\xb8\xa1\x02\xca\x8d\x66\x14\x91\x87\x80\x19\x63\xcc\xfe\x42\xa1\
-\x90\xa9\x31\xad\x61\x5f\x85\x91\x4c\x26\x33\x5b\xc3\x59\x2b\xc7\
-\xf5\xb8\x03\x5c\x4e\x99\xb0\x1b\x38\x18\x45\x51\xc9\xf3\xbc\xdd\
-\xac\x3b\x56\xc5\x62\xb1\xcc\xea\x15\x97\x86\xcd\x15\xa7\xef\x79\
-\xde\x63\xfc\x73\xac\x6c\x05\x38\x62\x8c\xf9\x19\xb8\x27\x65\xc2\
-\xb5\x7c\x27\x22\xaf\xf6\xf7\xf7\x7f\x38\x31\x31\x11\x03\x18\x63\
-\x7e\x07\xb6\xb7\xe0\x3c\x2d\x22\xe3\xaa\xfa\x12\x70\x6f\x9d\x79\
-\xb1\x18\x63\x4a\xc0\x83\x2d\x24\xbb\xc6\xf5\x42\xa2\x28\xfa\x1e\
-\x48\x7b\x73\x55\x63\x85\xfa\x17\x42\xec\xa8\xea\x9f\x6d\x48\x04\
-\x70\xbf\xaa\x1e\x8d\xa2\x68\x96\x26\xfe\x3b\x6a\x60\xbb\xcd\x70\
-\x81\xc5\x36\x25\xbb\xc6\x40\x9b\x7d\x75\x71\x44\xa4\x5d\x3b\x70\
-\x23\x50\x07\xd8\xc8\x05\xb0\xd1\x0b\xc8\x38\x22\xd2\xf4\xfb\xfa\
-\xcd\x80\xa3\xaa\xdb\x6e\xf4\x22\x5a\x60\xc5\x11\x11\xdb\x2b\xeb\
-\xcd\x8c\x3a\x49\x92\x6c\xec\x02\x80\x54\x5f\x49\x0d\x70\x0a\x38\
-\xdd\x66\x67\x2d\xda\x5a\xc0\x37\xaa\xfa\x68\x10\x04\x23\xb4\xef\
-\x9f\xd8\xf6\x52\xa8\xae\x88\xb4\x5a\xc0\x94\xaa\xbe\x12\x86\xe1\
-\x27\x6b\xc6\x5a\x72\xaa\xea\x57\xc0\xc1\x4a\x63\xa0\xaf\xde\x54\
-\x17\xfb\x77\x67\x55\x44\xc4\x07\x0e\xf8\xbe\xff\x69\x95\x70\xb3\
-\xce\xaf\x81\x03\x41\x10\x7c\x0e\x60\x8c\xb1\x5d\xf1\xea\xb2\xfa\
-\x2e\x9e\x86\x4b\xc0\xcb\xbe\xef\x8f\x53\xbb\x8f\x94\xd6\x79\x51\
-\x55\x9f\x0f\x82\xe0\x5d\xfe\xdd\x47\xb2\x15\x50\x76\xb1\x7f\x34\
-\xac\xe5\x54\x1c\xc7\x7b\x4b\xa5\xd2\x4f\x96\x79\x69\x9c\x9f\x01\
-\x63\x61\x18\xfe\x52\x25\x16\x5b\x9e\x2d\xbb\x34\xd6\x8d\x5b\x02\
-\xf6\x07\x41\xf0\x16\x8d\x75\xda\x12\xec\x0d\x80\x45\x11\xd9\xe7\
-\xfb\xfe\xfb\x75\x9c\xb6\xb5\x95\xdd\xca\xe2\xea\x9d\xd9\x93\xaa\
-\xba\x37\x0c\xc3\x33\x16\xd9\x5a\x96\x80\x9a\x8d\x31\x11\x39\x21\
-\x22\x63\xd3\xd3\xd3\xe7\x2c\x1e\xdb\x0e\xc4\x2e\x70\x81\xd5\xae\
-\xdc\x7a\xfe\x10\x91\x17\x2d\xbf\x50\x2d\x2e\x50\xbd\x80\x85\xca\
-\x59\x3f\xd6\xa0\xe7\x8a\x25\x7e\xd5\x01\x66\xd7\x0f\x02\x87\x97\
-\x97\x97\xef\xf3\x7d\xff\x08\xcd\x35\x67\xd7\x3b\x2f\x03\xaf\x01\
-\xbb\xc2\x30\x6c\x74\xf1\xb0\xba\x93\xf5\xb8\xe8\xaa\xea\x84\x88\
-\xec\x01\x16\x44\xe4\xb8\x88\xbc\xde\xc0\xd6\xd6\xa5\xe2\x7c\x1c\
-\x38\x0f\x7c\x9c\x24\xc9\xa1\x99\x99\x99\x5f\x9b\xf0\x7c\x21\x22\
-\x0f\xb0\xda\x97\xaa\xc6\xbc\x00\x0c\x0c\x0c\xf4\xcc\xcd\xcd\x5d\
-\xa2\x8d\xed\xf5\xe1\xe1\xe1\xad\x93\x93\x93\x7f\xb5\xc1\xe9\x0c\
-\x0d\x0d\xed\x88\xe3\xb8\x07\xd8\x22\x22\x2e\xb0\x45\x55\x17\x7a\
-\x7b\x7b\x6d\xb7\x61\x87\x0e\x1d\x3a\x74\xf8\x8f\xf3\x37\xae\x2a\
-\x55\xca\xb1\xe2\xdb\xa3\x00\x00\x00\x00\x49\x45\x4e\x44\xae\x42\
-\x60\x82\
-\x00\x00\x03\x30\
-\x89\
-\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
-\x00\x00\x30\x00\x00\x00\x30\x08\x06\x00\x00\x00\x57\x02\xf9\x87\
-\x00\x00\x00\x04\x73\x42\x49\x54\x08\x08\x08\x08\x7c\x08\x64\x88\
-\x00\x00\x00\x09\x70\x48\x59\x73\x00\x00\x0e\xc4\x00\x00\x0e\xc4\
-\x01\x95\x2b\x0e\x1b\x00\x00\x00\x19\x74\x45\x58\x74\x53\x6f\x66\
-\x74\x77\x61\x72\x65\x00\x77\x77\x77\x2e\x69\x6e\x6b\x73\x63\x61\
-\x70\x65\x2e\x6f\x72\x67\x9b\xee\x3c\x1a\x00\x00\x02\xad\x49\x44\
-\x41\x54\x68\x81\xed\x99\x3f\x6b\x14\x51\x14\xc5\x7f\xf7\x4e\xfe\
-\xd8\xa9\x21\x0a\x4b\xc4\xca\x74\x76\x23\x6c\xa3\x36\x62\xaf\xad\
-\x95\xad\x8d\x9f\xc0\x8f\x61\xef\x27\x10\xb1\x12\xd2\x88\x20\x48\
-\xc8\xee\xb2\x8a\x44\x41\x0c\x04\x71\x77\x51\x13\xe3\x82\x21\xd9\
-\xec\xec\xb5\x98\x29\xc2\xcc\xdb\xc6\xbd\x6f\x61\xc4\x03\xdb\x1c\
-\x98\x73\xe6\xfe\x7b\xfb\xde\x1b\x01\x48\xd3\xf4\x1e\x70\x1f\xb8\
-\x0a\x34\xc8\xf1\x0b\x38\x00\x7e\x02\xdf\x81\x6f\x66\x96\x88\xc8\
-\x45\xe0\xdc\xa9\x5f\x02\x4c\x80\xaf\x40\xcb\xcc\x1e\x77\x3a\x9d\
-\x36\x01\xa4\x69\x7a\x1d\x78\x08\x5c\x03\x2e\x17\xcf\xfe\x2e\x3c\
-\x0e\x44\x64\xdf\xcc\x06\x22\x32\x02\x56\x81\x55\x33\x3b\x5b\xf8\
-\x2c\x15\x3e\xfb\xc0\x7b\x11\x79\xd2\x6a\xb5\x9e\x4b\x9a\xa6\x77\
-\x80\x67\x21\xc3\xbf\xc4\xb1\xaa\xae\x6f\x6d\x6d\x7d\x39\x4d\x36\
-\x9b\xcd\x4b\xe3\xf1\x78\x07\x58\x74\xf4\xba\xab\x66\x76\xcb\x51\
-\x10\x60\x39\xcb\xb2\x9b\x65\x32\xcb\xb2\x1b\xf8\xbe\x3c\xc0\x6d\
-\x15\x91\x75\x67\x51\x54\xb5\xa2\x69\x66\xee\x3e\xc0\x15\x25\xef\
-\x35\x6f\x84\x34\x63\xf8\x5c\x50\xe0\xbc\xb7\xaa\x99\xad\x94\x39\
-\x11\x71\xf7\x01\x56\x94\x7c\xba\x5d\x61\x66\x15\xcd\x10\xe7\x80\
-\x25\xc5\x7f\xb0\x10\x91\x85\x00\xed\xee\x03\x2c\x28\x10\x32\x9b\
-\x59\xb8\x4c\x4c\x09\x6a\x66\x9f\xb9\x05\x30\x99\x4c\xa2\x05\xf0\
-\xbf\x85\xca\x08\x65\x3b\x66\x0b\xa9\xb7\xaa\x88\x24\x01\xce\xdd\
-\x07\x48\x14\xc8\x22\x08\x8f\xcb\x84\x99\x45\xf1\x89\x12\x80\x88\
-\x54\x34\x63\x06\x50\xc9\xd6\xac\x30\xb3\x8a\xa6\xaa\xba\xfb\x00\
-\x59\x94\x00\x42\x9a\xb5\x6a\x21\xc2\x49\x89\x92\xa8\xb9\xb5\x50\
-\x88\x73\x40\x9c\x00\x42\x43\x1c\xe2\x1c\x10\x27\x80\x29\x9a\xd1\
-\x2a\x50\xfb\xff\x81\x3a\x2f\xa3\xf3\x9b\x81\x48\x43\x9c\x29\x20\
-\xde\xaa\x22\x62\x21\xda\xdb\x07\xb0\x79\xee\x46\x2b\x1b\x3c\x07\
-\xc4\xd9\x4e\x87\x5e\x36\xd2\x81\x26\x51\xf2\xeb\x3d\x6f\xd4\xfb\
-\x48\x69\x66\xa1\xa4\x44\xab\x40\x8c\x16\x0a\x69\xd6\xa7\x02\x04\
-\xda\xb2\xf6\x2d\x14\x73\x88\xe7\xd2\x42\xb5\xaa\x00\xe1\x95\x2d\
-\xc6\x6a\xf7\x6f\x54\xc0\x3d\x33\xa1\x19\x98\xb2\xb4\xce\x8a\x44\
-\xc9\xbf\x3b\xb9\x62\xca\xe1\xc5\xdd\x87\x58\x87\xfa\x29\x3b\xcf\
-\xfa\x6c\xa7\x81\x93\x90\x59\x0c\x9f\x79\x5e\xab\xd4\xaa\x02\xf5\
-\x3e\x91\x11\x68\xa1\x48\x15\x38\x51\x60\x14\x43\xb8\x4c\x14\x5f\
-\xdf\xbd\x31\x52\x60\x2f\x82\xf0\x8f\x32\x61\x66\x31\x7c\xf6\xd4\
-\xcc\x2a\x66\x0e\x08\x69\x46\xf1\x51\x11\xf9\xe4\xad\x6a\x66\x3b\
-\x01\xce\xdd\x07\xf8\xac\xc0\x86\xb3\xe8\x28\xcb\xb2\xd7\x65\x32\
-\x49\x92\x57\xc0\xb1\xa7\x91\x88\xbc\x4c\xfa\xfd\xfe\xc7\xb5\xb5\
-\xb5\x2e\xb0\x4c\xbe\xb1\x53\xe0\x08\x18\x02\xbd\x22\x9b\xef\x54\
-\x75\x53\x44\x3e\x90\xb7\xc2\x90\x7c\xf8\x13\xf2\x0f\xe5\x87\xc0\
-\xae\x99\x6d\x98\xd9\x83\x6e\xb7\xbb\x5d\x36\xeb\xf5\x7a\xc3\x46\
-\xa3\xf1\x42\x55\x17\x8b\xe7\x16\x0b\x9f\x43\x60\x00\xec\x98\xd9\
-\xb6\x88\x6c\x8a\xc8\x5b\xa0\x5f\xf8\x1c\x91\x5f\xc9\x9c\x29\x12\
-\x30\x00\xde\x98\xd9\xa3\x76\xbb\xfd\xf4\x0f\xc7\xaa\x28\x2b\x6e\
-\xa1\x12\x4d\x00\x00\x00\x00\x49\x45\x4e\x44\xae\x42\x60\x82\
-\x00\x00\x04\x61\
-\x89\
-\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
-\x00\x00\x30\x00\x00\x00\x30\x08\x06\x00\x00\x00\x57\x02\xf9\x87\
-\x00\x00\x00\x04\x73\x42\x49\x54\x08\x08\x08\x08\x7c\x08\x64\x88\
-\x00\x00\x00\x09\x70\x48\x59\x73\x00\x00\x0e\xc4\x00\x00\x0e\xc4\
-\x01\x95\x2b\x0e\x1b\x00\x00\x00\x19\x74\x45\x58\x74\x53\x6f\x66\
-\x74\x77\x61\x72\x65\x00\x77\x77\x77\x2e\x69\x6e\x6b\x73\x63\x61\
-\x70\x65\x2e\x6f\x72\x67\x9b\xee\x3c\x1a\x00\x00\x03\xde\x49\x44\
-\x41\x54\x68\x81\xed\x98\x4f\x68\x5c\x55\x14\x87\xbf\xf3\xde\x35\
-\x89\xf4\x4f\x82\x95\x62\x20\x60\x11\xc5\x2e\x6c\x3a\x79\xb7\xc9\
-\xa0\x11\xa4\x5a\x0a\x22\x06\x05\xa7\xba\xd1\x8d\x41\xd1\x85\xa0\
-\x2e\x5c\xb8\x50\x4a\x41\x29\x82\x82\x1b\x0d\xea\xca\x95\x6e\x14\
-\x41\x10\x04\x03\x92\xc5\x24\x73\xaf\xa1\xb1\xb8\x09\x41\x43\x24\
-\x8b\x80\x92\xb4\xda\x98\xcc\x7b\xc7\x45\x33\x32\x9d\x4e\xe6\xbd\
-\x99\x8c\x25\xd1\xf9\x76\xf3\xce\x7d\xbf\xdf\xb9\xf7\xdc\x7b\xde\
-\x70\xa1\x43\x87\x0e\x1d\x3a\xfc\x9f\x11\x6b\xed\x4d\x49\x92\xdc\
-\x25\x22\xb7\xa9\xea\x15\x11\xd9\x08\xc3\x70\x3d\x49\x92\x4b\xce\
-\xb9\x25\x20\xd9\x89\x41\xa1\x50\x08\x17\x16\x16\xf6\x3b\xe7\x56\
-\xdb\x94\x33\x85\x42\x21\x5c\x5c\x5c\xdc\x57\x2c\x16\xd7\x24\x8a\
-\xa2\xaf\x45\xe4\xe1\x6d\xc6\x5e\x11\x91\x77\x4b\xa5\xd2\xeb\xcd\
-\x9a\xe4\xf3\xf9\x81\xcd\xcd\xcd\x57\x44\xe4\x29\xa0\x1f\x38\xe3\
-\x9c\xfb\x7c\x27\x89\x0f\x0d\x0d\xdd\x1e\x04\xc1\xab\xc0\x19\xe0\
-\xb0\xaa\x8e\x19\x11\x19\x68\xf0\xce\xcd\xc0\xc9\x66\x4c\x72\xb9\
-\x5c\x9f\x31\xe6\x8d\x72\xb9\xfc\x82\x88\x74\x57\x85\x0a\x40\x4b\
-\x13\x18\x19\x19\x39\x14\xc7\xf1\x59\x60\x1c\xe8\xaa\x3c\x17\x91\
-\x27\x0c\x70\xb0\xd1\xcb\xaa\x7a\x20\xa3\x8f\x58\x6b\x9f\x01\xce\
-\xab\xea\xe1\x3a\xf1\xc1\xac\x09\x57\x6b\x46\x51\x34\x1e\xc7\xf1\
-\x5b\xc0\xa1\x3a\xf1\xe3\x06\xe8\xae\x13\xa8\xa6\x27\xcd\xc5\x5a\
-\xdb\xaf\xaa\x1f\x00\x63\x0d\x86\xdd\x92\xa6\x53\x4d\x2e\x97\x3b\
-\x62\x8c\xf9\x48\x55\x1f\x6a\xa4\x19\x00\x26\x45\x2b\x68\x10\x13\
-\x6b\xed\x38\xf0\x93\x88\x34\x4a\x1e\x52\x2a\x5d\xa3\xf9\x62\x18\
-\x86\x73\x29\xc9\x03\x1c\x34\xb4\x38\x01\x6b\x6d\xbf\x88\x7c\xa8\
-\xaa\x8f\x66\x4d\x2c\x6d\x40\x2e\x97\x3b\x12\x86\xe1\xc7\xc0\x83\
-\x59\x35\x03\x20\x4c\x19\x74\x5d\xdc\x5a\x5b\x00\x2e\x36\x91\x3c\
-\x34\x6e\xc7\x12\x45\xd1\x73\x61\x18\xce\x91\x3d\x79\x80\xd8\xd4\
-\x4b\xb0\x86\x7f\x2a\x60\xad\x3d\x2d\x22\x6f\xaa\xea\xbd\x4d\x98\
-\x54\xf8\xab\xde\x43\x6b\xed\x23\x5b\x9a\x27\x5a\xd1\x34\x34\xde\
-\xe3\x15\x93\xfb\x81\xb3\xc0\x49\x55\x6d\xc1\x07\x80\x6b\x3e\x64\
-\xc3\xc3\xc3\xa7\x92\x24\x39\x07\xe4\x77\xa2\x69\x48\xdf\x9b\xb7\
-\x02\xdf\xb7\xea\x50\xc5\x1a\x5c\x5d\x0c\x55\x3d\x97\x24\xc9\x03\
-\xed\xd0\x4c\x3b\xc0\x90\xde\x66\x33\x13\x45\xd1\x14\x70\x9f\x48\
-\xea\x79\xce\x4a\xa6\x0a\xb4\x8b\x7b\xda\x98\x38\x00\xaa\xba\x16\
-\x70\xe3\x26\xf0\x6f\xb0\xba\xa7\x27\x10\x04\xc1\x5a\x96\xef\xc0\
-\x6e\x66\x35\xb5\x85\xee\x66\x54\x55\x02\xa0\xe5\x26\xbc\x0b\xe8\
-\xdb\xd3\x15\x00\x7a\xf7\xf4\x21\xe6\x06\x57\x60\x1e\xb8\xd8\x66\
-\xcd\xf4\x0a\xa8\x6a\xdd\x3f\x61\x2d\x90\x38\xe7\x8e\xa9\xea\x18\
-\xf0\x43\x9b\x34\xd3\x2b\x20\x22\x4b\x5b\xa6\x6e\x87\x66\xbd\x80\
-\x7a\xef\xbf\x72\xce\xd9\x36\x4d\xa4\x37\x4b\x17\xaa\x98\x0e\x03\
-\x8f\x03\xb3\x2d\x9a\xf5\xd5\xd1\x3c\xa1\xaa\x4f\x02\x3f\xb6\xaa\
-\x99\x65\x02\xe5\x8a\xa9\x73\xee\x0b\xe7\x5c\xa4\xaa\xcf\x03\x97\
-\x9a\x34\xeb\xe6\xfa\xed\x9a\x78\xef\x3f\x73\xce\x1d\xdf\xd2\xfc\
-\xa3\x49\xcd\x9e\x00\x88\x53\x06\x95\x6b\x7e\xab\xf7\x7e\x22\x8e\
-\xe3\x41\x55\xfd\xb6\x19\xb7\x42\xa1\xb0\xdd\x96\x4d\xbc\xf7\x13\
-\x41\x10\x0c\x02\xdf\x35\x21\x19\x06\xa4\xdf\xbc\xd5\x4e\x00\x80\
-\xd9\xd9\xd9\x9f\xbd\xf7\xa7\xb7\x56\x6e\x2d\x8b\xdb\xca\xca\x4a\
-\xc3\x86\x31\x33\x33\xb3\xe0\x9c\x3b\x05\xbc\x04\x5c\xce\xa2\x99\
-\xa5\x02\x8d\xe2\xea\xbd\x9f\x00\x8e\x02\x5f\xa6\xe8\xac\x4f\x4e\
-\x4e\xd6\x5d\x8c\x1a\x12\xe7\xdc\xfb\x71\x1c\x1f\xcb\x50\xe1\xcb\
-\x01\xb0\xde\x68\x44\x96\x36\xea\x9c\x5b\x76\xce\x3d\xa6\xaa\x4f\
-\x03\xcb\xdb\x0c\xfb\x2d\x4d\xa7\x9a\x4a\x85\x45\xe4\x59\x60\x65\
-\x3b\xcd\x80\x94\xc3\x18\x04\x41\xa6\xed\x01\xe0\xbd\xff\xd4\x18\
-\x73\x54\x55\xcf\x03\x7f\x56\xc7\x44\xe4\x42\x56\x9d\x2a\xb4\x54\
-\x2a\x7d\xb2\xb1\xb1\x71\xb7\x88\xbc\x47\xcd\x62\x8b\xc8\x85\x40\
-\x44\xbe\xa9\x0d\x5c\xa3\xa0\xfa\x6b\x33\x8e\xc5\x62\x71\xcd\x7b\
-\xff\x9a\x31\xe6\x0e\xe0\x6d\xe0\x97\xad\x50\xcb\x17\xbb\x73\x73\
-\x73\xbf\x97\x4a\xa5\x97\xcb\xe5\xf2\x9d\xc0\x3b\xc0\x52\x45\x53\
-\xe0\xea\x75\xf5\xfc\xfc\xfc\x80\x31\x66\x7f\x1c\xc7\x3d\xaa\xda\
-\x65\x8c\xe9\x12\x91\xe5\xe9\xe9\xe9\x79\x76\x76\xc5\x2e\xf9\x7c\
-\xfe\x40\xb1\x58\xcc\x5c\xc9\x0c\x04\xa3\xa3\xa3\xfb\xa6\xa6\xa6\
-\x9a\x6d\xe5\x1d\x3a\x74\xe8\xd0\xe1\x3f\xc6\xdf\x33\x72\x82\x3e\
-\xe2\x5e\x46\xdd\x00\x00\x00\x00\x49\x45\x4e\x44\xae\x42\x60\x82\
-\
-\x00\x00\x05\xc0\
-\x89\
-\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
-\x00\x00\x30\x00\x00\x00\x30\x08\x06\x00\x00\x00\x57\x02\xf9\x87\
-\x00\x00\x00\x04\x73\x42\x49\x54\x08\x08\x08\x08\x7c\x08\x64\x88\
-\x00\x00\x00\x09\x70\x48\x59\x73\x00\x00\x0e\xc4\x00\x00\x0e\xc4\
-\x01\x95\x2b\x0e\x1b\x00\x00\x00\x19\x74\x45\x58\x74\x53\x6f\x66\
-\x74\x77\x61\x72\x65\x00\x77\x77\x77\x2e\x69\x6e\x6b\x73\x63\x61\
-\x70\x65\x2e\x6f\x72\x67\x9b\xee\x3c\x1a\x00\x00\x05\x3d\x49\x44\
-\x41\x54\x68\x81\xed\x99\x7b\x88\x54\x75\x14\xc7\x3f\xe7\xce\x3a\
-\xae\xba\xa3\xa2\x64\xba\xbb\x0a\x89\xaf\x12\x74\x9c\x7b\x67\x37\
-\x5b\x64\x57\xe9\x41\x22\x28\xc4\x56\x44\x05\xb9\x45\x81\x95\xf6\
-\xb0\x22\x50\xd4\xb2\x44\x08\x2a\xd0\xc8\x42\x42\xec\x21\x49\x11\
-\x95\x24\x04\x25\xa4\xb1\xb2\xbf\xdd\x4d\xc3\x4a\xb6\xed\xa1\xae\
-\xe2\x73\x77\x46\xcd\x99\xdd\xee\xe9\x8f\xbb\xea\xba\x3b\x4f\x67\
-\xa6\xfd\x67\x3e\xff\xcd\xbd\x67\xce\xf9\xde\xdf\xf9\xfd\xee\x39\
-\xbf\xdf\x85\x22\x45\x8a\x14\x19\x4c\x64\x30\x82\x86\xc3\xe1\xc9\
-\xae\xeb\xae\x02\x66\x18\x63\xe6\xe6\xe2\xab\x24\x4f\x9a\x32\xc2\
-\xb6\xed\xe1\xc0\x5a\xd7\x75\x97\x03\x43\x00\x05\x2c\xc0\xbd\x5e\
-\x9f\x56\x9e\xb4\xa5\x25\x14\x0a\xcd\x03\x9a\x81\xe7\xf1\xc4\x03\
-\x48\x4d\x4d\xcd\x88\x5c\xfc\x16\x3c\x03\xb6\x6d\x8f\x12\x91\x8d\
-\xaa\xfa\x18\x05\x98\xb2\x05\x7d\x80\x50\x28\xb4\x08\xd8\xa2\xaa\
-\x13\x92\xd9\x94\x97\x97\x5f\xcc\x25\x46\x41\x16\xf1\xdc\xb9\x73\
-\x87\xc5\xe3\xf1\x0d\xc0\x53\x69\x62\xfc\x63\x8c\x19\x9e\x4b\xac\
-\xa4\x6b\xa0\xbe\xbe\xde\x17\x0c\x06\x47\x67\xeb\xd0\x71\x9c\xaa\
-\x78\x3c\xde\x0a\x3c\x4d\xfa\x01\x3a\x9f\xad\xff\xfe\x0c\x08\x10\
-\x0e\x87\xc3\xae\xeb\xae\x01\x6e\x07\xfc\xc0\x19\x11\xd9\x1a\x8b\
-\xc5\x5e\x3f\x78\xf0\xe0\xb9\x64\x8e\xea\xea\xea\x4a\xa2\xd1\xe8\
-\x73\xc0\x2b\x5c\x5d\xa4\xe9\xf8\xd3\x18\x73\xd3\x75\xe8\xbe\xc2\
-\x35\x19\x70\x1c\xa7\xc1\x75\xdd\xbd\xc0\x42\x3c\xf1\x00\x63\x55\
-\x75\xa5\xdf\xef\x6f\x0c\x06\x83\x53\x13\x39\x71\x1c\x67\x7a\x24\
-\x12\xd9\x07\x6c\x20\x73\xf1\x90\x24\x03\x0a\x63\x15\x2a\x34\x03\
-\x5f\x57\x16\xb1\xe3\x38\x77\xa8\xea\xbb\x80\x2f\x89\xed\x54\x9f\
-\xcf\xf7\x75\x30\x18\xac\x6a\x6d\x6d\xed\x04\xa8\xab\xab\x2b\x8d\
-\x44\x22\x4f\xa8\xea\x7a\x11\xc9\x7a\x2e\x8b\xc8\xd9\x5e\xc1\x23\
-\x80\xa5\xc0\x62\xa0\x12\x38\x05\xc4\x80\x71\xea\x99\x7e\x0b\x6c\
-\x11\xf8\x75\x80\x0f\x80\xea\xea\xea\x91\x3d\x3d\x3d\x6d\xc0\x0d\
-\x19\xc4\x7d\xef\xd2\xa5\x4b\xcf\x96\x96\x96\x36\x00\x2b\x81\x8a\
-\x6c\x85\xf7\x61\x67\x93\x31\x9f\x03\xab\x80\x8f\x81\xed\x02\xed\
-\x7d\x0d\x14\xca\x80\xbb\xf1\xea\xc7\xcf\xc0\x72\xe9\x93\x39\x01\
-\xb0\x6d\x7b\x2d\xb0\x3a\xc3\xa0\xae\x88\x9c\x57\xd5\x91\x39\x08\
-\x07\x60\x63\x7b\xfb\x4f\x0b\xce\x9d\xeb\x00\x1e\x14\x38\x9b\xca\
-\x56\x61\x06\xf0\x25\x9e\xf8\x45\x02\xc7\xc0\x9b\x42\x16\xd0\x90\
-\x45\x5c\x2b\x1f\xe2\x1b\x8e\x1f\x67\x5c\x3c\xee\xeb\x15\x93\xb2\
-\x95\x50\x18\x09\x7c\x02\x3c\x8a\x37\xdd\xbe\x50\x98\x2f\x10\xb5\
-\x6c\xdb\xae\x25\xb7\x69\x90\x35\xd3\x2e\x5e\x64\x41\x67\x27\x4f\
-\x4e\x99\xb2\x35\x03\xf1\x16\xf0\x11\xb0\x59\x60\x8f\xc0\x2e\x60\
-\x07\xb0\x0e\xbc\x0c\xcc\x2b\xb8\xe2\x7e\x2c\xeb\xe8\xe0\xad\xca\
-\x4a\xa2\x3e\x5f\x47\x06\xe6\x1b\x81\x76\x81\x2d\x7d\xae\xbd\x09\
-\xb4\x28\x4c\x2a\x01\xe6\x14\x44\x65\x12\x46\xf7\xf4\x30\x31\x16\
-\x63\x7f\x20\x80\xc0\xc9\x54\xb6\x0a\x0f\x01\x55\x78\x35\xe9\x0a\
-\x02\xdd\x0a\x1f\x02\xf5\x16\x50\x5e\x38\xb9\x03\x99\x7d\xfe\x3c\
-\x8d\x81\x80\x27\x50\xf5\x4c\x32\x3b\x05\x1b\x78\x09\xb8\x47\x20\
-\x9e\xc0\x64\x37\x50\x6b\xa9\xea\x98\x82\x28\x4d\xc2\x8d\xf1\x38\
-\xc7\xfd\x5e\x8d\x14\x91\x53\x89\x6c\x14\x26\x00\xdb\x81\xfb\xc5\
-\xab\x09\x89\xf8\x0b\xa8\xb4\x44\x44\x0b\xa2\x34\x09\x2a\x92\xb2\
-\x41\x52\x28\x05\x3e\x03\x56\x0b\x1c\x4c\x61\x2a\x80\x5a\x22\x72\
-\x3a\xaf\x0a\xd3\x70\x72\xc8\x10\xc6\xc7\xbd\x19\xa1\xaa\x89\x0a\
-\xe7\x26\xe0\x2b\x81\x4f\xd3\xb8\x9a\x04\x1c\xb3\x54\xf5\x48\x9e\
-\x35\xa6\xa4\xb5\xac\x8c\xea\x68\x14\x00\x9f\xcf\x37\xae\xef\x3d\
-\x85\x17\x80\xd1\xc0\x6b\x19\xb8\xba\x1b\xf8\xce\x12\x11\x93\x77\
-\x95\x29\xe8\x2a\x29\xe1\xef\xa1\x43\xa9\x8a\x46\x71\x5d\xf7\xca\
-\x03\x28\xdc\x09\xdc\x0b\x3c\x2c\xde\x5e\x39\x29\xea\x35\x9a\x0f\
-\x00\x3b\x2d\x55\xdd\x53\x58\xc9\x03\xd9\x54\x51\xc1\x8a\xa3\x47\
-\x09\x74\x77\x97\xf7\x0a\x9a\x0e\x6c\x06\xea\x05\x2e\x64\xe0\xe2\
-\x19\xe0\x1b\x81\x23\x97\x7b\xa1\xc3\x40\xc2\x56\xb9\x50\x2c\x3d\
-\x71\x82\xda\xce\xce\x43\x33\x2f\x5c\xa8\x01\xbe\xc7\x6b\xd2\xd2\
-\x0e\xa6\xc2\x22\x60\x0d\x97\x5b\x09\x00\x55\xdd\x9c\x45\xec\x1e\
-\x20\x9a\xbd\xe4\x6b\xd9\x3a\x7e\x3c\x27\xfc\xfe\x1e\x60\x2f\xf0\
-\x41\x3a\xf1\x0a\xa2\xde\x2e\x6f\x1d\xb0\x58\x7a\x35\x58\x00\x91\
-\x48\xe4\x1d\xfa\xb5\xb1\x29\x78\xa3\xa4\xa4\xa4\x12\x58\x01\x9c\
-\xb8\xde\x07\x00\x78\x71\xf2\xe4\x3f\x80\x57\x81\xc7\x15\xd6\x28\
-\x4c\x49\x20\x3c\xa0\x70\x1f\xb0\x1f\x98\x09\xcc\xbb\xdc\x89\x42\
-\x9f\x2d\x65\x38\x1c\x0e\xba\xae\xbb\x0f\x18\x96\x22\x66\x63\x57\
-\x57\x57\x6d\x5b\x5b\x5b\x0c\x60\xd6\xac\x59\x23\xfc\x7e\xff\x32\
-\x55\x5d\x93\xe6\x7f\x09\x11\x91\x1f\x9b\x9a\x9a\x6e\x53\x18\x0e\
-\x3c\x02\x2c\x01\x26\x02\xa7\xe9\xdd\xd0\x00\xff\x72\x75\x43\x73\
-\x78\x80\x8f\xbe\x3f\x42\xa1\xd0\x5d\x22\xb2\x03\x18\xd5\xdf\x50\
-\x55\xf7\xa9\xea\x92\x96\x96\x96\x01\x95\x71\xce\x9c\x39\xb7\x58\
-\x96\xb5\x0d\xaf\xfc\x67\xc3\x6f\xc6\x98\x19\x03\x62\xc1\x18\xbc\
-\x01\x39\x29\xd0\x9d\xca\xc1\x35\x7b\xe2\xe6\xe6\xe6\xdd\xae\xeb\
-\xce\xc6\x7b\x23\xfc\x0e\x44\x44\xa4\x09\x58\x16\x8b\xc5\xe6\x27\
-\x12\x0f\xd0\xd2\xd2\x72\x28\x10\x08\xdc\x8a\xd7\xbb\xa4\x0c\xd8\
-\x8f\xb2\x44\x17\x05\xce\x0a\x1c\x4b\x27\xbe\xd7\x36\xbf\xd8\xb6\
-\x5d\x0d\x6c\x03\xa6\x65\x60\x1e\x31\xc6\x0c\xc8\x76\x36\xe4\xfd\
-\x6c\xd4\x18\xd3\xe8\xf7\xfb\x83\xc0\xdb\xa4\x29\x48\x78\x19\xc8\
-\x69\x10\x0b\x7a\xbc\xee\x38\xce\x42\x55\x7d\x1f\xaf\xbb\x4c\x48\
-\x77\x77\x77\xd9\x81\x03\x07\x32\x29\x5e\x09\x29\xe8\xe9\x74\x53\
-\x53\xd3\x2e\xe0\x66\xbc\x6c\x24\xdb\x3a\xe6\x74\x3a\x5d\xf0\xe3\
-\x75\x63\x4c\x97\x31\x66\x39\x50\x0b\xfc\x92\x6f\xff\xff\xdb\xf7\
-\x01\x63\xcc\x0f\x81\x40\x20\xa4\xaa\xeb\xf1\xde\xf1\x97\xb9\xee\
-\xe9\x03\x83\xf4\x89\xc9\xb6\xed\x49\xaa\xfa\xb2\x88\x38\xc6\x18\
-\x67\x30\x34\x14\x29\x52\xa4\x48\x7e\xf8\x0f\x53\x04\xb0\xd0\x8e\
-\x9b\xb9\x10\x00\x00\x00\x00\x49\x45\x4e\x44\xae\x42\x60\x82\
-\x00\x00\x03\xaf\
-\x89\
-\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
-\x00\x00\x30\x00\x00\x00\x30\x08\x06\x00\x00\x00\x57\x02\xf9\x87\
-\x00\x00\x00\x04\x73\x42\x49\x54\x08\x08\x08\x08\x7c\x08\x64\x88\
-\x00\x00\x00\x09\x70\x48\x59\x73\x00\x00\x0e\xc4\x00\x00\x0e\xc4\
-\x01\x95\x2b\x0e\x1b\x00\x00\x00\x19\x74\x45\x58\x74\x53\x6f\x66\
-\x74\x77\x61\x72\x65\x00\x77\x77\x77\x2e\x69\x6e\x6b\x73\x63\x61\
-\x70\x65\x2e\x6f\x72\x67\x9b\xee\x3c\x1a\x00\x00\x03\x2c\x49\x44\
-\x41\x54\x68\x81\xed\x98\x3d\x68\x14\x41\x14\xc7\xff\x6f\x36\xc1\
-\x88\x9f\xc4\xa8\x24\x5a\x88\x09\x18\x14\x2f\xb9\x99\x39\x4d\x40\
-\x31\x85\x82\xdf\xe0\x17\x18\x44\x2b\x8d\x20\xd1\xc2\x5e\xa3\x22\
-\xa8\x51\xb1\x8d\x5a\xa7\xb1\x52\xb0\x53\x0b\xeb\xdc\xac\x12\x10\
-\x0d\x82\x58\xa6\x12\x13\x3f\xd0\x3b\x9c\x67\x91\x3b\x30\x7a\x9f\
-\xb3\xb3\x1c\xc2\xfe\x9a\x85\x7b\xb3\xbf\xf7\x66\x67\x6e\x67\x76\
-\x80\x84\x84\x84\x84\x84\x84\x98\xe9\xea\xea\x5a\x10\x97\x93\x7c\
-\x8b\x8b\x28\xa5\xda\x01\x5c\x00\x30\x08\x60\x8d\x10\x62\xcf\xc4\
-\xc4\xc4\x73\x0f\xce\xf3\x05\xe7\x5a\x22\xda\xdb\x14\xbd\xd4\x7f\
-\x92\x2c\x03\x70\x09\xc0\x39\x00\x0b\x8b\xbf\x5b\x6b\x8f\x03\x70\
-\xea\x40\x39\x27\x80\x41\x9f\x1d\x20\xa5\xd4\x29\x00\xb7\x00\xac\
-\xfe\x27\x48\xd4\xe3\xe2\xd4\x5a\x9f\x64\xe6\xd1\x52\x4e\x66\xee\
-\xf1\xd2\x81\x74\x3a\xdd\x11\x04\xc1\x18\x33\x1f\x28\xd7\x86\x99\
-\xdb\xea\x71\x2a\xa5\xda\x99\x79\x8c\x99\x0f\x56\x68\xd6\x26\xea\
-\x91\x96\x80\xb4\xd6\x67\x85\x10\x6f\x2b\x15\x5f\x60\x49\xad\x4e\
-\x29\xe5\x10\x80\x77\x44\x54\xa9\x78\x00\x58\xe2\x3c\x02\xbd\xbd\
-\xbd\xeb\x84\x10\x0f\x99\x79\x67\x8d\xb7\x54\x7d\x58\x45\x27\x11\
-\xd5\xec\x74\x19\x01\x92\x52\x0e\x05\x41\x30\x59\x47\x22\x00\xf8\
-\x15\x87\xb3\xae\x11\xd0\x5a\xef\xb5\xd6\x5e\x21\xa2\x4c\x3d\xf7\
-\x15\xf8\x59\xce\xc9\xcc\x23\x00\xb6\xb8\x38\x6b\xea\x40\x26\x93\
-\xd9\x69\xad\xbd\xce\xcc\x5b\x89\x9c\x97\x8e\x99\x72\x4e\x57\x21\
-\x80\x99\x8a\x1d\x28\x26\xb1\xd6\x46\x49\x52\x64\x16\x00\x94\x52\
-\xdb\x98\xf9\xba\xb5\x76\x87\x0f\x67\xc9\xc7\xa9\xb5\xde\xc5\xcc\
-\xd7\x00\xf4\x79\x48\x52\xc4\x00\xc8\x7b\x76\x3e\x9b\x37\x02\x99\
-\x4c\x66\x13\x33\xdf\x61\xe6\xdd\x1e\x93\x14\x51\x31\x38\xe7\xa6\
-\x90\x52\xaa\x19\xc0\x45\x6b\xed\x55\x00\xde\x37\x5e\x71\xc1\xcc\
-\xb3\x4d\xfd\xfd\xfd\xad\xb9\x5c\xee\x31\x80\xed\x8d\x2e\xc8\x81\
-\x99\xa6\x7c\x3e\xff\x14\x40\x7f\xa3\x2b\x71\x41\x08\x31\x2b\x98\
-\x79\x71\xa3\x0b\x89\x82\xb0\xd6\xee\x06\xf0\xba\xd1\x85\xb8\xc0\
-\xcc\xcb\x83\xe9\xe9\xe9\x2f\xad\xad\xad\xe3\x41\x10\x2c\x25\x22\
-\x8d\x18\x3f\x72\x62\x60\x6a\x5e\xb1\x52\xca\x3e\x22\xba\x07\xbf\
-\xef\xea\x38\x79\x52\xea\x69\x93\x94\xf2\x18\x11\x8d\x00\xd8\xe8\
-\x31\xd9\x9b\xc2\x75\x93\x2f\x21\x33\xbf\x2c\xb5\x1b\xe5\x30\x0c\
-\x1f\x19\x63\x36\x17\x3e\x26\x5e\x79\xca\x97\x33\xc6\xa4\x7c\x3a\
-\x89\x68\x59\x2d\xf3\x5d\x48\x29\xf7\x11\xd1\x15\x00\x32\x42\xbe\
-\x0f\xc6\x98\xce\x62\x6e\x29\xe5\x7e\x0f\xce\x8f\xf5\xfc\x61\x85\
-\xd6\xfa\x30\x33\x5f\x06\xb0\xd9\x21\xd9\x27\x63\xcc\x8a\x12\xce\
-\x43\x05\x67\xca\xc1\xf9\xd9\xe5\x8d\x23\xa4\x94\xa7\x89\xe8\x2e\
-\x80\x7a\xd6\x90\xef\xc6\x98\x45\x65\x62\x24\xa5\x3c\xe3\xe0\xfc\
-\xe1\xf2\x45\x66\xc3\x30\x7c\x10\x04\x41\x8a\x88\x5e\xd4\x71\x5f\
-\x50\x21\xc6\xae\xce\xa8\xef\x7c\x52\x4a\x9d\xc5\xdc\x51\xca\xd2\
-\x2a\x6d\x7f\x1a\x63\x5a\x6a\x71\x6a\xad\x87\x0a\x47\x29\xd5\x9c\
-\xf9\xa8\xa7\x12\x6c\x8c\x19\x03\xd0\x0d\xe0\x49\x95\xb6\x5f\x6a\
-\x75\x66\xb3\xd9\xfb\xb5\x3a\xbd\xae\xba\x52\xca\x13\x44\x74\x1b\
-\x40\x7b\x89\xf0\x94\x31\xa6\xdb\xd1\x39\x0a\xa0\xa3\x44\xf8\x7d\
-\xd4\x11\x98\x47\x18\x86\xe3\x2d\x2d\x2d\x1b\x00\xdc\x04\xf0\xed\
-\xaf\xf0\x64\x04\x67\x37\x80\x1b\x00\xbe\xfe\x19\x63\xe6\xc9\xd8\
-\xf6\x3d\xa9\x54\x6a\x55\x73\x73\xf3\x30\x80\xe3\x00\xd6\x13\xd1\
-\x91\x6c\x36\x5b\x6d\x4a\x54\x24\x9d\x4e\xaf\x14\x42\x0c\x63\xee\
-\x70\xb7\x93\x99\x8f\xfa\xa8\xb5\x2a\x03\x03\x03\xde\x0f\x91\xe3\
-\x70\x26\x24\x24\x24\x24\xfc\x7f\xfc\x06\x93\xbe\x15\x41\xb4\x07\
-\x96\x76\x00\x00\x00\x00\x49\x45\x4e\x44\xae\x42\x60\x82\
-\x00\x00\x07\xd9\
-\x89\
-\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
-\x00\x00\x30\x00\x00\x00\x30\x08\x06\x00\x00\x00\x57\x02\xf9\x87\
-\x00\x00\x00\x04\x73\x42\x49\x54\x08\x08\x08\x08\x7c\x08\x64\x88\
-\x00\x00\x00\x09\x70\x48\x59\x73\x00\x00\x0e\xc4\x00\x00\x0e\xc4\
-\x01\x95\x2b\x0e\x1b\x00\x00\x00\x19\x74\x45\x58\x74\x53\x6f\x66\
-\x74\x77\x61\x72\x65\x00\x77\x77\x77\x2e\x69\x6e\x6b\x73\x63\x61\
-\x70\x65\x2e\x6f\x72\x67\x9b\xee\x3c\x1a\x00\x00\x07\x56\x49\x44\
-\x41\x54\x68\x81\xd5\x99\x7f\x6c\x55\x67\x19\xc7\x3f\xef\x39\xf7\
-\xf4\xde\xdb\x96\xd2\xf6\x96\xf6\xb6\x50\x86\xa0\x66\xce\x88\x81\
-\xdb\xcb\x44\x8c\x2c\x46\x90\x2d\xa0\x73\x59\x17\x05\x11\xa7\x50\
-\x96\x6e\x8b\x12\x33\x8c\x51\x17\xc8\xa2\x62\x74\xca\x42\x20\x2b\
-\x6b\x0c\xb2\x64\x9b\xc3\x65\x2e\xd1\x88\xd3\x7f\x60\xc6\x9a\x48\
-\x0b\xe3\xe7\x5c\xda\xd2\x81\x2d\xb7\xd0\x52\xe8\xaf\x73\x7f\x9d\
-\xfb\xf8\xc7\x6d\xd9\xed\x3d\xf7\xe7\xa1\x1b\xf1\x93\xdc\x3f\xce\
-\x79\x9e\xf7\xbd\xdf\xef\x3d\xef\xfb\x9e\xf7\x7d\xae\xc2\x01\xd2\
-\x8a\x9f\x38\x9d\xc0\x65\x14\x3b\x55\x1b\xc7\x9d\xf4\x53\x28\xab\
-\x56\xad\x9a\x13\x0e\x87\x5b\x45\x24\xd2\xd5\xd5\xb5\x37\x35\xa6\
-\x39\xea\xd1\x62\x2d\xd0\x00\xdc\x8b\x70\x4c\x5a\xd8\x27\xcd\x94\
-\xcc\x82\xd6\x19\xac\x58\xb1\xc2\xd7\xd4\xd4\xb4\x2b\x1c\x0e\x5f\
-\x02\xf6\x28\xa5\xaa\xd2\x73\x5c\x0e\xfb\xbe\x3b\xed\xfa\x09\xaa\
-\x08\x48\x2b\x0f\xa9\x03\x84\x1c\xf6\x79\x8b\x40\x20\x50\xa3\x94\
-\x7a\xc2\xb2\xac\xef\x01\x73\x73\xe5\x3a\x35\x90\xa9\xd3\x95\xc4\
-\xe9\x90\xad\x3c\xa0\xda\xb9\xe0\xa4\xd3\x69\xe1\x22\xb2\x43\x44\
-\x2a\x0a\x69\xe3\xcc\x80\x64\x6d\xb7\x08\x8d\x7f\xc8\x56\x1e\x54\
-\xed\xbc\x55\x68\x77\x81\x40\xa0\x5e\x44\x9e\x02\xb6\x8b\x48\x69\
-\x86\x94\x08\xf0\x6f\x11\x89\xa4\x07\x9c\xcd\x01\x90\x1c\xb1\x6a\
-\x34\xde\x94\xed\x3c\x94\xaf\x93\xa5\x4b\x97\xd6\x06\x02\x81\x3d\
-\x40\x8f\x52\x6a\x07\x90\x2e\x3e\x5a\xee\x4a\x9c\x2f\xd1\x24\x01\
-\x7c\xee\x7e\xdf\xc8\x06\x69\xc1\x48\x4d\x70\x66\x40\x98\xc8\x93\
-\xe1\x41\x78\x55\xb6\xd1\x9a\x29\x18\x0c\x06\x1b\x03\x81\xc0\x73\
-\x86\x61\xf4\x01\x3f\x00\xbc\x33\x44\x29\x62\x0b\x3d\xd1\x6b\x65\
-\x9a\x65\x8c\xc7\xb5\x7b\xa2\x09\xe5\x05\x68\x74\x47\x3e\x83\xf0\
-\xc9\xd4\x5c\x67\x43\x48\xe5\x35\x00\xa0\xa3\xd8\x2f\x2d\x34\x70\
-\x90\x9f\x28\x90\x40\x20\xb0\x10\xf8\x7e\x22\x91\x68\x01\x3c\xe9\
-\x0d\x5c\x4a\x62\x1f\xf5\x9a\x72\x39\xec\x2e\xb9\x14\x2e\x99\x97\
-\x1e\x1f\x89\xbb\x04\xc5\xc5\xdb\x37\x00\xe3\x45\xe4\xfe\xa8\x67\
-\xb3\x27\xb0\xea\x3f\x9f\xe8\x0b\x5b\x3c\x0a\xb8\xd3\x13\x3c\xba\
-\x58\x1f\x71\x9b\x7a\x5f\xc4\x63\xbc\x33\x99\x69\x0a\x24\x89\x88\
-\x1a\x56\x07\xb9\x99\x7a\xcf\xa9\x81\xb1\x42\x92\x06\xa2\x6e\x0e\
-\x85\xfc\xbc\x31\xe4\x5b\x67\x89\xb2\xc5\xbd\x5a\x82\x25\x5e\x93\
-\xde\xb0\x57\xbf\x90\x41\xb8\x4b\x09\x77\xb9\xc3\xf4\x84\x93\x23\
-\x6c\xd4\x72\xbd\x6d\xcb\x29\x5a\x3a\x80\x30\x8a\x5d\xcf\x2d\xfa\
-\x23\x6e\x7e\x37\xe8\xe7\x8d\x21\x1f\x99\x85\x5b\x2c\xf1\x86\xe9\
-\x36\x4b\x39\x3b\x51\x66\x8b\x1b\x4a\x58\x53\x75\x9d\x96\x86\x2b\
-\xfc\x71\xa8\x86\x9e\x50\xd2\xc0\xd9\xb1\xb2\x33\xb3\x63\x40\x63\
-\x3c\xd3\x3a\xd4\x6b\x7a\x38\x14\xf2\xf3\xd7\x91\xea\x8c\xc2\x4b\
-\x35\x8b\xc5\xde\x30\xef\x4e\x7a\xb3\x0a\xdf\x50\x33\xcc\xd6\xfa\
-\x2b\xd4\x1a\x51\x5b\x7c\x38\x6e\xd8\x9e\xbc\x33\x03\x16\x63\xa9\
-\xeb\x57\x6f\xd8\xcb\xa1\x2b\x75\x1c\xbd\x5e\x4d\x22\xc3\xa3\x99\
-\xa3\xc7\xb9\xcb\x13\xe1\x5d\x33\xb3\xf0\x12\x4d\x58\xef\x1b\x66\
-\xab\x7f\x80\xda\x92\x58\x51\x52\x9c\x19\xd0\x31\x11\xe8\x36\xbd\
-\x1c\x0e\x65\x17\x5e\xe1\x8a\xb3\xd0\x1d\xc9\xfa\x8b\x7b\xb5\x04\
-\x5f\xa9\x19\x62\x8b\x3f\xc4\x3c\xa3\x38\xe1\xd3\x38\x9d\xc4\xc6\
-\xfe\xfe\xf9\x1c\x0a\xf9\x33\xbe\xd1\x2a\x5d\x71\x16\x79\xc2\x9c\
-\x9f\x2c\xcb\x28\xbc\x54\x4f\xf0\x65\xdf\x10\x8f\xfa\x43\xf8\x1c\
-\x0a\x9f\xc6\xa9\x81\xaa\x8b\x61\x8f\x4d\x7c\xa5\xcb\x62\x81\x3b\
-\xc2\x85\x49\x2f\xa7\xc6\xcb\x6d\x8d\xa6\x85\x7f\xbb\x3e\x44\xb5\
-\xab\x30\xe1\x51\x51\x63\xc0\x9c\x6c\x71\xa7\xab\xd0\xfd\xa9\x97\
-\x95\xae\x38\x0b\xdc\x51\x2e\x4c\x7a\x39\x3b\x61\x5f\x0e\x4b\x35\
-\x8b\xe6\xda\x6b\x6c\xf1\x0f\x52\xa1\xc7\x8b\xfa\xaa\x4b\xa6\xa7\
-\x13\xb8\x2f\x5b\xbc\x28\x03\xb2\x0b\x17\x03\xec\x06\xb6\x03\xf8\
-\x8c\x18\x75\x46\x94\x77\x26\x4b\x39\x1b\xb7\x0b\x2f\xd3\x2d\x1e\
-\x9e\x77\x8d\x2d\x75\x21\x2a\x5c\x56\x51\xc2\xa7\x18\x3f\x39\x5e\
-\x7e\x8a\xd9\x30\x20\xdb\xf9\x34\x03\xb4\x03\x4d\x00\xa3\x71\x9d\
-\xeb\x71\x83\xe1\x98\x61\xcb\xad\x74\xc5\xd9\x58\x3b\xc8\xd7\xea\
-\xae\x51\xaa\x39\x12\x3e\xcd\x4b\x13\x09\x3d\x9c\x2b\x21\xaf\x01\
-\x79\x1c\x1f\x31\x9e\x46\x78\x1c\xd0\xa7\xef\x5f\x8a\x78\x90\xb4\
-\x49\x50\xe9\x8a\xf3\x48\xed\x35\x36\xd6\x0e\x52\xae\xdf\x96\xf0\
-\x24\x1a\x87\x81\xf5\xb9\x52\xb2\x1a\x90\x16\x0c\x84\x56\x62\xec\
-\x26\xcf\xa9\xa8\x4c\xb7\xd8\x54\x77\x95\x4d\xb5\x83\x94\xcd\x86\
-\xf0\x24\x26\x7e\x3a\x70\x62\x40\xb6\xf1\x55\xe0\x57\x28\x16\x17\
-\xf2\x4d\x4f\x35\x5e\x66\xbd\x6f\xb8\x78\x89\xb9\x31\x19\x78\xff\
-\x89\x67\x63\x86\x01\x69\xe1\x6e\x60\x1f\xf0\xc5\x7c\x0d\x17\xb8\
-\x23\x0c\x4d\x8d\x7f\x43\xe5\x3a\xdf\x38\xa6\x1a\xd8\x98\x2f\x49\
-\x03\x90\x66\x74\xd9\xc6\x77\x81\x4e\x0a\x10\x0f\x30\xd7\x55\xdc\
-\x72\xe8\x90\xbd\x3e\x23\x96\xf3\x6c\xac\x49\x2b\xe5\x54\xf1\x27\
-\x14\x7b\xb1\x1f\xe9\xee\x34\x95\xab\xe7\xde\xd8\x90\x2b\xc1\x45\
-\x9c\xd7\x80\xb5\x1f\x92\xa0\xa2\xa9\x70\x59\x8d\xb9\xe2\x1a\xc9\
-\x02\xd5\xff\x2d\x1a\x06\xf7\x01\xbf\x04\x26\xef\xb0\x96\xbc\x7c\
-\xac\xd4\xb4\x3d\x0d\x4d\xed\x67\x58\x1d\x64\x27\x6e\xea\x11\xbe\
-\x09\xfc\x19\x30\x3f\x6c\x71\xef\x85\x3d\xbc\x3e\x54\x43\xdb\x40\
-\x03\x07\xfa\x1b\x78\xf5\xea\x3c\xd2\x8f\x99\x9f\xad\xb8\xd9\x2c\
-\x5b\x59\x90\x7a\xef\xd6\x32\xaa\xf6\x31\x0a\xbc\x08\xbc\x28\x3b\
-\xf0\x32\xc9\x6a\x84\x2f\x91\x9c\x1f\xf7\x7c\x50\xc2\xcf\x4f\x94\
-\xf2\xeb\xff\x36\x66\xdc\xbd\x42\xf2\xed\x3e\x8d\xa1\xa4\x0c\x8d\
-\x3f\xc8\x93\xac\x56\xfb\x88\xcc\x30\x90\x8a\xfa\x0d\x26\x70\x74\
-\xea\x83\x3c\xc6\x7c\x2c\xd6\xa0\x58\x03\xac\x01\x6c\x25\x0f\x27\
-\x1c\xbb\x51\xc9\x0f\x2f\x2e\x26\x9a\xc8\x7e\xc0\xbe\x11\xb7\x49\
-\xbc\x97\x08\xcf\x01\x8f\x41\x81\x85\x2d\xf5\x3c\xfd\xea\x05\x0e\
-\xa9\x83\x6c\x62\x84\x7a\x14\x6b\x47\xe2\xae\x7e\xa7\xc2\x21\xb9\
-\x19\x7c\xba\x6f\x51\x4e\xf1\xe9\x8c\xbc\x6f\x66\xfb\xd4\x6e\xa1\
-\xf8\xca\x9c\x3a\x82\xa5\xda\xf8\xdb\xe9\xf1\xf2\x13\xc5\xb6\x4d\
-\xe5\x9f\xa3\x73\x99\xb0\xf2\xee\x14\x66\x70\xd1\x4c\x29\xe0\x29\
-\x0e\x4a\x0b\x35\x4e\x6b\xa3\xb7\x4d\x31\xbf\xfc\x34\x8b\x3c\x33\
-\xd6\x96\x1a\x60\xe7\x1d\x33\x10\xac\x18\x43\x2f\x72\x0f\xb5\xa6\
-\x7a\x24\xfd\xd6\x77\xee\x98\x81\xfa\x92\x68\xd7\x12\xaf\xb9\x37\
-\x7f\x66\x92\x07\x7c\xc3\x13\xc1\x39\x63\x23\x24\x2b\xe3\x61\xa0\
-\x0f\xe1\x05\xa7\x87\xfa\x19\x08\x58\x90\x7f\xeb\x9b\x42\x37\xf0\
-\x85\x97\xdf\xba\x70\xb3\xa9\xa9\xe9\xa4\x88\x3c\x4b\x72\x48\x64\
-\x62\x52\x44\x7e\xfa\xcc\x9b\x7d\x7b\x9e\x81\x44\x7a\x70\x56\x0c\
-\x98\x96\x7e\x19\x58\x54\x60\x7a\x18\xc5\xc3\xaa\x2d\x59\xa4\x3d\
-\x71\xe2\xc4\xe1\x95\x2b\x57\x1e\x89\xc5\x62\x0f\x8a\xc8\xe7\x81\
-\x46\xa5\x94\x9e\x48\x24\x06\x94\x52\x1d\xd1\x68\xf4\xb5\x33\x67\
-\xce\xd8\xc6\xce\x34\x79\x0d\x34\x37\x37\xeb\x3d\x3d\x3d\x1f\x17\
-\x91\x06\x5d\xd7\x2d\x11\xb9\xdc\xd9\xd9\xd9\x93\x9a\x73\xc3\x72\
-\x75\x17\x61\x60\xb7\x6a\x63\x46\x91\xb6\xa3\xa3\xc3\x04\x5e\x9e\
-\xfa\x14\x45\x56\x03\xcb\x96\x2d\x6b\xd0\x34\xed\xc7\xbd\xbd\xbd\
-\x5f\x57\x4a\x55\x2a\xa5\x90\xa9\x43\x70\x20\x10\xe8\x27\xa5\xc4\
-\x3e\x18\x33\xba\x29\xec\x1c\x71\x0a\x78\xb6\x58\x91\xb9\xc8\x68\
-\x20\x18\x0c\xae\x4e\x24\x12\xaf\x03\xb6\xbf\x35\xa7\x98\x9f\x7a\
-\xd1\x3d\x51\xda\x93\x25\x2f\x95\x28\x09\xb6\xa8\x76\x6e\xaf\x14\
-\x97\x86\x6d\x15\x0a\x06\x83\xfe\x3c\xe2\x6d\x9c\x36\xe7\x84\x80\
-\xeb\x79\xd2\x7e\xa6\xda\x39\x5d\xa4\xbe\xbc\xd8\x0c\x58\x96\xb5\
-\x99\x22\xc4\x03\x88\xc8\xa7\x10\xfe\x95\x23\xe5\x6d\x46\xf8\x79\
-\xb1\xe2\x0a\xc1\x66\x40\xd3\x34\x27\x07\x9c\x2b\xa8\xac\x7f\xab\
-\x46\x51\x6c\x51\x47\xb0\x17\xfc\x67\x81\x4c\x2f\xb2\xae\x62\x3b\
-\x11\x91\xe3\x28\xfe\x92\x39\xc8\xae\xf4\x55\x67\x36\xb1\x19\x30\
-\x4d\xf3\xf7\x4a\xa9\x82\x37\x6a\x22\xf2\x4a\x67\x67\x67\x17\x6d\
-\x9c\x06\xde\x4b\x0b\x1f\x65\x3e\xbf\xb8\x5d\x91\xb9\xb0\x19\x38\
-\x77\xee\x5c\x54\xd3\xb4\x75\x22\xf2\xf7\x3c\x6d\x45\x44\x7e\x3b\
-\x3a\x3a\xfa\x2d\x00\x95\x7c\xc5\x1f\x48\xed\x0a\xd8\xac\x76\xd9\
-\xdf\x9e\xb3\x49\xce\x2d\xe1\xf2\xe5\xcb\xd7\x29\xa5\xbe\x01\xac\
-\x02\xfc\x24\xb7\x0c\x97\x44\xe4\xb8\x88\xb4\x9f\x3c\x79\x72\xc6\
-\x93\x92\x27\xa9\x20\xc2\x31\xe0\x26\x1a\x8f\xa8\xe7\xb9\xfa\x81\
-\x29\x9f\xe2\x7f\x2e\xbf\xa7\x52\x76\x2c\xea\xb4\x00\x00\x00\x00\
-\x49\x45\x4e\x44\xae\x42\x60\x82\
-\x00\x00\x07\x33\
-\x89\
-\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
-\x00\x00\x30\x00\x00\x00\x30\x08\x06\x00\x00\x00\x57\x02\xf9\x87\
-\x00\x00\x00\x04\x73\x42\x49\x54\x08\x08\x08\x08\x7c\x08\x64\x88\
-\x00\x00\x00\x09\x70\x48\x59\x73\x00\x00\x0e\xc4\x00\x00\x0e\xc4\
-\x01\x95\x2b\x0e\x1b\x00\x00\x00\x19\x74\x45\x58\x74\x53\x6f\x66\
-\x74\x77\x61\x72\x65\x00\x77\x77\x77\x2e\x69\x6e\x6b\x73\x63\x61\
-\x70\x65\x2e\x6f\x72\x67\x9b\xee\x3c\x1a\x00\x00\x06\xb0\x49\x44\
-\x41\x54\x68\x81\xcd\x9a\x4d\x6c\x5c\x57\x15\x80\xbf\x73\x7d\xfd\
-\xfc\x33\x76\x4c\x52\xac\x86\x14\x8a\xea\xa6\x14\x95\xd8\x4d\xe6\
-\xd9\x8e\xa2\x54\xc2\x1b\x7e\x24\x16\x08\xa9\x20\x95\x2e\x40\xe2\
-\x37\x2b\x16\xb0\x42\x40\x09\xad\x84\x58\xf0\x53\x24\x54\x09\x22\
-\x1a\x2a\x10\x8b\x80\x58\xb0\x80\x4d\xd5\x20\x64\x59\x75\xe6\xcd\
-\x40\x52\x07\x09\xb9\x82\xf4\x6f\x0c\x84\xd4\xf1\x8c\x1d\xcf\xbc\
-\x79\xf7\xb0\x98\x19\x67\xe6\x79\x32\x9e\x79\x63\x9b\x7c\xab\xb9\
-\x67\xee\xb9\xf7\x9c\x79\xe7\xdd\x7b\xce\xbd\x23\x24\x64\x66\x66\
-\xe6\xb3\xce\xb9\x1f\x00\x45\x11\x79\xc1\x18\xf3\xc3\xc5\xc5\xc5\
-\xff\x26\x1d\x2f\x29\x92\x54\xd1\xf7\xfd\x3c\x70\xb8\xd6\xdc\x14\
-\x91\x50\x55\x7f\x05\x7c\x27\x08\x82\xfc\xae\x58\xd7\x01\x49\x1d\
-\x30\xbe\xef\x57\x5a\xe8\x97\x45\xa4\xa4\xaa\x3f\xf2\x3c\xef\xbb\
-\x0b\x0b\x0b\xb7\x7a\xb4\x6f\x47\x12\x39\x30\x35\x35\x95\xea\xef\
-\xef\x2f\xb6\xe9\xb2\x0e\x6c\x02\xdf\x08\x82\xe0\xa7\x80\x4b\x32\
-\x4f\x27\x24\x72\xe0\xc4\x89\x13\xe3\xc6\x98\xb7\x00\xdb\x76\x70\
-\x91\x82\xaa\xbe\x2e\x22\x5f\xcb\x64\x32\x7f\x04\x34\xc9\x7c\x6d\
-\xe7\x48\xa2\x34\x39\x39\x79\xd0\xf3\xbc\xeb\x80\xe9\x50\xa5\xa0\
-\xaa\x6b\xc6\x98\xa7\x56\x57\x57\x7f\xb9\xbc\xbc\x5c\x4a\x32\x6f\
-\x2b\x12\x39\x30\x37\x37\x67\x0b\x85\x42\xd8\xad\x9e\xaa\x16\x81\
-\x0a\xf0\xec\xd0\xd0\xd0\xf7\xe7\xe7\xe7\x0b\x49\xe6\x6f\xa4\x97\
-\x55\xa8\x04\x78\x09\xd5\x6f\xa9\x6a\x49\x44\x9e\x02\x9e\x0b\x82\
-\xa0\xeb\x1f\xa3\xce\x36\x07\x26\x27\x27\x0f\x0e\x0c\x0c\xdc\x07\
-\xdc\xaf\xaa\x29\xa0\x5f\x55\x47\x00\x8c\x31\x5e\x4d\x06\xf0\x6d\
-\x60\x30\xe9\xc4\x00\x22\xb2\x09\x6c\xa8\xea\xcf\x81\xeb\xaa\xea\
-\x80\x9b\xb5\xaf\x43\x11\xa9\x2f\x14\x37\x9d\x73\x6f\x94\xcb\xe5\
-\xd7\x96\x96\x96\x9a\x16\x0f\xa9\x1b\xed\x79\xde\x97\x81\xc7\x81\
-\x74\x2f\x46\xed\x35\x22\x92\x01\x2e\x94\x4a\xa5\x9f\x5d\xb9\x72\
-\xe5\x6d\x99\x9b\x9b\x1b\x2c\x14\x0a\x8b\xc0\xe4\xff\xdb\xb8\x2e\
-\x79\x65\x74\x74\x74\xc6\x16\x8b\xc5\x4f\xd2\x6c\x7c\x16\xf8\xb1\
-\x73\xee\x0d\x11\x59\x15\x91\x55\x63\x8c\x02\x58\x6b\x57\x8b\xc5\
-\xa2\x02\x78\x9e\xf7\x3a\x90\xda\x3e\x6e\xc7\x28\xb0\x01\xfc\x09\
-\x38\x53\x2e\x97\x0b\x00\xc3\xc3\xc3\x29\xe7\x9c\x07\x10\x45\xd1\
-\x08\xd0\x0f\x8c\x8b\xc8\xbb\x81\x33\xdc\x8e\x90\x63\x6b\x6b\x6b\
-\x4f\x58\x55\xfd\x68\x6c\xe0\xe7\x82\x20\xf8\xc5\x4e\xb3\xfb\xbe\
-\x9f\x34\xfe\x15\x28\x00\x7f\x13\x91\x33\x99\x4c\x26\x17\xfb\xfe\
-\xed\x3b\x29\xa6\xd3\xe9\x8a\x88\x3c\x5f\x6f\x1b\x63\x3e\x62\x81\
-\x47\x1a\x3b\x19\x63\x32\x3b\x59\xe0\xfb\xfe\x30\xd0\xd7\x95\xd9\
-\x10\x01\x9b\xaa\x9a\x01\xbe\x99\xcd\x66\xff\xdc\xa5\x3e\xc6\x98\
-\x8c\xea\xed\xbd\x50\x55\x1f\xb1\xc0\x91\xc6\x4e\xa5\x52\xe9\xad\
-\x0e\x06\x3a\xe0\x9c\x0b\xa9\x3e\xde\xb6\x88\xc8\xa6\xaa\x56\x54\
-\xf5\x77\xd6\xda\x67\x16\x17\x17\xff\xde\xad\xe1\x0d\xf3\xe6\xa3\
-\x28\x6a\x14\x1d\xb1\xc0\x48\xa3\x24\x95\x4a\xed\xb8\xb9\x18\x63\
-\xd4\xb9\xf6\xe9\x8d\x88\x44\xaa\xba\x09\x9c\x77\xce\x9d\xcd\xe5\
-\x72\xff\x49\x60\x73\x13\x37\x6e\xdc\x28\x8e\x8d\x8d\x35\x8a\x52\
-\x96\x58\x28\x94\xcb\xe5\x4a\x07\x63\xdd\x52\x55\x2b\xd2\x7a\x1f\
-\x54\xd5\xa2\xaa\x06\x22\xf2\xb9\x4c\x26\xf3\x6a\x62\x8b\x63\x2c\
-\x2f\x2f\x87\xbe\xef\x37\x8a\xac\xa5\x1a\x9b\x5b\x78\x9e\x67\x81\
-\xb6\x3b\xe3\xd0\xd0\xd0\x46\xa5\xd2\xd2\xcf\x35\xe0\x4d\x63\xcc\
-\x17\x32\x99\xcc\x7c\x8f\xf6\x6e\xe3\xe8\xd1\xa3\xf1\x90\x0d\x0d\
-\xd5\xd4\x77\x8b\x72\xb9\xbc\xe3\xd2\x78\xf1\xe2\xc5\x8a\xaa\x2e\
-\xd7\x9a\x4a\x75\xf7\xbc\x2c\x22\x4f\x04\x41\xf0\x81\xbd\x30\x1e\
-\xe0\xd0\xa1\x43\x23\x31\xd1\xba\xa5\xea\xc0\x78\x5d\xe2\x9c\x4b\
-\x01\xd7\x77\x1a\x4c\x55\x3f\x0d\x3c\x63\x8c\xb9\x16\x45\xd1\xf9\
-\x5c\x2e\xb7\xb0\xab\xd6\xb6\x20\x0c\xc3\x11\x63\x9a\x12\xe0\xa2\
-\x05\x9a\x72\x0b\x6b\x6d\xdc\xcb\x96\xe4\x72\xb9\x0c\x10\xdf\x43\
-\xf6\x9a\x78\x74\xac\x1b\x11\x69\x5a\x75\xa2\x28\x1a\xdd\x47\x83\
-\xba\x42\x44\x0e\xc4\xda\x6b\xc6\x39\xb7\x1a\xeb\x37\xc6\xdd\xcb\
-\x3b\x1a\x1b\xce\xb9\xd5\x6d\x4f\x20\xee\xe5\xdd\x84\x31\xa6\x29\
-\xbc\x45\xa4\x60\x80\xe1\x58\xbf\x8d\xfd\x33\xa9\x6b\xca\xb1\xf6\
-\x80\x21\xf6\x58\x44\x24\x1e\x52\x77\x13\x6b\xb1\xf6\x01\x03\x34\
-\x85\x8c\x73\xae\xe7\x3a\x75\xaf\x50\xd5\x6d\x0e\x6c\xcb\x85\xac\
-\xb5\xfb\xe2\xc0\xec\xec\xec\x3d\xce\xb9\x8f\x39\xe7\x06\x44\xe4\
-\x7c\x27\x75\xb1\x88\xac\x37\x66\xa3\xd4\x72\xa1\x26\x07\xc2\x30\
-\x6c\x77\x60\xd5\x33\x27\x4f\x9e\xbc\xb7\x52\xa9\x7c\xab\x52\xa9\
-\x7c\x06\x50\x63\x4c\x9f\x73\xee\x08\x70\x76\x27\xdd\x30\x0c\x8b\
-\xd6\x36\x1d\x45\x8d\x58\x62\x9b\xc3\xe0\xe0\xe0\x9e\x38\x30\x35\
-\x35\x95\xb2\xd6\x3e\x1d\x86\xe1\x17\x45\xc4\x8a\xc8\x00\x80\xaa\
-\x22\x22\x1f\xa7\x03\x07\x44\x64\x3d\x26\x4a\x19\x60\xa8\x51\xb2\
-\xb0\xb0\xb0\xb9\x6b\x56\xd7\x48\xa7\xd3\x9f\xea\xef\xef\xbf\x26\
-\x22\x5f\x12\x91\x14\x30\x10\xeb\x72\xb0\x93\x71\x8a\xc5\x62\xfc\
-\xac\x75\xd0\x52\x3d\xb7\x6c\x4c\x30\x84\x5d\x3a\x02\x3c\x7e\xfc\
-\xf8\x43\xd6\xda\xe7\x55\xf5\x51\x62\xa1\x1a\x23\xee\x50\x4b\xc6\
-\xc6\xc6\xe2\x55\x60\x64\x88\xad\xad\x3d\xd4\xba\x5b\xcc\xce\xce\
-\xbe\x2f\x9d\x4e\xff\xba\xaf\xaf\xef\x2f\xce\xb9\x53\xb4\x37\x1e\
-\x3a\xa8\xec\x00\x3c\xcf\x8b\xdb\x56\xb2\xc0\x0a\x30\x51\x97\xf4\
-\xf5\xf5\xdd\x0b\xfc\xa3\x1b\x83\xeb\xf8\xbe\x3f\x09\x9c\x8d\xa2\
-\xe8\xc3\xb5\x18\xbf\x63\xd1\x13\x37\xa4\x93\x4e\x95\x4a\xe5\x5d\
-\x31\xd1\x8a\x05\xae\xd1\xe0\x40\xa5\x52\x79\x98\x2e\x1d\x98\x9e\
-\x9e\x3e\x06\xfc\xc4\x39\x97\x06\x86\x45\xa4\xd3\x43\xdf\x3a\xf1\
-\x97\xb3\x25\xce\xb9\x87\x62\xa2\x6b\x06\x78\xa9\x51\x22\x22\x8f\
-\x9f\x3e\x7d\xba\xa3\x8c\x74\x76\x76\xf6\x9e\xe9\xe9\xe9\x73\xaa\
-\xba\xa0\xaa\x8f\x89\xc8\x48\x02\xe3\xa1\x7a\xcc\xd2\x96\x53\xa7\
-\x4e\x0d\x51\x3d\x39\x6c\xe4\x25\xf1\x7d\xff\x41\x60\x89\xed\x2f\
-\xd2\x1a\xd5\xc2\x66\x13\xa8\xbf\xfd\x1b\xaa\x5a\x02\x10\x91\x51\
-\xc0\xa7\x5a\x53\x27\x3e\x24\xae\x8d\x75\xc3\x39\x97\x6d\x68\x8f\
-\x72\xfb\xee\x61\x14\x38\x04\xbc\x33\xa6\xb6\x61\x8c\x79\xbf\x00\
-\x4c\x4f\x4f\x7f\x48\x55\xbf\x07\x9c\xe8\xc5\x90\x7d\xe4\xaf\xce\
-\xb9\xaf\xe6\x72\xb9\x17\x9b\x7e\xb9\x99\x99\x99\x89\x28\x8a\x3e\
-\x08\xdc\x2f\x22\xef\xe1\x76\x9e\x34\xa6\xaa\xa6\x16\x1e\xf5\x7a\
-\xe1\x3e\xaa\xa5\x68\xb7\x07\x5c\xdb\x10\x91\x9b\xf5\x1a\x5b\x44\
-\xca\xce\xb9\xf5\xda\xe7\x12\xd5\xec\x78\x03\x78\x4d\x44\xde\x74\
-\xce\xbd\x98\xcd\x66\x97\xb7\x74\x7b\x99\xd8\xf7\xfd\xaf\x00\x4f\
-\xab\xea\x80\x88\x24\xbd\x2b\x00\x98\x0f\x82\xe0\xb1\x24\x8a\x49\
-\x5e\xb8\x2d\x82\x20\x78\x36\x0c\xc3\xa3\x22\xf2\x1b\x60\x5d\x44\
-\xa2\x1d\x95\x5a\x93\xb8\x8c\xed\xc9\x01\x80\xcb\x97\x2f\xff\x3b\
-\x08\x82\x27\x8d\x31\x27\x55\xf5\xf7\x54\x97\xc4\x6e\x6f\x5c\x3a\
-\x3a\x48\x68\x45\xcf\x0e\xd4\xb9\x74\xe9\xd2\x52\x10\x04\x9f\x00\
-\x1e\x05\x2e\x50\x8d\xdb\x78\x05\xd5\x92\x5a\x7e\x94\x88\x5d\x73\
-\xa0\x4e\x10\x04\xaf\x06\x41\xf0\xa4\xb5\xf6\x61\xe0\xb7\xb5\x8b\
-\xbd\xb6\xb9\x95\xc6\x92\xfc\x6e\xe8\xe9\x25\xee\x84\x74\x3a\xed\
-\x8b\xc8\x0b\xc0\x7b\xb9\xf3\x85\xc8\x3f\x83\x20\x78\x20\xc9\xf8\
-\xbb\xfe\x04\xe2\x64\xb3\xd9\x60\x62\x62\x62\x0a\xf8\x3a\xd5\xfb\
-\xe2\x56\x79\x4f\xe2\xbf\x24\xf4\xbc\x86\x77\xc2\xd5\xab\x57\x35\
-\x9f\xcf\xbf\x7c\xf8\xf0\xe1\x73\xc6\x98\x11\x55\x3d\x26\x22\x4a\
-\x75\xb7\x55\xe0\x62\x3e\x9f\xbf\x90\x64\xec\x7d\x71\xa0\xce\xca\
-\xca\xca\x46\x3e\x9f\xff\xc3\xf8\xf8\xf8\x39\x63\xcc\x80\x31\xe6\
-\x01\xa0\xa4\xaa\x9f\xcf\xe7\xf3\xff\x4a\x32\xe6\xff\x00\x0c\xe3\
-\x80\xd4\xce\x88\xe4\xf9\x00\x00\x00\x00\x49\x45\x4e\x44\xae\x42\
-\x60\x82\
-\x00\x00\x04\x0b\
-\x89\
-\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
-\x00\x00\x27\x00\x00\x00\x30\x08\x06\x00\x00\x00\x92\x70\x63\x16\
-\x00\x00\x00\x04\x73\x42\x49\x54\x08\x08\x08\x08\x7c\x08\x64\x88\
-\x00\x00\x00\x09\x70\x48\x59\x73\x00\x00\x0e\xc4\x00\x00\x0e\xc4\
-\x01\x95\x2b\x0e\x1b\x00\x00\x00\x19\x74\x45\x58\x74\x53\x6f\x66\
-\x74\x77\x61\x72\x65\x00\x77\x77\x77\x2e\x69\x6e\x6b\x73\x63\x61\
-\x70\x65\x2e\x6f\x72\x67\x9b\xee\x3c\x1a\x00\x00\x03\x88\x49\x44\
-\x41\x54\x58\x85\xed\xd8\xcf\x8b\x1b\x65\x1c\xc7\xf1\xf7\xf7\x49\
-\xb6\x31\xed\xae\xbb\xe0\x82\x20\xbd\xf9\xdb\x58\xa8\x99\x0d\x71\
-\xc5\x83\x87\x0a\xa2\x8b\x20\x82\xe8\xd9\x93\x48\x3d\x09\x85\xda\
-\xdd\xd2\x55\x57\x3c\x7a\xf0\xe6\x9f\xe0\xad\x22\x58\x5a\x04\x61\
-\x71\x6b\x92\x49\xcb\x5a\x17\xf4\x66\xd1\x65\xa9\x82\x85\xda\xad\
-\xc9\xe6\xf9\x78\x58\xb2\x8d\xcd\x4c\x76\x92\x26\x93\x1e\xfc\xdc\
-\x66\x9e\xcf\x24\x2f\x9e\x19\x9e\xf9\x61\xdc\x83\x29\x95\x4a\xc7\
-\x24\xbd\x67\xe3\x86\x74\xa6\x54\x2a\x1d\x6b\xb5\x5a\x2b\x66\x56\
-\x02\xb6\xb2\xe3\x06\x01\x56\x2c\x16\x17\x9c\x73\x4b\xde\xfb\x39\
-\xb3\xdb\xf3\x35\x4e\x9c\x15\x8b\xc5\x05\x33\x3b\x0d\x04\x92\xba\
-\x0b\xe9\x9b\x70\x41\x10\xbc\x0e\x2c\x02\x47\x62\x3a\x3f\x49\xba\
-\x96\x26\xce\x15\x8b\xc5\x57\xcc\xec\x0c\xf0\x4c\x1c\x0a\xc8\x00\
-\x8f\x93\xd2\x35\xd7\x46\x2d\x03\x47\x63\x3a\x57\x80\x09\xe0\xa9\
-\xce\x9d\xa3\xc4\xb5\x4f\xdf\x32\xf0\xc4\x3e\xa8\xc2\x9d\x03\x92\
-\x72\xa3\xc0\xb5\x51\x1f\xb2\x7b\x7a\xa2\xb2\x01\x1c\x88\x42\xed\
-\xfd\x88\x73\x36\x4c\x5c\x1b\xf5\x11\xf0\x58\x54\x41\xd2\x86\x99\
-\x4d\x00\x4f\xc6\xfc\xc6\x46\x7b\x4c\xd2\x3f\x77\x8d\x0b\x82\x60\
-\xc2\xcc\xde\x92\xf4\xc1\x3e\xa8\x8c\x99\xc5\xa1\x2e\x03\x1f\x3b\
-\xe7\xd6\xbc\xf7\xbf\xb6\x77\x0e\x8c\xeb\x40\x9d\x92\xf4\x68\x1c\
-\x0a\xc8\xf6\x40\x5d\x02\x56\x6a\xb5\xda\x97\x80\xca\xe5\xf2\x61\
-\xef\xfd\xde\x60\xdf\xb8\x0e\xd4\xa2\xa4\x47\xe2\x50\x66\xd6\x0b\
-\xb5\x26\x69\x25\x0c\xc3\xaf\x80\xee\xd5\xb7\x5f\x5c\xa1\x50\x38\
-\x90\xcf\xe7\xdf\x94\xb4\x24\xe9\xe1\x98\xda\x3a\x30\x15\x87\x32\
-\xb3\xef\xbd\xf7\x9f\x84\x61\x78\x36\xc9\x7f\x26\xc2\x95\xcb\xe5\
-\x07\x77\x76\x76\xaa\x92\x0e\x47\x0c\x0b\x08\x81\x07\x88\x5f\xf1\
-\x57\x25\x7d\x5a\xab\xd5\x12\xa1\xfa\xc2\x35\x9b\xcd\x29\x33\x8b\
-\x82\xad\x03\xf7\x03\x41\x2f\x54\xd2\x99\x1a\x08\x17\x83\x9a\x66\
-\x9f\x99\x1a\x14\xd5\x4e\x3f\x38\x99\xd9\x65\x49\x3d\x4f\x9f\xf7\
-\xfe\x74\xbd\x5e\xbf\x70\x37\xa8\x76\x12\xe1\x24\xcd\x98\xd9\x0d\
-\x49\x71\xf7\xc6\x73\x66\xb6\x5c\xad\x56\x57\x87\x81\x6a\x27\xe9\
-\xcc\x4d\x03\x53\x11\xfb\x57\x81\xc5\x5a\xad\xf6\xed\xf0\x48\xb7\
-\x33\xd0\x35\x27\xe9\x3c\xb0\x18\x86\xe1\xda\x90\x3d\xff\xc9\x20\
-\xb8\xad\x30\x0c\x5f\x1c\xba\x24\x22\x2e\x49\xc9\xcc\xfe\xea\xd8\
-\x6c\x8c\xc8\xd2\x95\x44\x38\xe0\xfa\x48\x15\x31\x49\x8a\x1b\x4b\
-\xfe\xc7\x0d\x9a\x7b\x1a\x37\x96\x97\xea\x42\xa1\x30\x99\xcb\xe5\
-\x5e\x30\xb3\xa7\x81\x19\xe0\xba\xa4\x1f\x9d\x73\xbf\x8c\x0d\x37\
-\x3f\x3f\x9f\x6f\x34\x1a\x4b\xc0\xbb\xdc\x71\xc7\x31\x33\x9a\xcd\
-\xe6\xdf\x63\xc1\x05\x41\x70\xb0\xd1\x68\x5c\x00\x9e\x8d\xeb\x48\
-\x3a\xd4\xb1\x69\x69\x5e\x73\x67\xe8\x01\x8b\xc8\x64\x9a\xb8\x37\
-\xfa\xec\xe7\xd2\xc4\xdd\xd7\x4f\x59\xd2\xcd\xd4\x70\x66\x76\xae\
-\xcf\xfe\xd7\xa9\xe1\x5a\xad\xd6\x09\xe0\xb7\x84\xf5\x4d\xe7\xdc\
-\xfb\xa9\xe1\xea\xf5\xfa\xef\xce\xb9\x79\xe0\x9b\x5e\x3d\x49\xe7\
-\xbd\xf7\xf3\x95\x4a\xe5\x6a\xaa\xeb\x5c\xa5\x52\xb9\x0a\xbc\x54\
-\x2a\x95\x8e\x7a\xef\x5f\x05\x8e\x48\x9a\x61\xf7\xa9\x67\xdd\xcc\
-\xce\x86\x61\x18\xb6\xfb\x5d\xb8\x20\x08\xa6\x9d\x73\x05\xe0\x60\
-\xab\xd5\xba\x91\xcf\xe7\xaf\x6c\x6f\x6f\x0f\x1b\x79\x89\xdd\x4f\
-\x11\x3d\xb3\x87\x9b\x9b\x9b\x7b\x19\x38\x21\xe9\x79\xef\xbd\x83\
-\xdd\x55\xfb\xd6\xad\x5b\x2d\xe7\xdc\xc5\xa8\x6f\xb6\xa3\x4e\x16\
-\xb0\x20\x08\x3e\x97\xf4\x4e\x4c\x27\x23\xe9\xb9\x34\x51\xed\xb8\
-\x20\x08\x8e\x03\x71\xb0\xa8\x1c\xda\xbf\x32\x9c\x38\xe0\x78\x9f\
-\xc7\x44\xbd\x22\x8e\x24\x0e\x78\xa8\x9f\x03\x24\xdd\x1c\x91\xa5\
-\x2b\x0e\xa8\xf7\x73\x80\x99\xfd\x30\x22\x4b\x57\x9c\xf7\xfe\x24\
-\xb0\x93\xb0\xdf\x30\xb3\x53\xa3\x04\x75\xc6\xd5\xeb\xf5\xef\x24\
-\xbd\x06\xfc\xb1\x4f\x77\xcb\xcc\x16\xaa\xd5\x6a\x6a\x33\x97\x01\
-\xd8\xdc\xdc\xfc\x79\x76\x76\xf6\x8b\x4c\x26\x73\x4d\x52\xce\xcc\
-\x26\xd9\x7d\x8a\xf8\x13\xb8\x08\x7c\x96\xcd\x66\xdf\xae\x54\x2a\
-\x1b\x69\xc1\x00\xfe\x05\xf1\x8e\x57\x71\xd6\xf5\xb7\xfb\x00\x00\
-\x00\x00\x49\x45\x4e\x44\xae\x42\x60\x82\
-\x00\x00\x02\xa6\
-\x89\
-\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
-\x00\x00\x30\x00\x00\x00\x30\x08\x06\x00\x00\x00\x57\x02\xf9\x87\
-\x00\x00\x00\x04\x73\x42\x49\x54\x08\x08\x08\x08\x7c\x08\x64\x88\
-\x00\x00\x00\x09\x70\x48\x59\x73\x00\x00\x0e\xc4\x00\x00\x0e\xc4\
-\x01\x95\x2b\x0e\x1b\x00\x00\x00\x19\x74\x45\x58\x74\x53\x6f\x66\
-\x74\x77\x61\x72\x65\x00\x77\x77\x77\x2e\x69\x6e\x6b\x73\x63\x61\
-\x70\x65\x2e\x6f\x72\x67\x9b\xee\x3c\x1a\x00\x00\x02\x23\x49\x44\
-\x41\x54\x68\x81\xed\xda\x41\x6a\x13\x51\x18\xc0\xf1\xff\xf7\x35\
-\xc9\x88\x2d\xd6\x06\xb5\x5a\x5c\x14\x0b\x1e\x20\x93\xcd\x9c\x42\
-\x50\xe8\x11\x44\xaf\xe0\x05\xbc\x81\x1b\x6f\x20\x82\xde\xa2\x9b\
-\x26\x9b\x6c\x45\xbb\x6a\xc4\x52\x63\xab\x8d\x21\xd3\xbc\xcf\x45\
-\x12\x49\x4b\x41\x99\xb7\xf8\xfa\x4a\x7f\x90\x45\x86\x99\xf0\x7f\
-\x79\x84\x0c\xf3\x9e\x70\x96\xb4\xdb\xed\xc7\x66\x96\x03\x5b\x22\
-\xb2\x6e\x66\x0f\x81\x5b\xb3\xd7\x0a\x50\x9f\x9d\x7b\x13\xc8\xb8\
-\xd8\x04\x38\x5e\x78\xbf\x78\xdd\xdc\x6d\x40\xce\x1d\x1b\x01\xbf\
-\x81\x5f\xc0\x58\x44\xbe\x85\x10\x0e\x80\xbe\xaa\x7e\x16\x91\xee\
-\x68\x34\xea\xf4\x7a\xbd\xc1\xdf\x60\x80\xa2\x28\x9a\x65\x59\xbe\
-\x36\xb3\xed\xd9\x07\x5f\x66\x13\x33\xfb\x98\x65\xd9\xf3\x9d\x9d\
-\x9d\xef\x35\x80\xb2\x2c\xdf\x9a\xd9\x53\xef\xb2\xff\xb4\x24\x22\
-\xcf\xc6\xe3\xf1\x01\xf0\x52\x8b\xa2\x68\x9a\xd9\x13\xef\xaa\x0a\
-\xb6\x01\xd1\xb2\x2c\x73\x60\xc9\xbb\xa6\x82\x66\xab\xd5\xda\x52\
-\x33\x6b\x79\x97\x54\xa5\xaa\x6d\x15\x91\x47\xde\x21\x55\x99\xd9\
-\xa6\x86\x10\xee\x7b\x87\x44\x78\xa0\x22\xb2\xee\x5d\x11\x61\x43\
-\x81\x35\xef\x8a\xaa\x44\x64\x4d\x81\x65\xef\x90\xaa\xcc\x6c\x45\
-\x99\xde\x12\xa4\x6a\x45\x81\x1b\xde\x15\x11\x96\x15\x50\xef\x8a\
-\x08\x9a\x72\x3c\x5c\x0f\xc0\x9f\x28\x60\xde\x15\x11\xae\x67\xc0\
-\x9b\x28\x70\xea\x5d\x11\x21\x28\x50\x7a\x57\x44\x98\x28\x30\xf6\
-\xae\x88\x70\x35\x06\x90\xf2\x8f\x58\x15\xa8\x79\x57\x44\xa8\x2b\
-\x69\x3e\x91\x98\xab\x5d\x89\x19\x48\xf9\xdf\xb8\x9e\x72\x3c\x30\
-\xfd\xf6\x83\x77\x44\x84\xe4\xef\x85\x92\x9f\x81\xe4\x07\x20\xa9\
-\x0f\x00\x65\xba\x1c\x94\x2a\x53\x60\xe8\x5d\x11\x61\xa8\xc0\x89\
-\x77\x45\x84\xa1\x02\x3f\xbd\x2b\x22\x0c\x15\x18\xfc\xf3\xb4\x4b\
-\x4a\x44\x06\x2a\x22\xfb\xde\x21\x11\xfa\x0a\xf4\xbd\x2b\xaa\x32\
-\xb3\xaf\x1a\x42\xd8\xf3\x0e\x89\xf0\x45\x55\x75\xd7\xbb\xa2\x2a\
-\x11\xd9\x15\x40\xf2\x3c\x3f\x24\xbd\xa5\xa6\x53\xe0\x8e\x02\x66\
-\x66\xef\xbc\x6b\x2a\xf8\xd0\xe9\x74\x8e\x14\x20\xcb\xb2\x57\xc0\
-\x7b\xd2\x78\x4a\x77\x08\xbc\x69\x34\x1a\x2f\xe0\xdc\x76\x97\x3c\
-\xcf\x57\x67\x5b\x6d\x72\x11\xd9\x04\x36\xcc\xec\x9e\x88\xdc\x65\
-\xba\x5d\x66\x95\xe9\x16\x9b\x8c\xb3\xdb\x69\x2e\x32\xdf\x3a\x33\
-\xd7\xe0\xe2\x05\xc5\x63\xce\xde\x8f\x8d\xcc\xec\x04\x38\x12\x91\
-\x1f\xc0\x3e\xd0\x17\x91\xbd\x10\xc2\x6e\xb7\xdb\xfd\xb4\x78\xf1\
-\x1f\x3d\x13\xa0\xb4\xf5\x15\xaf\xae\x00\x00\x00\x00\x49\x45\x4e\
-\x44\xae\x42\x60\x82\
-\x00\x00\x04\x7c\
-\x89\
-\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
-\x00\x00\x30\x00\x00\x00\x30\x08\x06\x00\x00\x00\x57\x02\xf9\x87\
-\x00\x00\x00\x04\x73\x42\x49\x54\x08\x08\x08\x08\x7c\x08\x64\x88\
-\x00\x00\x00\x09\x70\x48\x59\x73\x00\x00\x0e\xc4\x00\x00\x0e\xc4\
-\x01\x95\x2b\x0e\x1b\x00\x00\x00\x19\x74\x45\x58\x74\x53\x6f\x66\
-\x74\x77\x61\x72\x65\x00\x77\x77\x77\x2e\x69\x6e\x6b\x73\x63\x61\
-\x70\x65\x2e\x6f\x72\x67\x9b\xee\x3c\x1a\x00\x00\x03\xf9\x49\x44\
-\x41\x54\x68\x81\xd5\x99\x4f\x68\x5c\x55\x14\xc6\xbf\xef\xce\x33\
-\xa9\x38\x23\x16\xff\xc0\x24\x56\xb2\x31\x6a\x17\x6d\x72\xef\x4b\
-\x5c\x64\xd1\x59\x09\x16\x22\xb8\x08\x82\x82\xcb\x06\x41\x04\x57\
-\xd5\x85\x0b\x29\x88\xbb\x62\xc5\xd0\xc4\x55\x1a\x5b\x4c\x16\x55\
-\x8a\x7f\x69\xa9\x11\x29\xa1\xce\x7d\x77\x34\xd0\x96\x5a\x18\x41\
-\xd3\x06\x11\xda\xe2\xc4\x1a\xe2\xe4\x1d\x17\x93\x91\x0a\x89\xf3\
-\xde\xe4\xbd\x99\xc9\x0f\xde\xea\x9e\xfb\xbd\xef\x70\x2e\xef\xdd\
-\x7b\x2e\x0b\x85\x82\xb7\xb2\xb2\x32\x2b\x22\x07\x01\x2c\x03\x38\
-\x27\x22\x33\xce\xb9\xef\xb0\x03\xa0\x31\xe6\x45\x00\x27\x37\x19\
-\x2b\x89\xc8\x11\xe7\xdc\xa7\x00\xa4\xc5\xbe\x22\xa3\x48\x3e\xbb\
-\xc5\xd8\x20\xc9\xd3\xc6\x98\x92\xd6\xfa\xf9\x96\xba\x8a\x81\x12\
-\x91\xa7\x1a\xc4\xec\x27\x79\x5a\x6b\x3d\x3f\x34\x34\x34\xd0\x12\
-\x57\x31\x50\x00\x1e\x8e\x12\x48\xf2\x40\x18\x86\x56\x6b\x7d\xdc\
-\x18\xf3\x50\xca\xbe\x22\xa3\x00\x74\xc7\x88\xcf\x90\x1c\x07\xf0\
-\x93\xd6\xfa\x10\x00\xa6\x63\x2b\x3a\x0a\xc0\x3d\x4d\xcc\xdb\x4d\
-\x72\x52\x6b\xfd\x8d\xef\xfb\x4f\x24\x6d\x2a\x0e\x6a\xe3\x69\x0a\
-\x92\x07\x44\xa4\x64\x8c\x39\x5c\x28\x14\xbc\x04\x7d\x45\x46\x01\
-\xf8\x73\x9b\x1a\xf7\x02\x78\xb7\x52\xa9\x04\xc6\x98\xa7\x13\xf0\
-\x14\x0b\x05\xe0\x76\x42\x5a\xfb\x00\x5c\x30\xc6\xbc\x37\x32\x32\
-\x92\x4b\x48\xb3\x21\x8a\xe4\x1f\x09\xea\x65\x00\xbc\xb6\xba\xba\
-\x7a\xd5\xf7\xfd\x97\x13\xd4\xdd\x12\x25\x22\xb7\x52\xd0\xcd\x8b\
-\xc8\xb4\xef\xfb\x67\x8c\x31\x8f\xa5\xa0\xff\x2f\x0a\xc0\x8d\xb4\
-\xc4\x45\x64\x14\xc0\x65\xad\xf5\x71\xad\xf5\xbe\x34\xde\x91\xe9\
-\xed\xed\x35\x00\x0a\x69\x88\x6f\xd0\x45\xd2\x27\xf9\x4a\x4f\x4f\
-\xcf\x68\x3e\x9f\x47\x5f\x5f\xdf\xe5\xa5\xa5\xa5\x6a\x12\xe2\x2a\
-\x0c\xc3\xeb\x49\x08\x45\xc4\x90\x9c\x5c\x5b\x5b\xfb\xd9\x18\xf3\
-\xce\xc0\xc0\x40\xdf\x76\x05\xe9\xfb\xfe\x41\x11\xf9\x3c\x01\x73\
-\xcd\x10\x8a\xc8\x79\x92\x53\xb9\x5c\xee\x93\xf9\xf9\xf9\xd8\x55\
-\xe1\xe0\xe0\xe0\x7e\xa5\xd4\x0f\x69\xb8\x8b\xc9\x0d\x00\x33\x00\
-\x26\x82\x20\xf8\x25\xea\x24\x6e\x6c\xcc\x7e\x4f\xcd\x56\x7c\xfe\
-\x16\x91\x33\x4a\xa9\xa3\xd6\xda\x0b\x8d\x82\x89\x5a\x12\x77\x00\
-\xec\x4a\xdf\x5b\x6c\x02\x92\xc7\xb2\xd9\xec\xa9\xad\x96\x97\x42\
-\xed\xb4\xb5\xdc\x5a\x5f\x91\x31\x22\x32\x5d\xa9\x54\x2e\x69\xad\
-\x5f\xc0\x26\xbb\x5f\x05\x00\x22\xd2\xa9\x09\xd4\xe9\x27\xf9\xb1\
-\x31\xc6\x1a\x63\x9e\xb9\x7b\xa0\xbe\x13\xed\xf4\x04\xea\x68\x00\
-\x5f\x1b\x63\xe6\xea\x87\xaa\x9d\x96\x40\x9d\x31\x00\xc5\xe1\xe1\
-\xe1\xfe\x9d\x9a\x00\x00\xf4\xad\xaf\xaf\x9f\x52\x00\xa0\x94\x6a\
-\xfb\xd1\xb0\x49\x76\xd5\x2b\x90\x6f\xab\x8d\xe6\xf8\x2d\x0c\xc3\
-\x97\xea\x5f\xa1\x9e\x76\xbb\x89\xc9\x59\xa5\xd4\x50\xa9\x54\xfa\
-\xb1\x7e\x8e\xdd\x29\x09\x5c\x13\x91\xb7\x9c\x73\x73\xd8\xe8\x16\
-\xd6\x97\x50\xa7\x27\x70\x5d\x44\xc6\x73\xb9\xdc\x5e\xe7\xdc\x2c\
-\xee\x6a\x75\x72\x6c\x6c\x2c\x53\x2e\x97\x57\x01\xb4\xa5\xab\xd0\
-\x80\x6b\x00\x3e\xe8\xea\xea\x9a\x5a\x58\x58\xf8\x6b\xb3\x00\xaf\
-\x5c\x2e\x3f\x82\xce\x32\x2f\x00\xce\x91\x3c\x6a\xad\xfd\x0a\x0d\
-\x1a\xcb\x1e\xc9\x3d\x22\x1d\xd1\x7c\xbe\x4d\x72\x8e\xe4\xb1\x62\
-\xb1\x78\x29\xea\x24\x2f\x0c\xc3\x47\xc9\xb6\xfe\x06\x02\x11\x99\
-\xea\xee\xee\x9e\xd9\x6a\x99\xfc\x1f\x9e\x52\xaa\xa7\x0d\x15\xb8\
-\x05\xe0\x84\x88\x4c\x3a\xe7\xae\x6c\x47\xc8\x0b\xc3\x70\x4f\x0b\
-\x2b\xe0\x44\x64\xb2\x5a\xad\x9e\x5c\x5c\x5c\xdc\x6e\x47\x10\x40\
-\x6b\x2a\xb0\x0a\x60\x96\xe4\x84\xb5\xf6\xfb\xa4\xc5\x3d\x11\xe9\
-\x4d\x5a\xb4\x8e\x88\x7c\x99\xc9\x64\x5e\x2d\x16\x8b\xe5\xb4\xde\
-\xe1\x01\x78\x30\x05\xdd\x65\x92\x6f\x04\x41\x70\x22\x05\xed\xff\
-\xa0\x00\xdc\x9f\xa0\xde\x3a\x80\xf7\x3d\xcf\x7b\xd2\x5a\x9b\xba\
-\x79\xa0\x56\x81\xdd\x09\x69\x2d\x02\x38\x14\x04\xc1\xc5\x84\xf4\
-\x22\xa1\x00\xdc\xb7\x4d\x8d\x3b\x24\x0f\xe7\x72\x39\xd3\x6a\xf3\
-\x40\xad\x02\x61\xb3\x93\x45\xe4\x5b\xa5\xd4\xb8\xb5\xf6\x6a\x82\
-\x9e\x62\xe1\x01\xa8\x02\xe8\x8a\x39\xef\xa6\x88\xbc\xe9\x9c\xfb\
-\x10\x6d\xbe\x04\x57\x00\xd6\x62\xc4\x57\x01\x4c\x64\x32\x99\x7e\
-\xe7\xdc\x14\x3a\xe0\x06\xdf\x43\xad\xad\xf8\x40\x84\xd8\xf3\x22\
-\xf2\xba\x73\x6e\x31\x65\x4f\xb1\xf0\x44\xe4\x0a\xc9\xc7\xb7\x0a\
-\x20\x69\xc3\x30\x7c\xdb\x39\xf7\x59\x2b\x8d\x45\xc5\x53\x4a\x7d\
-\x21\x22\xcf\x6d\x32\x76\x11\xc0\x11\x6b\x6d\xbb\x5a\xef\x91\xf0\
-\xb2\xd9\xec\x74\xa5\x52\x19\x45\xed\x96\xe6\x57\x00\x67\x49\x7e\
-\x94\xc6\xbe\x25\x0d\xfe\x01\x9c\x4d\x6c\x01\x33\xa4\xd5\x1f\x00\
-\x00\x00\x00\x49\x45\x4e\x44\xae\x42\x60\x82\
-"
-
-qt_resource_name = b"\
-\x00\x03\
-\x00\x00\x78\xc3\
-\x00\x72\
-\x00\x65\x00\x73\
-\x00\x0d\
-\x09\x4c\xd1\xa7\
-\x00\x76\
-\x00\x6f\x00\x6c\x00\x75\x00\x6d\x00\x65\x00\x6d\x00\x61\x00\x78\x00\x2e\x00\x70\x00\x6e\x00\x67\
-\x00\x0b\
-\x0d\xd7\xa0\xc7\
-\x00\x73\
-\x00\x68\x00\x75\x00\x66\x00\x66\x00\x6c\x00\x65\x00\x2e\x00\x70\x00\x6e\x00\x67\
-\x00\x0f\
-\x00\xbc\x62\x07\
-\x00\x73\
-\x00\x65\x00\x65\x00\x6b\x00\x66\x00\x6f\x00\x72\x00\x77\x00\x61\x00\x72\x00\x64\x00\x2e\x00\x70\x00\x6e\x00\x67\
-\x00\x08\
-\x0c\xf7\x59\xc7\
-\x00\x6e\
-\x00\x65\x00\x78\x00\x74\x00\x2e\x00\x70\x00\x6e\x00\x67\
-\x00\x09\
-\x0c\x98\xba\x47\
-\x00\x70\
-\x00\x61\x00\x75\x00\x73\x00\x65\x00\x2e\x00\x70\x00\x6e\x00\x67\
-\x00\x0c\
-\x08\x37\xcd\x47\
-\x00\x70\
-\x00\x72\x00\x65\x00\x76\x00\x69\x00\x6f\x00\x75\x00\x73\x00\x2e\x00\x70\x00\x6e\x00\x67\
-\x00\x0e\
-\x00\xe0\x38\x87\
-\x00\x76\
-\x00\x6f\x00\x6c\x00\x75\x00\x6d\x00\x65\x00\x6d\x00\x75\x00\x74\x00\x65\x00\x2e\x00\x70\x00\x6e\x00\x67\
-\x00\x0c\
-\x08\xad\xd4\x47\
-\x00\x73\
-\x00\x65\x00\x65\x00\x6b\x00\x62\x00\x61\x00\x63\x00\x6b\x00\x2e\x00\x70\x00\x6e\x00\x67\
-\x00\x0d\
-\x0d\x54\xc2\xe7\
-\x00\x6e\
-\x00\x6f\x00\x74\x00\x65\x00\x73\x00\x6d\x00\x61\x00\x69\x00\x6e\x00\x2e\x00\x70\x00\x6e\x00\x67\
-\x00\x0a\
-\x0b\x88\x4f\x87\
-\x00\x72\
-\x00\x65\x00\x70\x00\x65\x00\x61\x00\x74\x00\x2e\x00\x70\x00\x6e\x00\x67\
-\x00\x08\
-\x06\xa8\x59\xe7\
-\x00\x6e\
-\x00\x6f\x00\x74\x00\x65\x00\x2e\x00\x70\x00\x6e\x00\x67\
-\x00\x08\
-\x0b\x63\x58\x07\
-\x00\x73\
-\x00\x74\x00\x6f\x00\x70\x00\x2e\x00\x70\x00\x6e\x00\x67\
-\x00\x08\
-\x02\x8c\x59\xa7\
-\x00\x70\
-\x00\x6c\x00\x61\x00\x79\x00\x2e\x00\x70\x00\x6e\x00\x67\
-"
-
-qt_resource_struct_v1 = b"\
-\x00\x00\x00\x00\x00\x02\x00\x00\x00\x01\x00\x00\x00\x01\
-\x00\x00\x00\x00\x00\x02\x00\x00\x00\x01\x00\x00\x00\x02\
-\x00\x00\x00\x00\x00\x02\x00\x00\x00\x0d\x00\x00\x00\x03\
-\x00\x00\x00\x48\x00\x00\x00\x00\x00\x01\x00\x00\x0c\x7a\
-\x00\x00\x00\xb8\x00\x00\x00\x00\x00\x01\x00\x00\x1c\x6b\
-\x00\x00\x01\x5e\x00\x00\x00\x00\x00\x01\x00\x00\x3b\xaf\
-\x00\x00\x01\x32\x00\x00\x00\x00\x00\x01\x00\x00\x34\xf6\
-\x00\x00\x00\x9a\x00\x00\x00\x00\x00\x01\x00\x00\x18\x06\
-\x00\x00\x00\xda\x00\x00\x00\x00\x00\x01\x00\x00\x22\x2f\
-\x00\x00\x00\x0c\x00\x00\x00\x00\x00\x01\x00\x00\x00\x00\
-\x00\x00\x01\x48\x00\x00\x00\x00\x00\x01\x00\x00\x39\x05\
-\x00\x00\x01\x18\x00\x00\x00\x00\x00\x01\x00\x00\x2d\xbf\
-\x00\x00\x00\x82\x00\x00\x00\x00\x00\x01\x00\x00\x14\xd2\
-\x00\x00\x00\x6c\x00\x00\x00\x00\x00\x01\x00\x00\x10\x6b\
-\x00\x00\x00\xf8\x00\x00\x00\x00\x00\x01\x00\x00\x25\xe2\
-\x00\x00\x00\x2c\x00\x00\x00\x00\x00\x01\x00\x00\x06\xc2\
-"
-
-qt_resource_struct_v2 = b"\
-\x00\x00\x00\x00\x00\x02\x00\x00\x00\x01\x00\x00\x00\x01\
-\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x02\x00\x00\x00\x01\x00\x00\x00\x02\
-\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x02\x00\x00\x00\x0d\x00\x00\x00\x03\
-\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x48\x00\x00\x00\x00\x00\x01\x00\x00\x0c\x7a\
-\x00\x00\x01\x65\x2f\x82\x66\x03\
-\x00\x00\x00\xb8\x00\x00\x00\x00\x00\x01\x00\x00\x1c\x6b\
-\x00\x00\x01\x65\x2f\x6a\x97\x5d\
-\x00\x00\x01\x5e\x00\x00\x00\x00\x00\x01\x00\x00\x3b\xaf\
-\x00\x00\x01\x65\x0c\xf2\x3e\x50\
-\x00\x00\x01\x32\x00\x00\x00\x00\x00\x01\x00\x00\x34\xf6\
-\x00\x00\x01\x65\x0d\x2a\x39\x91\
-\x00\x00\x00\x9a\x00\x00\x00\x00\x00\x01\x00\x00\x18\x06\
-\x00\x00\x01\x65\x2f\x80\x67\xcb\
-\x00\x00\x00\xda\x00\x00\x00\x00\x00\x01\x00\x00\x22\x2f\
-\x00\x00\x01\x65\x2f\x81\x8d\x25\
-\x00\x00\x00\x0c\x00\x00\x00\x00\x00\x01\x00\x00\x00\x00\
-\x00\x00\x01\x65\x2f\x67\x82\x90\
-\x00\x00\x01\x48\x00\x00\x00\x00\x00\x01\x00\x00\x39\x05\
-\x00\x00\x01\x65\x0d\x15\x6e\x66\
-\x00\x00\x01\x18\x00\x00\x00\x00\x00\x01\x00\x00\x2d\xbf\
-\x00\x00\x01\x65\x11\x83\x12\xf6\
-\x00\x00\x00\x82\x00\x00\x00\x00\x00\x01\x00\x00\x14\xd2\
-\x00\x00\x01\x65\x0f\xdc\xba\xef\
-\x00\x00\x00\x6c\x00\x00\x00\x00\x00\x01\x00\x00\x10\x6b\
-\x00\x00\x01\x65\x2f\x7f\x17\x90\
-\x00\x00\x00\xf8\x00\x00\x00\x00\x00\x01\x00\x00\x25\xe2\
-\x00\x00\x01\x65\x0d\x32\xd4\x39\
-\x00\x00\x00\x2c\x00\x00\x00\x00\x00\x01\x00\x00\x06\xc2\
-\x00\x00\x01\x65\x11\x7f\x4d\x7b\
-"
-
-qt_version = [int(v) for v in QtCore.qVersion().split('.')]
-if qt_version < [5, 8, 0]:
-    rcc_version = 1
-    qt_resource_struct = qt_resource_struct_v1
-else:
-    rcc_version = 2
-    qt_resource_struct = qt_resource_struct_v2
-
-def qInitResources():
-    QtCore.qRegisterResourceData(rcc_version, qt_resource_struct, qt_resource_name, qt_resource_data)
-
-def qCleanupResources():
-    QtCore.qUnregisterResourceData(rcc_version, qt_resource_struct, qt_resource_name, qt_resource_data)
-
-qInitResources()
+resources.load()
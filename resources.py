@@ -0,0 +1,35 @@
+#!/usr/bin/env python
+import os
+import sys
+import struct
+import subprocess
+
+ROOT = os.path.dirname(os.path.abspath(__file__))
+QRC = os.path.join(ROOT, 'res.qrc')
+RCC = os.path.join(ROOT, 'res.rcc')
+# Binary resource header: magic, format version, then offsets of the tree, data and names blocks.
+HEADER = struct.Struct('>4sIIII')
+VERSION = 2
+
+
+def load(filename=RCC):
+    # Qt maps the file instead of copying the icons out of a Python bytes literal.
+    from PyQt5 import QtCore
+    return QtCore.QResource.registerResource(filename)
+
+
+def build(qrc=QRC, rcc=RCC):
+    # pyrcc5 can only emit Python, so its tables are repacked into the layout `rcc -binary` writes.
+    source = subprocess.run(['pyrcc5', qrc], stdout=subprocess.PIPE, check=True, cwd=os.path.dirname(qrc)).stdout
+    tables = dict()
+    exec(compile(source.replace(b'\nqInitResources()', b''), qrc, 'exec'), tables)
+    data, names, tree = tables['qt_resource_data'], tables['qt_resource_name'], tables['qt_resource_struct_v2']
+    with open(rcc, 'wb') as output:
+        output.write(HEADER.pack(b'qres', VERSION, HEADER.size + len(data) + len(names), HEADER.size, HEADER.size + len(data)))
+        output.write(data)
+        output.write(names)
+        output.write(tree)
+
+
+if __name__ == '__main__':
+    build(*sys.argv[1:])
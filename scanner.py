@@ -0,0 +1,122 @@
+#!/usr/bin/env python
+from collections import deque
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+import musicformat
+
+SKIPEXTENSIONS = {'.jpg', '.jpeg', '.png', '.gif', '.bmp', '.webp', '.nfo', '.cue', '.txt', '.log', '.m3u', '.m3u8', '.pls',
+                  '.pdf', '.db', '.ini', '.sfv', '.md5', '.lrc', '.accurip', '.xml', '.json', '.html', '.url', '.part', '.ytdl'}
+
+
+class Scanner:
+    def __init__(self, workers=None, batchsize=64, index=None):
+        if workers:
+            self.workers = workers
+        else:
+            self.workers = min(32, (os.cpu_count() or 1) * 4)
+        self.batchsize = batchsize
+        self.index = index
+        self.files = 0
+        self.skipped = 0
+        self.cached = 0
+        self.songs = 0
+        self.elapsed = 0.0
+
+
+    def walk(self, directory):
+        stack = [directory]
+        while stack:
+            try:
+                with os.scandir(stack.pop()) as entries:
+                    subdirs = list()
+                    for entry in entries:
+                        try:
+                            if entry.is_dir(follow_symlinks=False):
+                                subdirs.append(entry.path)
+                            elif entry.is_file():
+                                yield entry.path
+                        except OSError:
+                            pass
+                    stack.extend(reversed(subdirs))
+            except OSError:
+                pass
+
+
+    def prefilter(self, paths):
+        for path in paths:
+            if os.path.splitext(path)[1].lower() in SKIPEXTENSIONS:
+                self.skipped += 1
+            else:
+                yield path
+
+
+    def batches(self, paths):
+        batch = list()
+        for path in paths:
+            self.files += 1
+            batch.append(path)
+            if len(batch) >= self.batchsize:
+                yield batch
+                batch = list()
+        if batch:
+            yield batch
+
+
+    def sniff(self, batch):
+        return list(zip(batch, musicformat.musicFormats(batch)))
+
+
+    def sniffAll(self, paths):
+        pending = deque()
+        with ThreadPoolExecutor(max_workers=self.workers) as executor:
+            for batch in self.batches(paths):
+                pending.append(executor.submit(self.sniff, batch))
+                if len(pending) >= self.workers * 2:
+                    yield from pending.popleft().result()
+            while pending:
+                yield from pending.popleft().result()
+
+
+    def accept(self, results):
+        for path, form in results:
+            if form:
+                yield path
+
+
+    def iterate(self, music):
+        self.files = 0
+        self.skipped = 0
+        self.cached = 0
+        self.songs = 0
+        self.elapsed = 0.0
+        timer = time.perf_counter()
+        if os.path.isdir(music):
+            if self.index:
+                songs = self.index.update(music, self)
+            else:
+                songs = self.accept(self.sniffAll(self.prefilter(self.walk(music))))
+        else:
+            if not os.path.isabs(music):
+                music = os.path.join(os.getcwd(), music)
+            songs = self.accept(self.sniff([music]))
+            self.files = 1
+        for song in songs:
+            self.songs += 1
+            yield song
+        self.elapsed = time.perf_counter() - timer
+
+
+    def scan(self, music):
+        return list(self.iterate(music))
+
+
+    def throughput(self):
+        # Files served from the index count too, or a warm start would report no throughput at all.
+        if self.elapsed > 0:
+            return (self.files + self.cached) / self.elapsed
+        return 0.0
+
+
+    def stats(self):
+        return {'files': self.files, 'skipped': self.skipped, 'cached': self.cached, 'songs': self.songs, 'elapsed': self.elapsed, 'workers': self.workers, 'throughput': self.throughput()}
@@ -0,0 +1,65 @@
+#!/usr/bin/env python
+import os
+import sys
+import time
+import tempfile
+import unittest
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+HEADER = b'ID3\x03\x00\x00\x00\x00\x00\x00' + b'\x00' * 64
+FFPLAY = '#!/bin/sh\nexec sleep 600\n'
+FFPROBE = '#!/bin/sh\necho \'{"format": {"duration": "600.000000"}}\'\n'
+
+
+def makeFakeBinaries(directory, scripts):
+    bindir = os.path.join(directory, 'bin')
+    os.makedirs(bindir)
+    for name, script in scripts.items():
+        path = os.path.join(bindir, name)
+        with open(path, 'w') as binary:
+            binary.write(script)
+        os.chmod(path, 0o755)
+    return bindir
+
+
+def writeSong(path):
+    with open(path, 'wb') as song:
+        song.write(HEADER)
+
+
+def makeMusic(directory, names):
+    music = os.path.join(directory, 'Music')
+    os.makedirs(music)
+    for name in names:
+        writeSong(os.path.join(music, name))
+    return music
+
+
+def waitFor(condition, timeout=5.0):
+    deadline = time.monotonic() + timeout
+    while not condition():
+        if time.monotonic() > deadline:
+            return False
+        time.sleep(0.02)
+    return True
+
+
+class FakeBinariesTest(unittest.TestCase):
+    # Runs each test against fake player binaries on PATH, a scratch cache and a Music directory of SONGS.
+    FAKES = {'ffplay': FFPLAY, 'ffprobe': FFPROBE}
+    SONGS = ('a.mp3', 'b.mp3', 'c.mp3')
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.root = self.directory.name
+        bindir = makeFakeBinaries(self.root, self.FAKES)
+        self.environment = dict(os.environ)
+        os.environ['PATH'] = f'{bindir}{os.pathsep}{os.environ["PATH"]}'
+        os.environ['XDG_CACHE_HOME'] = os.path.join(self.root, 'cache')
+        self.music = makeMusic(self.root, self.SONGS)
+
+
+    def tearDown(self):
+        os.environ.clear()
+        os.environ.update(self.environment)
+        self.directory.cleanup()
@@ -0,0 +1,66 @@
+#!/usr/bin/env python
+import os
+import json
+import socket
+import unittest
+from support import FakeBinariesTest
+import pycli_music
+import control
+
+
+class ControlVolumeTest(FakeBinariesTest):
+    SONGS = ('a.mp3',)
+
+    def setUp(self):
+        super().setUp()
+        self.player = pycli_music.Player(self.music, index=False, backend='subprocess')
+        self.server = control.ControlServer(self.player, os.path.join(self.root, 'control.sock'))
+        self.server.start()
+        self.client = control.ControlClient(self.server.path)
+
+
+    def tearDown(self):
+        self.client.close()
+        self.server.stop()
+        self.player.end()
+        super().tearDown()
+
+
+    def test_volume_is_clamped(self):
+        self.client.send('volume', 400)
+        self.assertEqual(self.client.send('state')['volume'], 100)
+        self.client.send('volume', -5)
+        self.assertEqual(self.client.send('state')['volume'], 0)
+
+
+    def test_bad_volume_is_refused(self):
+        self.client.send('volume', 40)
+        for level in ('abc', None, True, [50]):
+            with self.assertRaises(RuntimeError):
+                self.client.send('volume', level)
+        self.assertEqual(self.client.send('state')['volume'], 40)
+
+
+    def test_malformed_request_is_refused(self):
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as connection:
+            connection.connect(self.server.path)
+            replies = connection.makefile('rb')
+            for request in (b'[1]', b'"x"', b'3', b'{"command": "volume", "args": 5}'):
+                connection.sendall(request + b'\n')
+                self.assertEqual(json.loads(replies.readline()), {'error': 'invalid request'})
+            replies.close()
+
+
+    def test_quit_ends_once(self):
+        events = list()
+        self.player.subscribe(events.append, ['state'])
+        self.player.nonblockingLoop()
+        self.client.send('quit')
+        self.assertTrue(self.player.waitForEnd(5))
+        self.player.thread.join(5)
+        self.player.end()
+        self.assertEqual(len([event for event in events if not event['online']]), 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,21 @@
+#!/usr/bin/env python
+import os
+import sys
+import unittest
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import downloads
+from support import waitFor
+
+
+class DownloadRetryTest(unittest.TestCase):
+    def test_every_failed_attempt_reports_its_error(self):
+        events = list()
+        manager = downloads.DownloadManager(lambda link: ['sh', '-c', 'echo "ERROR: Unable to download"; exit 1'], workers=1, retries=1)
+        job = manager.enqueue('https://example.com/watch', events.append)
+        self.assertTrue(waitFor(lambda: job.state == downloads.FAILED))
+        manager.stop()
+        self.assertEqual([event.kind for event in events], [downloads.ERROR, downloads.ERROR])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,109 @@
+#!/usr/bin/env python
+import os
+import time
+import unittest
+from support import FFPROBE, FakeBinariesTest, waitFor
+import pycli_music
+
+
+class FailingPlayerTest(FakeBinariesTest):
+    FAKES = {'ffplay': '#!/bin/sh\necho spawn >> "$SPAWNLOG"\nexit 1\n', 'ffprobe': FFPROBE}
+
+    def setUp(self):
+        super().setUp()
+        self.spawnlog = os.path.join(self.root, 'spawns')
+        os.environ['SPAWNLOG'] = self.spawnlog
+        self.player = pycli_music.Player(self.music, repeat=True, index=False, backend='subprocess')
+
+
+    def tearDown(self):
+        self.player.end()
+        super().tearDown()
+
+
+    def spawns(self):
+        try:
+            with open(self.spawnlog) as spawnlog:
+                return len(spawnlog.readlines())
+        except FileNotFoundError:
+            return 0
+
+
+    def test_failing_player_stops_after_a_cycle(self):
+        self.player.nonblockingLoop()
+        time.sleep(2)
+        self.assertEqual(self.spawns(), 3)
+        self.assertFalse(self.player.isPlaying())
+        self.assertTrue(self.player.isOnline())
+
+
+class UnprobeableSongTest(FakeBinariesTest):
+    FAKES = {
+        'ffplay': '#!/bin/sh\necho "$@" >> "$SPAWNLOG"\nexec sleep 0.3\n',
+        'ffprobe': '#!/bin/sh\ncase "$*" in *b.mp3*) exit 1;; esac\necho \'{"format": {"duration": "0.300000"}}\'\n',
+    }
+
+    def setUp(self):
+        super().setUp()
+        self.spawnlog = os.path.join(self.root, 'spawns')
+        os.environ['SPAWNLOG'] = self.spawnlog
+        self.player = pycli_music.Player(self.music, index=False, backend='subprocess')
+
+
+    def tearDown(self):
+        self.player.end()
+        super().tearDown()
+
+
+    def test_unprobeable_song_is_skipped(self):
+        self.player.nonblockingLoop()
+        self.assertTrue(waitFor(lambda: not self.player.isPlaying()))
+        self.assertTrue(self.player.isOnline())
+        with open(self.spawnlog) as spawnlog:
+            songs = [os.path.basename(line.split()[-1]) for line in spawnlog]
+        self.assertEqual(songs, ['a.mp3', 'c.mp3'])
+
+
+class PCMBackendTest(FakeBinariesTest):
+    # Two seconds of silence per song, with the Duration line FFmpeg prints before decoding.
+    FAKES = {
+        'ffplay': '#!/bin/sh\nexec sleep 600\n',
+        'ffprobe': FFPROBE,
+        'ffmpeg': '#!/bin/sh\necho "$@" >> "$SPAWNLOG"\necho "  Duration: 00:00:02.00, start: 0.000000" >&2\nexec head -c 352800 /dev/zero\n',
+    }
+    SONGS = ('a.mp3', 'b.mp3')
+
+    def setUp(self):
+        super().setUp()
+        self.spawnlog = os.path.join(self.root, 'spawns')
+        os.environ['SPAWNLOG'] = self.spawnlog
+        self.sink = os.path.join(self.root, 'sink.pcm')
+        self.player = pycli_music.Player(self.music, index=False, sink=self.sink)
+
+
+    def tearDown(self):
+        self.player.end()
+        super().tearDown()
+
+
+    def spawns(self):
+        with open(self.spawnlog) as spawnlog:
+            return [os.path.basename(line.split()[line.split().index('-i') + 1]) for line in spawnlog]
+
+
+    def test_plays_through_on_one_decoder_per_song(self):
+        self.assertTrue(self.player.backend.live)
+        self.player.nonblockingLoop()
+        self.assertTrue(waitFor(lambda: self.player.currentSongStep() > 0.3))
+        self.assertEqual(self.player.currentSongDuration(), 2.0)
+        self.player.pause()
+        self.player.play()
+        self.player.seekTo(1.5)
+        self.assertTrue(waitFor(lambda: self.player.counter == 1))
+        self.assertTrue(waitFor(lambda: not self.player.isPlaying()))
+        self.assertEqual(self.spawns(), ['a.mp3', 'b.mp3'])
+        self.assertGreater(os.path.getsize(self.sink), 352800)
+
+
+if __name__ == '__main__':
+    unittest.main()
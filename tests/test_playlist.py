@@ -0,0 +1,82 @@
+#!/usr/bin/env python
+import os
+import sys
+import unittest
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import playlist
+
+
+class PathTableTest(unittest.TestCase):
+    def setUp(self):
+        self.table = playlist.PathTable()
+        for path in ('/music/a/one.mp3', '/music/a/two.mp3', '/music/b/one.mp3'):
+            self.table.add(path)
+
+
+    def test_find(self):
+        self.assertEqual(self.table.find('/music/a/two.mp3'), 1)
+        self.assertEqual(self.table.find('/music/b/one.mp3'), 2)
+        self.assertIsNone(self.table.find('/music/b/two.mp3'))
+        self.assertIsNone(self.table.find('/music/c/one.mp3'))
+
+
+    def test_find_after_add(self):
+        self.table.find('/music/a/one.mp3')
+        self.assertEqual(self.table.add('/music/c/three.mp3'), 3)
+        self.assertEqual(self.table.find('/music/c/three.mp3'), 3)
+        self.assertEqual(self.table.add('/music/a/one.mp3'), 4)
+        self.assertEqual(self.table.find('/music/a/one.mp3'), 4)
+
+
+class PlaylistTest(unittest.TestCase):
+    def setUp(self):
+        self.songs = playlist.Playlist(['/music/a.mp3', '/music/b.mp3', '/music/c.mp3', '/music/d.mp3'])
+
+
+    def ids(self, *names):
+        return {self.songs.table.find(f'/music/{name}.mp3') for name in names}
+
+
+    def test_discard_before_and_at_counter(self):
+        counter = self.songs.discard(self.ids('a', 'c'), 2)
+        self.assertEqual(list(self.songs), ['/music/b.mp3', '/music/d.mp3'])
+        self.assertEqual(self.songs[counter], '/music/b.mp3')
+
+
+    def test_discard_at_counter(self):
+        counter = self.songs.discard(self.ids('c'), 2)
+        self.assertEqual(self.songs[counter], '/music/b.mp3')
+
+
+    def test_discard_before_counter(self):
+        counter = self.songs.discard(self.ids('a', 'b'), 2)
+        self.assertEqual(self.songs[counter], '/music/c.mp3')
+
+
+    def test_discard_after_counter(self):
+        counter = self.songs.discard(self.ids('d'), 1)
+        self.assertEqual(self.songs[counter], '/music/b.mp3')
+        self.assertEqual(len(self.songs), 3)
+
+
+    def test_discard_first_song(self):
+        self.assertEqual(self.songs.discard(self.ids('a'), 0), 0)
+
+
+    def test_insert_sorted(self):
+        songs = playlist.Playlist(['/music/d.mp3', '/music/a.mp3', '/music/c.mp3'])
+        songs.insertSorted(songs.table.add('/music/b.mp3'), 1)
+        self.assertEqual(list(songs), ['/music/d.mp3', '/music/a.mp3', '/music/b.mp3', '/music/c.mp3'])
+        songs.insertSorted(songs.table.add('/music/e.mp3'))
+        self.assertEqual(songs[-1], '/music/e.mp3')
+
+
+    def test_shuffle_keeps_the_head(self):
+        for attempt in range(20):
+            self.songs.shuffle(2)
+            self.assertEqual(self.songs[:2], ['/music/a.mp3', '/music/b.mp3'])
+            self.assertEqual(sorted(self.songs[2:]), ['/music/c.mp3', '/music/d.mp3'])
+
+
+if __name__ == '__main__':
+    unittest.main()
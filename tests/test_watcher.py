@@ -0,0 +1,43 @@
+#!/usr/bin/env python
+import os
+import time
+import unittest
+from support import FakeBinariesTest, waitFor, writeSong
+import pycli_music
+
+
+class WatchRelativePathTest(FakeBinariesTest):
+    def setUp(self):
+        super().setUp()
+        self.cwd = os.getcwd()
+        os.chdir(self.root)
+        self.player = pycli_music.Player('Music', index=False, watch=True)
+        self.assertTrue(self.player.watcher.ready.wait(5))
+
+
+    def tearDown(self):
+        self.player.end()
+        os.chdir(self.cwd)
+        super().tearDown()
+
+
+    def test_deleted_song_is_dropped(self):
+        path = os.path.join(self.music, 'b.mp3')
+        trackid = self.player.songs.table.find(path)
+        self.assertIsNotNone(trackid)
+        os.unlink(path)
+        self.assertTrue(waitFor(lambda: trackid in self.player.removed))
+        index = list(self.player.songs.order).index(trackid)
+        self.assertFalse(self.player.sanityCheck(index))
+
+
+    def test_rewritten_song_is_not_duplicated(self):
+        writeSong(os.path.join(self.music, 'a.mp3'))
+        writeSong(os.path.join(self.music, 'd.mp3'))
+        self.assertTrue(waitFor(lambda: self.player.getPlaylistLength() == 4))
+        time.sleep(0.2)
+        self.assertEqual(self.player.getPlaylistLength(), 4)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,246 @@
+#!/usr/bin/env python
+import os
+import select
+import struct
+import threading
+import ctypes
+import ctypes.util
+
+IN_CLOSE_WRITE = 0x00000008
+IN_MOVED_FROM = 0x00000040
+IN_MOVED_TO = 0x00000080
+IN_CREATE = 0x00000100
+IN_DELETE = 0x00000200
+IN_DELETE_SELF = 0x00000400
+IN_MOVE_SELF = 0x00000800
+IN_Q_OVERFLOW = 0x00004000
+IN_IGNORED = 0x00008000
+IN_ONLYDIR = 0x01000000
+IN_ISDIR = 0x40000000
+IN_NONBLOCK = 0o4000
+IN_CLOEXEC = 0o2000000
+WATCHMASK = IN_CLOSE_WRITE | IN_MOVED_FROM | IN_MOVED_TO | IN_CREATE | IN_DELETE | IN_DELETE_SELF | IN_MOVE_SELF | IN_ONLYDIR
+EVENTHEADER = struct.Struct('iIII')
+POLLINTERVAL = 5
+
+CREATED = 'created'
+DELETED = 'deleted'
+
+
+def subdirectories(directory):
+    stack = [directory]
+    while stack:
+        directory = stack.pop()
+        yield directory
+        try:
+            with os.scandir(directory) as entries:
+                stack.extend(entry.path for entry in entries if entry.is_dir(follow_symlinks=False))
+        except OSError:
+            pass
+
+
+def files(directory):
+    try:
+        with os.scandir(directory) as entries:
+            return {entry.path for entry in entries if entry.is_file()}
+    except OSError:
+        return set()
+
+
+class Watcher:
+    # Calls callback(event, path, isdir) with CREATED or DELETED from a background thread.
+    def __init__(self, directory, callback):
+        self.directory = os.path.abspath(directory)
+        self.callback = callback
+        self.stopped = threading.Event()
+        # Set once every directory is watched or snapshotted, so later changes are seen.
+        self.ready = threading.Event()
+        self.thread = None
+
+
+    def start(self):
+        self.stopped.clear()
+        self.ready.clear()
+        self.thread = threading.Thread(target=self.run)
+        self.thread.daemon = True
+        self.thread.start()
+
+
+    def stop(self):
+        self.stopped.set()
+        if self.thread and self.thread is not threading.current_thread():
+            self.thread.join()
+        self.thread = None
+
+
+    def isRunning(self):
+        return bool(self.thread and self.thread.is_alive())
+
+
+    def created(self, path, isdir=False):
+        self.callback(CREATED, path, isdir)
+        if isdir:
+            # Files can land in a new directory before it is watched or polled.
+            for directory in subdirectories(path):
+                if directory != path:
+                    self.callback(CREATED, directory, True)
+                for filename in files(directory):
+                    self.callback(CREATED, filename, False)
+
+
+    def deleted(self, path, isdir=False):
+        self.callback(DELETED, path, isdir)
+
+
+class InotifyWatcher(Watcher):
+    libc = None
+
+    def __init__(self, directory, callback):
+        super().__init__(directory, callback)
+        libc = self.library()
+        self.fd = libc.inotify_init1(IN_NONBLOCK | IN_CLOEXEC)
+        if self.fd < 0:
+            raise OSError(ctypes.get_errno(), os.strerror(ctypes.get_errno()))
+        self.wake, self.waker = os.pipe()
+        self.paths = dict()
+
+
+    @classmethod
+    def library(cls):
+        if cls.libc is None:
+            libc = ctypes.CDLL(ctypes.util.find_library('c'), use_errno=True)
+            libc.inotify_add_watch.argtypes = [ctypes.c_int, ctypes.c_char_p, ctypes.c_uint32]
+            libc.inotify_rm_watch.argtypes = [ctypes.c_int, ctypes.c_int]
+            cls.libc = libc
+        return cls.libc
+
+
+    def __watch(self, directory):
+        descriptor = self.libc.inotify_add_watch(self.fd, os.fsencode(directory), WATCHMASK)
+        if descriptor < 0:
+            # Directories past fs.inotify.max_user_watches stay unwatched until the next rescan.
+            return
+        self.paths[descriptor] = directory
+
+
+    def __unwatch(self, directory):
+        prefix = os.path.join(directory, '')
+        for descriptor, path in list(self.paths.items()):
+            if path == directory or path.startswith(prefix):
+                self.libc.inotify_rm_watch(self.fd, descriptor)
+                del self.paths[descriptor]
+
+
+    def stop(self):
+        if self.thread:
+            os.write(self.waker, b'\0')
+        super().stop()
+
+
+    def run(self):
+        try:
+            for subdirectory in subdirectories(self.directory):
+                self.__watch(subdirectory)
+            self.ready.set()
+            while not self.stopped.is_set():
+                ready = select.select([self.fd, self.wake], [], [])[0]
+                if self.wake in ready:
+                    break
+                try:
+                    data = os.read(self.fd, 65536)
+                except BlockingIOError:
+                    continue
+                self.__dispatch(data)
+        finally:
+            os.close(self.fd)
+            os.close(self.wake)
+            os.close(self.waker)
+
+
+    def __dispatch(self, data):
+        offset = 0
+        while offset < len(data):
+            descriptor, mask, cookie, length = EVENTHEADER.unpack_from(data, offset)
+            offset += EVENTHEADER.size
+            name = os.fsdecode(data[offset:offset + length].rstrip(b'\0'))
+            offset += length
+            if mask & IN_Q_OVERFLOW:
+                continue
+            if mask & IN_IGNORED:
+                self.paths.pop(descriptor, None)
+                continue
+            directory = self.paths.get(descriptor)
+            if directory is None or mask & (IN_DELETE_SELF | IN_MOVE_SELF):
+                continue
+            path = os.path.join(directory, name)
+            isdir = bool(mask & IN_ISDIR)
+            if isdir and mask & (IN_CREATE | IN_MOVED_TO):
+                for subdirectory in subdirectories(path):
+                    self.__watch(subdirectory)
+                self.created(path, True)
+            elif not isdir and mask & (IN_CLOSE_WRITE | IN_MOVED_TO):
+                self.created(path)
+            elif mask & (IN_DELETE | IN_MOVED_FROM):
+                if isdir and mask & IN_MOVED_FROM:
+                    self.__unwatch(path)
+                self.deleted(path, isdir)
+
+
+class PollingWatcher(Watcher):
+    def __init__(self, directory, callback, interval=POLLINTERVAL):
+        super().__init__(directory, callback)
+        self.interval = interval
+        self.snapshot = dict()
+
+
+    def __mtime(self, directory):
+        try:
+            return os.stat(directory).st_mtime_ns
+        except OSError:
+            return None
+
+
+    def run(self):
+        for directory in subdirectories(self.directory):
+            self.snapshot[directory] = (self.__mtime(directory), files(directory))
+        self.ready.set()
+        while not self.stopped.wait(self.interval):
+            self.poll()
+
+
+    def poll(self):
+        # Only directories whose mtime changed are listed again.
+        for directory, (mtime, known) in list(self.snapshot.items()):
+            if directory not in self.snapshot:
+                continue
+            current = self.__mtime(directory)
+            if current == mtime:
+                continue
+            if current is None:
+                for path in [path for path in self.snapshot if path == directory or path.startswith(os.path.join(directory, ''))]:
+                    del self.snapshot[path]
+                self.deleted(directory, True)
+                continue
+            found = files(directory)
+            try:
+                with os.scandir(directory) as entries:
+                    subdirs = {entry.path for entry in entries if entry.is_dir(follow_symlinks=False)}
+            except OSError:
+                subdirs = set()
+            self.snapshot[directory] = (current, found)
+            for path in known - found:
+                self.deleted(path)
+            for path in found - known:
+                self.created(path)
+            for path in subdirs:
+                if path not in self.snapshot:
+                    for subdirectory in subdirectories(path):
+                        self.snapshot[subdirectory] = (self.__mtime(subdirectory), files(subdirectory))
+                    self.created(path, True)
+
+
+def watch(directory, callback):
+    try:
+        return InotifyWatcher(directory, callback)
+    except (OSError, AttributeError, TypeError):
+        return PollingWatcher(directory, callback)